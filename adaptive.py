@@ -0,0 +1,155 @@
+"""
+Computerized adaptive testing over the difficulty-labelled bank.
+
+Each item follows a two-parameter logistic (2PL) model: the chance that a
+student of ability theta answers correctly is 1 / (1 + exp(-a * (theta - b))).
+Until items are calibrated, b comes from the difficulty label (easy -1,
+medium 0, hard +1) and a is 1.
+
+Ability is tracked as a posterior over a fixed grid of theta values. Everything
+the test needs per item is precomputed once per bank:
+
+- items with (nearly) the same parameters share a class, so a 100k bank has
+  only a handful of classes
+- each class has a table of log P(correct) and log P(wrong) at every grid
+  point, so a response updates the posterior with one vector add
+- each grid point has its classes ranked by Fisher information there
+
+Choosing the next item is then a lookup: take the ranking at the grid point
+nearest the current estimate, and draw an unused item from the best class
+that has one. The test stops once the estimate's standard error reaches the
+target, which usually takes far fewer questions than a fixed-length quiz.
+"""
+
+import math
+import random
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from question_index import QuestionIndex
+from quiz_question import QuizQuestion
+from quiz_session import AnswerRecord, QuizSession
+
+GRID = tuple(-4.0 + 0.1 * i for i in range(81))
+DIFFICULTY_B = {"easy": -1.0, "medium": 0.0, "hard": 1.0}
+DEFAULT_A = 1.0
+# Calibrated parameters are rounded to this resolution to form item classes
+PARAMETER_STEP = 0.1
+
+ItemParams = Tuple[float, float]  # (discrimination a, difficulty b)
+
+
+def _class_key(a: float, b: float) -> ItemParams:
+    return (round(a / PARAMETER_STEP) * PARAMETER_STEP, round(b / PARAMETER_STEP) * PARAMETER_STEP)
+
+
+class ItemPool:
+    def __init__(self, index: QuestionIndex, params: Dict[int, ItemParams] = None, topic: str = None):
+        """Precompute response and information tables for the items of a bank.
+
+        params maps question ids to calibrated (a, b); other items use their label.
+        """
+        labels = {question_id: difficulty
+                  for difficulty, ids in index.by_difficulty.items() for question_id in ids}
+        members: Dict[ItemParams, List[int]] = {}
+        for question_id in index.select(None, topic):
+            if params and question_id in params:
+                key = _class_key(*params[question_id])
+            else:
+                key = (DEFAULT_A, DIFFICULTY_B.get(labels[question_id], 0.0))
+            members.setdefault(key, []).append(question_id)
+
+        self.classes: List[ItemParams] = list(members)
+        self.members: List[List[int]] = [members[key] for key in self.classes]
+        self.class_of: Dict[int, int] = {question_id: c for c, ids in enumerate(self.members)
+                                         for question_id in ids}
+        self.log_correct: List[List[float]] = []
+        self.log_wrong: List[List[float]] = []
+        information: List[List[float]] = []
+        for a, b in self.classes:
+            p = [1.0 / (1.0 + math.exp(-a * (theta - b))) for theta in GRID]
+            self.log_correct.append([math.log(max(pi, 1e-12)) for pi in p])
+            self.log_wrong.append([math.log(max(1.0 - pi, 1e-12)) for pi in p])
+            information.append([a * a * pi * (1.0 - pi) for pi in p])
+        # For each grid point, class indices from most to least informative
+        self.best_classes: List[Tuple[int, ...]] = [
+            tuple(sorted(range(len(self.classes)), key=lambda c: -information[c][g]))
+            for g in range(len(GRID))]
+
+    def __len__(self) -> int:
+        return len(self.class_of)
+
+
+class AdaptiveTest:
+    def __init__(self, pool: ItemPool, lookup: Callable[[int], QuizQuestion], max_items: int = 20,
+                 min_items: int = 5, target_se: float = 0.4, rng=None):
+        """One student's adaptive test; lookup maps a question id to its question"""
+        self.pool = pool
+        self.lookup = lookup
+        self.max_items = min(max_items, len(pool))
+        self.min_items = min_items
+        self.target_se = target_se
+        self.rng = rng or random
+        self.administered: Set[int] = set()
+        # Standard normal prior, as a log density over the grid
+        self.log_posterior = [-0.5 * theta * theta for theta in GRID]
+        self.theta = 0.0
+        self.se = 1.0
+
+    def _update_estimate(self):
+        """Expected a posteriori ability and its standard error"""
+        peak = max(self.log_posterior)
+        weights = [math.exp(value - peak) for value in self.log_posterior]
+        total = sum(weights)
+        self.theta = sum(w * theta for w, theta in zip(weights, GRID)) / total
+        self.se = math.sqrt(sum(w * (theta - self.theta) ** 2 for w, theta in zip(weights, GRID)) / total)
+
+    @property
+    def finished(self) -> bool:
+        asked = len(self.administered)
+        return (asked >= self.max_items
+                or (asked >= self.min_items and self.se <= self.target_se))
+
+    def next_item(self) -> Optional[int]:
+        """The unused item most informative at the current estimate, or None when done"""
+        if self.finished:
+            return None
+        g = min(len(GRID) - 1, max(0, round((self.theta - GRID[0]) / 0.1)))
+        for c in self.pool.best_classes[g]:
+            members = self.pool.members[c]
+            # Draw at random within the class so students don't all see the same items
+            for _ in range(8):
+                question_id = members[int(self.rng.random() * len(members))]
+                if question_id not in self.administered:
+                    return question_id
+            unused = [question_id for question_id in members if question_id not in self.administered]
+            if unused:
+                return self.rng.choice(unused)
+        return None
+
+    def record(self, question_id: int, correct: bool):
+        """Fold one graded response into the ability estimate"""
+        self.administered.add(question_id)
+        c = self.pool.class_of[question_id]
+        table = self.pool.log_correct[c] if correct else self.pool.log_wrong[c]
+        self.log_posterior = [value + delta for value, delta in zip(self.log_posterior, table)]
+        self._update_estimate()
+
+    def start_session(self, student: str = None) -> QuizSession:
+        """A session holding the first item; record_answer appends the rest as it goes"""
+        question_id = self.next_item()
+        ids = [] if question_id is None else [question_id]
+        session = QuizSession([self.lookup(i) for i in ids], ids, student=student)
+        session.listeners.insert(0, self.record_answer)
+        return session
+
+    def record_answer(self, session: QuizSession, record: AnswerRecord):
+        """QuizSession listener: update the estimate and queue the next item, if any"""
+        self.record(record.question_id, record.correct)
+        question_id = self.next_item()
+        if question_id is not None:
+            session.questions.append(self.lookup(question_id))
+            session.question_ids.append(question_id)
+            session.result.total_questions += 1
+
+    def summary(self) -> Dict[str, float]:
+        return {"theta": self.theta, "se": self.se, "items": len(self.administered)}
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Compiled question-bank cache.
+
+This module stores a question bank as plain records in a single marshal
+blob, keyed on the size and modification time of the bank's source file
+(as .pyc files are), so a warm start is one stat and one file read. Editing
+the source changes the key and the stale cache is rebuilt (and the old file
+removed) on the next start.
+
+The built-in bank's literals already come from the interpreter's .pyc, and
+building them is faster than reading the cache, so ComprehensiveQuiz only
+uses the cache when asked to (use_cache=True). It pays off for banks that
+are expensive to build.
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+from typing import Callable, List, Optional, Tuple
+
+# Bump when the record layout changes so old cache files are ignored
+CACHE_FORMAT_VERSION = 2
+CACHE_MAGIC = b"QZBC"
+DEFAULT_CACHE_DIR = ".quiz_cache"
+
+# (question, options, correct_answers, explanation, difficulty, topic)
+Record = Tuple[str, List[str], List[int], str, str, str]
+
+
+def cache_dir_for(source_path: str, cache_dir: Optional[str] = None) -> str:
+    """Return the cache directory, honouring QUIZ_CACHE_DIR if set"""
+    if cache_dir:
+        return cache_dir
+    env_dir = os.environ.get("QUIZ_CACHE_DIR")
+    if env_dir:
+        return env_dir
+    return os.path.join(os.path.dirname(os.path.abspath(source_path)), DEFAULT_CACHE_DIR)
+
+
+def bank_fingerprint(source_path: str) -> str:
+    """Key the bank source by size and modification time, like .pyc files, plus the blob format"""
+    stat = os.stat(source_path)
+    digest = hashlib.sha256(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+    # marshal output is only guaranteed stable within one interpreter version
+    digest.update(f"v{CACHE_FORMAT_VERSION}:{sys.version_info[:2]}".encode())
+    return digest.hexdigest()[:16]
+
+
+def cache_path_for(source_path: str, cache_dir: Optional[str] = None) -> str:
+    """Return the cache file path for the current contents of source_path"""
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    name = f"{stem}-{bank_fingerprint(source_path)}.bin"
+    return os.path.join(cache_dir_for(source_path, cache_dir), name)
+
+
+def read_cache(path: str) -> Optional[List[Record]]:
+    """Read a cache file, returning None if it is missing or unreadable"""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if not data.startswith(CACHE_MAGIC):
+        return None
+    try:
+        return marshal.loads(data[len(CACHE_MAGIC):])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+
+def write_cache(path: str, records: List[Record]) -> bool:
+    """Atomically write records to path and drop stale caches of the same bank"""
+    directory = os.path.dirname(path)
+    stem = os.path.basename(path).rsplit("-", 1)[0]
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(CACHE_MAGIC)
+            f.write(marshal.dumps(records))
+        os.replace(tmp_path, path)
+    except OSError:
+        # A read-only checkout should still run, just without the cache
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+
+    for name in os.listdir(directory):
+        stale = os.path.join(directory, name)
+        if name.startswith(stem + "-") and name.endswith(".bin") and stale != path:
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+    return True
+
+
+def load_records(source_path: str, build: Callable[[], List[Record]],
+                 cache_dir: Optional[str] = None) -> List[Record]:
+    """Return the bank records from cache, building and caching them on a miss"""
+    path = cache_path_for(source_path, cache_dir)
+    records = read_cache(path)
+    if records is None:
+        records = build()
+        write_cache(path, records)
+    return records
+
+
+def clear_cache(source_path: str, cache_dir: Optional[str] = None) -> int:
+    """Remove every cache file for source_path, returning how many were removed"""
+    directory = cache_dir_for(source_path, cache_dir)
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    removed = 0
+    if not os.path.isdir(directory):
+        return removed
+    for name in os.listdir(directory):
+        if name.startswith(stem + "-") and name.endswith(".bin"):
+            os.remove(os.path.join(directory, name))
+            removed += 1
+    return removed
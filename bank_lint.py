@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Structural checks for question banks.
+
+Every question is checked against the invariants the quiz relies on, for
+example that its correct answers index real options, that True/False
+questions have exactly one answer, and that "select all that apply"
+prompts have more than one. Errors are mistakes the quiz would grade
+wrongly. Warnings are questions worth a second look.
+
+Large banks are checked in a process pool. Questions are streamed from the
+bank, sent to workers in chunks with only a few chunks in flight, and
+checked as raw JSON lines, so parsing is parallel too.
+
+With --cache, results are remembered by a hash of each question's content,
+so a re-run only checks questions that were added or edited since. The
+cache is invalidated whenever the checks themselves change (LINT_VERSION).
+
+Lint the built-in bank:  python3 bank_lint.py
+Lint a large bank incrementally:  python3 bank_lint.py --bank questions.jsonl --cache .lint-cache.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from quiz_question import DEFAULT_TOPIC, DIFFICULTIES, TOPICS, QuizQuestion
+
+LINT_VERSION = 1  # Bump when checks change, to invalidate caches
+CHUNK_SIZE = 2_000
+# Banks with fewer questions left to check are linted in-process
+PARALLEL_MIN = 10_000
+MAX_OPTIONS = 64  # Answer keys are 64-bit masks
+
+ERROR = "error"
+WARNING = "warning"
+
+MULTI_SELECT_PROMPT = re.compile(r"select all|all that apply|choose (?:two|three|all)", re.IGNORECASE)
+ALL_OF_THE_ABOVE = re.compile(r"^(?:all|none) of the above\.?$", re.IGNORECASE)
+
+
+class LintIssue(NamedTuple):
+    question_id: int
+    severity: str  # ERROR or WARNING
+    code: str
+    message: str
+
+    def __str__(self) -> str:
+        icon = "❌" if self.severity == ERROR else "⚠️ "
+        return f"{icon} Q{self.question_id}: {self.message} [{self.code}]"
+
+
+Finding = Tuple[str, str, str]  # (severity, code, message), cached per content hash
+
+
+def check_record(record: Dict) -> List[Finding]:
+    """Every invariant a question record (as from QuizQuestion.to_record) breaks"""
+    findings: List[Finding] = []
+
+    def error(code: str, message: str):
+        findings.append((ERROR, code, message))
+
+    def warn(code: str, message: str):
+        findings.append((WARNING, code, message))
+
+    prompt = record.get("question")
+    options = record.get("options")
+    answers = record.get("correct_answers")
+    if not isinstance(prompt, str) or not prompt.strip():
+        error("empty-question", "question text is empty")
+        prompt = ""
+    if not isinstance(options, list) or not all(isinstance(option, str) for option in options):
+        error("bad-options", "options must be a list of strings")
+        return findings
+    if not isinstance(answers, list) or not all(isinstance(answer, int) for answer in answers):
+        error("bad-answers", "correct_answers must be a list of option indices")
+        return findings
+
+    if len(options) < 2:
+        error("too-few-options", f"needs at least 2 options, has {len(options)}")
+    if len(options) > MAX_OPTIONS:
+        error("too-many-options", f"at most {MAX_OPTIONS} options are supported, has {len(options)}")
+    if any(not option.strip() for option in options):
+        error("empty-option", "an option is empty")
+    normalized = [" ".join(option.lower().split()) for option in options]
+    duplicated = sorted({i + 1 for i, option in enumerate(normalized) if normalized.count(option) > 1})
+    if duplicated:
+        error("duplicate-options", f"options {', '.join(map(str, duplicated))} are identical")
+
+    if not answers:
+        error("no-answer", "has no correct answer")
+    out_of_range = [answer for answer in answers if not 0 <= answer < len(options)]
+    if out_of_range:
+        error("answer-out-of-range", f"correct answer(s) {', '.join(str(a + 1) for a in out_of_range)} "
+                                     f"out of range for {len(options)} options")
+    if len(set(answers)) != len(answers):
+        warn("repeated-answer", "correct_answers lists an option more than once")
+    keys = len(set(answers))
+
+    if sorted(normalized) == ["false", "true"] and keys != 1:
+        error("true-false-answers", f"True/False question has {keys} correct answers")
+    multi_prompt = bool(MULTI_SELECT_PROMPT.search(prompt))
+    if multi_prompt and keys < 2:
+        error("multi-select-single-key", "prompt says to select all that apply but has one correct answer")
+    elif keys > 1 and not multi_prompt:
+        warn("multi-key-single-prompt", f"has {keys} correct answers but the prompt doesn't say so")
+    if keys == len(options) and len(options) > 1:
+        warn("all-correct", "every option is correct")
+
+    for i, option in enumerate(options[:-1]):
+        if ALL_OF_THE_ABOVE.match(option.strip()):
+            warn("above-not-last", f"option {i + 1} ({option.strip()!r}) is not the last option")
+
+    difficulty = record.get("difficulty", "medium")
+    if difficulty not in DIFFICULTIES:
+        error("unknown-difficulty", f"difficulty {difficulty!r} is not one of {', '.join(DIFFICULTIES)}")
+    topic = record.get("topic", DEFAULT_TOPIC)
+    if topic not in TOPICS and topic != DEFAULT_TOPIC:
+        warn("unknown-topic", f"topic {topic!r} is not a known topic")
+    if not str(record.get("explanation", "")).strip():
+        warn("no-explanation", "has no explanation")
+    return findings
+
+
+def check_line(line: str) -> List[Finding]:
+    """Check one raw bank line"""
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        return [(ERROR, "invalid-json", f"not valid JSON ({e})")]
+    if not isinstance(record, dict):
+        return [(ERROR, "invalid-json", "not a JSON object")]
+    return check_record(record)
+
+
+def _check_chunk(chunk: List[Tuple[int, str, str]]) -> List[Tuple[int, str, List[Finding]]]:
+    """Worker: check (question_id, content_hash, line) items"""
+    return [(question_id, digest, check_line(line)) for question_id, digest, line in chunk]
+
+
+def content_hash(line: str) -> str:
+    return hashlib.blake2b(line.strip().encode(), digest_size=16).hexdigest()
+
+
+def iter_bank_lines(bank_path: Optional[str]) -> Iterator[Tuple[int, str]]:
+    """(question_id, JSON line) for every question in a bank, streaming JSONL files"""
+    if bank_path and not bank_path.endswith(".qstore"):
+        import question_bank
+        yield from question_bank.iter_lines(bank_path)
+        return
+    from comprehensive_quiz import ComprehensiveQuiz
+    questions = ComprehensiveQuiz(bank_path=bank_path).questions
+    for question_id in range(len(questions)):
+        yield question_id, json.dumps(QuizQuestion.to_record(questions[question_id]), ensure_ascii=False)
+
+
+def load_cache(path: Optional[str]) -> Dict[str, List[Finding]]:
+    if not path:
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get("version") != LINT_VERSION:
+        return {}
+    return {digest: [tuple(finding) for finding in findings]
+            for digest, findings in cache["results"].items()}
+
+
+def save_cache(path: str, results: Dict[str, List[Finding]]):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": LINT_VERSION, "results": results}, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+class LintReport(NamedTuple):
+    issues: List[LintIssue]
+    questions: int
+    checked: int  # Questions actually checked; the rest came from the cache
+
+    @property
+    def errors(self) -> int:
+        return sum(issue.severity == ERROR for issue in self.issues)
+
+    @property
+    def warnings(self) -> int:
+        return sum(issue.severity == WARNING for issue in self.issues)
+
+
+def lint_bank(bank_path: str = None, cache_path: str = None, workers: int = None,
+              chunk_size: int = CHUNK_SIZE) -> LintReport:
+    """Check every question in a bank, re-checking only changed questions when cached"""
+    workers = workers or os.cpu_count() or 1
+    cache = load_cache(cache_path)
+    results: Dict[str, List[Finding]] = {}  # This bank's findings by content hash
+    issues: List[LintIssue] = []
+    questions = checked = 0
+    pending: List[Tuple[int, str, str]] = []
+    pool: Optional[ProcessPoolExecutor] = None
+    in_flight: Deque[Future] = deque()
+
+    def collect(checked_chunk: List[Tuple[int, str, List[Finding]]]):
+        nonlocal checked
+        for question_id, digest, findings in checked_chunk:
+            results[digest] = findings
+            issues.extend(LintIssue(question_id, *finding) for finding in findings)
+            checked += 1
+
+    def submit():
+        """Check the pending questions, in the pool once enough of them justify starting it"""
+        nonlocal pool
+        if pool is None and workers != 1 and len(pending) >= PARALLEL_MIN:
+            pool = ProcessPoolExecutor(workers)
+        if pool is None:
+            collect(_check_chunk(pending))
+        else:
+            for start in range(0, len(pending), chunk_size):
+                in_flight.append(pool.submit(_check_chunk, pending[start:start + chunk_size]))
+                # Bound the work queued ahead of the workers
+                if len(in_flight) >= 2 * workers:
+                    collect(in_flight.popleft().result())
+        pending.clear()
+
+    try:
+        for question_id, line in iter_bank_lines(bank_path):
+            questions += 1
+            digest = content_hash(line)
+            findings = cache.get(digest)
+            if findings is None:
+                findings = results.get(digest)  # An exact duplicate checked earlier in this run
+            if findings is not None:
+                results[digest] = findings
+                issues.extend(LintIssue(question_id, *finding) for finding in findings)
+                continue
+            pending.append((question_id, digest, line))
+            # Until the pool is worth starting, questions are held back rather than checked
+            if len(pending) >= (chunk_size if pool is not None or workers == 1 else PARALLEL_MIN):
+                submit()
+        if pending:
+            submit()
+        while in_flight:
+            collect(in_flight.popleft().result())
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if cache_path:
+        save_cache(cache_path, results)  # Questions no longer in the bank drop out
+    issues.sort(key=lambda issue: (issue.question_id, issue.severity != ERROR))
+    return LintReport(issues, questions, checked)
+
+
+def main():
+    """Command-line entry point for linting a bank"""
+    parser = argparse.ArgumentParser(description="Check a question bank for structural mistakes")
+    parser.add_argument("--bank", metavar="PATH",
+                        help="lint a .jsonl or .qstore bank instead of the built-in set")
+    parser.add_argument("--cache", metavar="PATH",
+                        help="remember results by question content and only re-check changed questions")
+    parser.add_argument("--workers", type=int,
+                        help="worker processes for large banks (default: one per CPU; 1 disables)")
+    parser.add_argument("--errors-only", action="store_true", help="don't list warnings")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    report = lint_bank(args.bank, args.cache, args.workers)
+    for issue in report.issues:
+        if issue.severity == ERROR or not args.errors_only:
+            print(issue)
+    cached = report.questions - report.checked
+    print(f"\n{'❌' if report.errors else '✅'} {report.questions} questions "
+          f"({report.checked} checked, {cached} cached) in {time.perf_counter() - start:.1f}s: "
+          f"{report.errors} errors, {report.warnings} warnings")
+    if report.errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
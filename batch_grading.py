@@ -0,0 +1,69 @@
+"""
+Vectorized grading of a whole cohort.
+
+grade_batch() grades a students x questions matrix of response masks against
+a form's answer-key vector in one pass. It uses NumPy when it is installed
+and falls back to pure Python otherwise. It is kept apart from grading so
+that starting a quiz never pays for importing NumPy.
+"""
+
+import operator
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Sequence
+
+from quiz_question import QuizQuestion
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch grading falls back to pure Python
+    np = None
+
+
+@dataclass
+class BatchResult:
+    """Grades for a cohort; arrays are NumPy arrays when NumPy is available, else lists"""
+    correct: Any  # students x questions, True where the response matched the key
+    student_totals: Any  # number of correct answers per student
+    question_totals: Any  # number of students who answered each question correctly
+    scores: Any  # fraction correct per student
+
+    @property
+    def question_p_values(self) -> Any:
+        """Fraction of students answering each question correctly"""
+        students = len(self.student_totals)
+        if np is not None and isinstance(self.question_totals, np.ndarray):
+            return self.question_totals / max(students, 1)
+        return [total / max(students, 1) for total in self.question_totals]
+
+
+def answer_keys(questions: Iterable[QuizQuestion]) -> List[int]:
+    """Return the answer-key vector (one bitmask per question) for a form"""
+    return [question.answer_mask for question in questions]
+
+
+def grade_batch(responses: Sequence[Sequence[int]], keys: Sequence[int],
+                use_numpy: bool = None) -> BatchResult:
+    """Grade a students x questions matrix of response masks against an answer-key vector"""
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy:
+        return _grade_batch_numpy(responses, keys)
+    return _grade_batch_python(responses, keys)
+
+
+def _grade_batch_numpy(responses: Sequence[Sequence[int]], keys: Sequence[int]) -> BatchResult:
+    matrix = np.asarray(responses, dtype=np.uint64).reshape(-1, len(keys))
+    correct = matrix == np.asarray(keys, dtype=np.uint64)
+    student_totals = correct.sum(axis=1)
+    question_totals = correct.sum(axis=0)
+    scores = student_totals / max(len(keys), 1)
+    return BatchResult(correct, student_totals, question_totals, scores)
+
+
+def _grade_batch_python(responses: Sequence[Sequence[int]], keys: Sequence[int]) -> BatchResult:
+    keys = list(keys)
+    correct = [list(map(operator.eq, row, keys)) for row in responses]
+    student_totals = [sum(row) for row in correct]
+    question_totals = [sum(column) for column in zip(*correct)] if correct else [0] * len(keys)
+    scores = [total / max(len(keys), 1) for total in student_totals]
+    return BatchResult(correct, student_totals, question_totals, scores)
@@ -0,0 +1,858 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the quiz application
+
+Run every benchmark:      python3 benchmarks.py
+Run selected benchmarks:  python3 benchmarks.py startup
+List benchmarks:          python3 benchmarks.py --list
+"""
+
+import asyncio
+import io
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+BENCHMARKS: Dict[str, Callable[[], None]] = {}
+
+
+def benchmark(name: str):
+    """Register a benchmark function under name"""
+    def register(func: Callable[[], None]) -> Callable[[], None]:
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+
+def _median_time(func: Callable[[], Any], repeat: int = 20, setup: Callable[[], Any] = None) -> float:
+    """Return the median wall time of func over repeat runs, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def _report(label: str, seconds: float, baseline: float = None):
+    """Print one benchmark line, with a speed-up against baseline if given"""
+    line = f"  {label:<40} {seconds * 1000:10.3f} ms"
+    if baseline:
+        line += f"   ({baseline / seconds:5.1f}x)"
+    print(line)
+
+
+@benchmark("startup")
+def bench_startup():
+    """Literals (the default) vs. cold and warm compiled-cache ComprehensiveQuiz startup"""
+    from comprehensive_quiz import ComprehensiveQuiz
+
+    cache_dir = tempfile.mkdtemp(prefix="quiz-bench-")
+    os.environ["QUIZ_CACHE_DIR"] = cache_dir
+    try:
+        def clear():
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+        literals = _median_time(ComprehensiveQuiz)
+        cold = _median_time(lambda: ComprehensiveQuiz(use_cache=True), setup=clear)
+        warm = _median_time(lambda: ComprehensiveQuiz(use_cache=True))
+        print(f"startup ({len(ComprehensiveQuiz().questions)} questions)")
+        _report("literals, no cache (default)", literals)
+        _report("cold cache (build + write)", cold, literals)
+        _report("warm cache (one read)", warm, literals)
+
+        # End-to-end process start, which is what each test-taker pays
+        here = os.path.dirname(os.path.abspath(__file__))
+
+        def run(use_cache: bool):
+            command = [sys.executable, "-c", "from comprehensive_quiz import ComprehensiveQuiz; "
+                                             f"ComprehensiveQuiz(use_cache={use_cache})"]
+            return lambda: subprocess.run(command, cwd=here, check=True)
+
+        process_default = _median_time(run(False), repeat=10)
+        process_warm = _median_time(run(True), repeat=10)
+        _report("process start, no cache (default)", process_default)
+        _report("process start, warm cache", process_warm, process_default)
+    finally:
+        del os.environ["QUIZ_CACHE_DIR"]
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def _synthetic_bank(path: str, size: int) -> str:
+    """Write a bank of size questions by cycling the built-in bank"""
+    import itertools
+    import question_bank
+    from comprehensive_quiz import ComprehensiveQuiz
+
+    questions = ComprehensiveQuiz().questions
+    question_bank.write_bank(itertools.islice(itertools.cycle(questions), size), path)
+    return path
+
+
+def _peak_memory(func: Callable[[], Any]) -> int:
+    """Return the peak traced allocation while running func, in bytes"""
+    import tracemalloc
+
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@benchmark("lazy-bank")
+def bench_lazy_bank():
+    """Full load vs. streamed sampling of a 100k-question JSONL bank"""
+    import question_bank
+
+    size = 100_000
+    with tempfile.TemporaryDirectory(prefix="quiz-bench-") as tmp:
+        path = _synthetic_bank(os.path.join(tmp, "bank.jsonl"), size)
+        full_load = lambda: random.sample(list(question_bank.iter_questions(path)), 50)
+        streamed = lambda: question_bank.sample_questions(path, 50)
+
+        print(f"lazy-bank ({size} questions, 50 selected)")
+        full_time = _median_time(full_load, repeat=3)
+        _report("load everything, then sample", full_time)
+        _report("stream + reservoir sample", _median_time(streamed, repeat=3), full_time)
+        print(f"  {'peak memory, load everything':<40} {_peak_memory(full_load) / 2**20:10.1f} MiB")
+        print(f"  {'peak memory, streamed':<40} {_peak_memory(streamed) / 2**20:10.1f} MiB")
+
+
+@benchmark("store")
+def bench_store():
+    """Sampling 50 questions from a 100k-question JSONL bank vs. a .qstore"""
+    import question_bank
+    import question_store
+    from question_index import QuestionIndex
+
+    size = 100_000
+    with tempfile.TemporaryDirectory(prefix="quiz-bench-") as tmp:
+        jsonl_path = _synthetic_bank(os.path.join(tmp, "bank.jsonl"), size)
+        store_path = os.path.join(tmp, "bank.qstore")
+        question_store.build_store(question_bank.iter_questions(jsonl_path), store_path)
+
+        with question_store.QuestionStore(store_path) as store:
+            print(f"store ({size} questions, 50 selected)")
+            streamed = _median_time(lambda: question_bank.sample_questions(jsonl_path, 50), repeat=3)
+            _report("JSONL stream + reservoir sample", streamed)
+            _report("open + close store", _median_time(
+                lambda: question_store.QuestionStore(store_path).close(), repeat=50), streamed)
+            _report("sample from open store", _median_time(
+                lambda: [store[i] for i in random.sample(range(len(store)), 50)], repeat=50), streamed)
+            _report("build index over open store", _median_time(
+                lambda: QuestionIndex.build(store), repeat=3), streamed)
+
+
+class _DictQuizQuestion:
+    """The original __dict__-based QuizQuestion, kept as a memory baseline"""
+
+    def __init__(self, question, options, correct_answers, explanation="", difficulty="medium"):
+        self.question = question
+        self.options = options
+        self.correct_answers = correct_answers
+        self.explanation = explanation
+        self.difficulty = difficulty
+
+
+@benchmark("memory")
+def bench_memory():
+    """Memory held by 100k questions: dict-based vs. slotted vs. columns"""
+    from comprehensive_quiz import ComprehensiveQuiz
+    from quiz_question import QuestionColumns, QuizQuestion
+
+    size = 100_000
+    # Prompt and explanation text is shared; containers and difficulty strings
+    # are fresh per question, as they would be after parsing a bank file
+    bank = ComprehensiveQuiz().questions
+    raw = [(q.question, list(q.options), q.correct_answers, q.explanation, q.difficulty)
+           for q in (bank[i % len(bank)] for i in range(size))]
+
+    def fresh(args):
+        question, options, correct_answers, explanation, difficulty = args
+        return (question, list(options), list(correct_answers), explanation,
+                difficulty.encode().decode())
+
+    def held(build: Callable[[], Any]) -> int:
+        import tracemalloc
+        tracemalloc.start()
+        try:
+            kept = build()
+            return tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+            del kept
+
+    print(f"memory ({size} questions, excluding shared prompt/explanation text)")
+    dict_based = held(lambda: [_DictQuizQuestion(*fresh(args)) for args in raw])
+    slotted = held(lambda: [QuizQuestion(*fresh(args)) for args in raw])
+    columns = held(lambda: QuestionColumns(QuizQuestion(*fresh(args)) for args in raw))
+    for label, size_bytes in (("dict-based QuizQuestion", dict_based),
+                              ("slotted QuizQuestion + bitmask", slotted),
+                              ("QuestionColumns", columns)):
+        print(f"  {label:<40} {size_bytes / 2**20:10.1f} MiB   ({dict_based / size_bytes:4.1f}x)")
+
+
+@benchmark("index")
+def bench_index():
+    """Filtered selection: list-comprehension scan vs. prebuilt indexes"""
+    from comprehensive_quiz import ComprehensiveQuiz
+    from question_index import QuestionIndex
+    from quiz_question import QuestionColumns
+
+    size = 100_000
+    bank = ComprehensiveQuiz().questions
+    questions = QuestionColumns(bank[i % len(bank)] for i in range(size))
+    objects = [questions[i] for i in range(size)]
+
+    def scan():
+        ids = [i for i, q in enumerate(objects) if q.difficulty == "hard" and q.topic == "git"]
+        return random.sample(ids, 20)
+
+    print(f"index ({size} questions, 20 hard git questions selected)")
+    scanned = _median_time(scan, repeat=5)
+    _report("scan the bank per quiz", scanned)
+    _report("build index once", _median_time(lambda: QuestionIndex.build(questions), repeat=3))
+    index = QuestionIndex.build(questions)
+    _report("select from index", _median_time(
+        lambda: random.sample(index.select("hard", "git"), 20), repeat=100), scanned)
+    _report("select two topics from index", _median_time(
+        lambda: random.sample(index.select("hard", ["git", "agile"]), 20), repeat=100), scanned)
+
+
+@benchmark("blueprint")
+def bench_blueprint():
+    """Balanced exam assembly: retry-until-balanced vs. stratified per-cell sampling"""
+    import blueprint
+    from comprehensive_quiz import ComprehensiveQuiz
+    from question_index import QuestionIndex
+    from quiz_question import QuestionColumns
+
+    size = 100_000
+    bank = ComprehensiveQuiz().questions
+    questions = QuestionColumns(bank[i % len(bank)] for i in range(size))
+    index = QuestionIndex.build(questions)
+    plan = blueprint.balanced_blueprint(index, 50)
+    quota = {(stratum.difficulty, stratum.topic): stratum.count for stratum in plan}
+
+    def retry_until_balanced():
+        while True:
+            ids = random.sample(range(size), 50)
+            counts: Dict[Tuple[str, str], int] = {}
+            for question_id in ids:
+                cell = questions.metadata_at(question_id)
+                counts[cell] = counts.get(cell, 0) + 1
+            # Accept a draw within one question of the blueprint in every cell
+            if all(abs(counts.get(cell, 0) - count) <= 1 for cell, count in quota.items()):
+                return ids
+
+    print(f"blueprint ({size} questions, 50 spread over {len(plan)} cells)")
+    retried = _median_time(retry_until_balanced, repeat=3)
+    _report("retry until balanced (within 1/cell)", retried)
+    _report("stratified blueprint sample", _median_time(
+        lambda: blueprint.sample_blueprint(index, plan, random), repeat=100), retried)
+
+
+@benchmark("weighted")
+def bench_weighted():
+    """Weighted practice selection: cumulative-weight scans vs. power-of-two buckets"""
+    import itertools
+    from weighted_sampling import WeightedSampler
+
+    size = 100_000
+    rng = random.Random(0)
+    weights = [rng.choice((1.0, 1.0, 1.0, 3.0, 9.0)) for _ in range(size)]
+
+    def quiz_with_updates(pick: Callable[[], List[int]], update: Callable[[int, float], None]):
+        # One 50-question practice quiz, reweighting after every answer
+        for position in pick():
+            update(position, rng.choice((1.0, 3.0, 27.0)))
+
+    def scan_pick() -> List[int]:
+        cumulative = list(itertools.accumulate(weights))
+        return rng.choices(range(size), cum_weights=cumulative, k=50)
+
+    def scan_update(position: int, weight: float):
+        weights[position] = weight
+
+    print(f"weighted ({size} questions, 50-question quiz, weight update per answer)")
+    scanned = _median_time(lambda: quiz_with_updates(scan_pick, scan_update), repeat=5)
+    _report("cumulative weights rebuilt per quiz", scanned)
+    _report("build bucketed sampler once", _median_time(lambda: WeightedSampler(weights), repeat=3))
+    sampler = WeightedSampler(weights)
+    _report("bucketed sampler", _median_time(
+        lambda: quiz_with_updates(lambda: sampler.sample(50, rng), sampler.update), repeat=100), scanned)
+
+
+@benchmark("review")
+def bench_review():
+    """Spaced repetition: scanning every card for the most overdue vs. a heap-ordered due queue"""
+    import heapq
+    import spaced_repetition
+
+    size = 100_000
+    rng = random.Random(0)
+    now = time.time()
+    with tempfile.TemporaryDirectory(prefix="quiz-bench-") as tmp:
+        schedule = spaced_repetition.ReviewSchedule(os.path.join(tmp, "reviews.db"), "bench")
+        for question_id in range(size):
+            card = spaced_repetition.Card(question_id, due=now + rng.uniform(-30, 30) * spaced_repetition.DAY)
+            schedule.cards[question_id] = card
+            schedule._queue.append((card.due, question_id))
+        heapq.heapify(schedule._queue)
+
+        def scan_next() -> int:
+            return min((card for card in schedule.cards.values() if card.due <= now),
+                       key=lambda card: card.due).question_id
+
+        def heap_next():
+            # Pick the next due card, review it, and push it back with its new due time
+            question_id = schedule.due_questions(1, now)[0]
+            schedule.review(question_id, 4, now)
+
+        print(f"review ({size} cards, next due card per answer)")
+        scanned = _median_time(scan_next, repeat=5)
+        _report("scan all cards", scanned)
+        _report("heap due queue (pick + review)", _median_time(heap_next, repeat=1000), scanned)
+        schedule._dirty.clear()
+        schedule.close()
+
+
+@benchmark("adaptive")
+def bench_adaptive():
+    """Adaptive next-item choice: information scan over the bank vs. precomputed tables"""
+    import math
+    import adaptive
+    from comprehensive_quiz import ComprehensiveQuiz
+    from question_index import QuestionIndex
+    from quiz_question import QuestionColumns
+
+    size = 100_000
+    bank = ComprehensiveQuiz().questions
+    index = QuestionIndex.build(QuestionColumns(bank[i % len(bank)] for i in range(size)))
+    rng = random.Random(0)
+    # Calibrated-looking parameters, so items don't all share three classes
+    params = {question_id: (rng.uniform(0.5, 2.0), rng.gauss(0, 1)) for question_id in range(size)}
+    start = time.perf_counter()
+    pool = adaptive.ItemPool(index, params)
+    built = time.perf_counter() - start
+    test = adaptive.AdaptiveTest(pool, lambda question_id: None, max_items=size, target_se=0.0,
+                                 rng=rng)
+    for question_id in rng.sample(range(size), 20):
+        test.record(question_id, rng.random() < 0.5)
+
+    def scan_next() -> int:
+        theta = test.theta
+        best, best_information = None, -1.0
+        for question_id, (a, b) in params.items():
+            if question_id in test.administered:
+                continue
+            p = 1.0 / (1.0 + math.exp(-a * (theta - b)))
+            information = a * a * p * (1.0 - p)
+            if information > best_information:
+                best, best_information = question_id, information
+        return best
+
+    print(f"adaptive ({size} calibrated items in {len(pool.classes)} classes, "
+          f"tables built in {built * 1e3:.0f} ms)")
+    scanned = _median_time(scan_next, repeat=3)
+    _report("scan item information", scanned)
+    _report("precomputed table lookup", _median_time(test.next_item, repeat=1000), scanned)
+    _report("record answer (posterior update)", _median_time(
+        lambda: test.record(test.next_item(), True), repeat=100), scanned)
+
+
+@benchmark("irt")
+def bench_irt():
+    """IRT calibration E-step: per-answer Python loops vs. chunked NumPy arrays"""
+    import math
+    import irt_calibration
+
+    if irt_calibration.np is None:
+        print("irt\n  (NumPy not installed; skipping)")
+        return
+    np = irt_calibration.np
+    persons, per_person, items = 50_000, 20, 2_000
+    rng = np.random.default_rng(0)
+    a, b = rng.uniform(0.5, 2.0, items), rng.normal(0, 1, items)
+    ability = rng.normal(0, 1, persons)
+
+    def chunks():
+        for first in range(0, persons, 5_000):
+            person = np.repeat(np.arange(first, first + 5_000), per_person)
+            item = rng.integers(0, items, len(person))
+            correct = rng.random(len(person)) < 1 / (1 + np.exp(-a[item] * (ability[person] - b[item])))
+            yield list(zip(person.tolist(), item.tolist(), correct.tolist()))
+
+    start = time.perf_counter()
+    responses = irt_calibration.Responses(chunks())
+    loaded = time.perf_counter() - start
+    theta = np.linspace(-4.0, 4.0, irt_calibration.QUADRATURE)
+    logit = a[:, None] * theta + b[:, None] * -a[:, None]
+    log_p, log_q = -np.logaddexp(0.0, -logit), -np.logaddexp(0.0, logit)
+    log_prior = -0.5 * theta * theta
+    bounds = responses.chunk_bounds(irt_calibration.CHUNK_SIZE)
+
+    sample = 1_000  # persons for the pure-Python E-step, scaled up to the full set
+    grid, lp, lq = theta.tolist(), log_p.tolist(), log_q.tolist()
+    rows = list(zip(responses.persons[:sample * per_person].tolist(),
+                    responses.items[:sample * per_person].tolist(),
+                    responses.correct[:sample * per_person].tolist()))
+
+    def python_e_step():
+        attempts = [[0.0] * len(grid) for _ in range(items)]
+        for first in range(0, len(rows), per_person):
+            answers = rows[first:first + per_person]
+            log_post = [-0.5 * t * t for t in grid]
+            for _, item, correct in answers:
+                table = lp[item] if correct else lq[item]
+                log_post = [x + y for x, y in zip(log_post, table)]
+            peak = max(log_post)
+            weights = [math.exp(x - peak) for x in log_post]
+            total = sum(weights)
+            for _, item, _ in answers:
+                row = attempts[item]
+                for point, weight in enumerate(weights):
+                    row[point] += weight / total
+
+    print(f"irt ({len(responses)} answers from {persons} students on {items} questions, "
+          f"loaded in {loaded:.1f}s)")
+    looped = _median_time(python_e_step, repeat=1) * persons / sample
+    _report("E-step, Python loops (extrapolated)", looped)
+    _report("E-step, chunked NumPy", _median_time(
+        lambda: irt_calibration._expected_counts(responses, log_p, log_q, log_prior, bounds),
+        repeat=3), looped)
+
+
+@benchmark("item-analysis")
+def bench_item_analysis():
+    """Item analysis of a million answers: per-answer Python loops vs. bincounts over arrays"""
+    import item_analysis
+
+    if item_analysis.np is None:
+        print("item-analysis\n  (NumPy not installed; skipping)")
+        return
+    np = item_analysis.np
+    sessions, per_session, items = 20_000, 50, 2_000
+    rng = np.random.default_rng(0)
+    session = np.repeat(np.arange(sessions), per_session)
+    question = rng.integers(0, items, len(session))
+    mask = (1 << rng.integers(0, 4, len(session))).astype(np.uint64)
+    correct = (mask == 1).astype(np.int64)
+    answers = item_analysis.AnswerArrays(zip(session.tolist(), question.tolist(), mask.tolist(),
+                                             correct.tolist()))
+    option_counts = dict.fromkeys(range(items), 4)
+    rows = list(zip(session.tolist(), question.tolist(), mask.tolist(), correct.tolist()))
+
+    def python_loops():
+        totals: Dict[int, List[int]] = {}
+        for s, _, _, c in rows:
+            entry = totals.setdefault(s, [0, 0])
+            entry[0] += c
+            entry[1] += 1
+        stats: Dict[int, List[float]] = {}
+        for s, q, m, c in rows:
+            score, count = totals[s]
+            rest = (score - c) / (count - 1)
+            entry = stats.setdefault(q, [0.0] * 9)
+            for i, value in enumerate((1, c, rest, c * rest, rest * rest)):
+                entry[i] += value
+            for option in range(4):
+                entry[5 + option] += m >> option & 1
+
+    print(f"item-analysis ({len(answers)} answers, {sessions} sessions, {items} questions)")
+    looped = _median_time(python_loops, repeat=1)
+    _report("per-answer Python loops", looped)
+    _report("bincounts over answer arrays", _median_time(
+        lambda: item_analysis.analyze(answers, option_counts), repeat=3), looped)
+
+
+@benchmark("near-duplicates")
+def bench_near_duplicates():
+    """Near-duplicate search: all-pairs Jaccard vs. MinHash/LSH candidates"""
+    import near_duplicates
+    from quiz_question import QuizQuestion
+
+    size, planted = 20_000, 200
+    rng = random.Random(0)
+    vocabulary = [f"w{i}" for i in range(5_000)]
+
+    def text(words: int) -> List[str]:
+        return [rng.choice(vocabulary) for _ in range(words)]
+
+    questions = [QuizQuestion(" ".join(text(12)), [" ".join(text(4)) for _ in range(4)], [0])
+                 for _ in range(size - planted)]
+    for original in rng.sample(range(len(questions)), planted):
+        # A copy with one word of the question changed
+        words = questions[original].question.split()
+        words[rng.randrange(len(words))] = rng.choice(vocabulary)
+        questions.append(QuizQuestion(" ".join(words), questions[original].options, [0]))
+
+    shingle_sets = [near_duplicates.shingles(question) for question in questions]
+    sample = [(rng.randrange(size), rng.randrange(size)) for _ in range(100_000)]
+    per_pair = _median_time(lambda: [near_duplicates.jaccard(shingle_sets[i], shingle_sets[j])
+                                     for i, j in sample], repeat=3) / len(sample)
+
+    print(f"near-duplicates ({size} questions, {planted} planted near-copies)")
+    all_pairs = per_pair * size * (size - 1) / 2
+    _report("all-pairs Jaccard (extrapolated)", all_pairs)
+    pairs: List = []
+
+    def lsh():
+        pairs[:] = near_duplicates.find_near_duplicates(questions)
+
+    _report("MinHash + LSH", _median_time(lsh, repeat=1), all_pairs)
+    print(f"  {'planted pairs found':<40} {sum(pair.second >= size - planted for pair in pairs):10d}")
+
+
+@benchmark("lint")
+def bench_lint():
+    """Bank linting: a full check vs. an incremental re-check after editing 1% of questions"""
+    import json
+    import bank_lint
+    from comprehensive_quiz import ComprehensiveQuiz
+
+    size = 100_000
+    records = [question.to_record() for question in ComprehensiveQuiz().questions]
+    with tempfile.TemporaryDirectory(prefix="quiz-bench-") as tmp:
+        bank_path = os.path.join(tmp, "bank.jsonl")
+        cache_path = os.path.join(tmp, "lint-cache.json")
+
+        def write_bank(edited: int):
+            with open(bank_path, "w", encoding="utf-8") as f:
+                for i in range(size):
+                    record = dict(records[i % len(records)], question=f"{records[i % len(records)]['question']} ({i})")
+                    if i < edited:
+                        record["explanation"] += " (edited)"
+                    f.write(json.dumps(record) + "\n")
+
+        print(f"lint ({size} questions, {os.cpu_count()} CPUs)")
+        write_bank(0)
+        full = _median_time(lambda: bank_lint.lint_bank(bank_path, workers=1), repeat=1)
+        _report("full check, one process", full)
+        _report("full check, process pool", _median_time(
+            lambda: bank_lint.lint_bank(bank_path), repeat=1), full)
+        bank_lint.lint_bank(bank_path, cache_path)
+        write_bank(size // 100)
+        _report("incremental, 1% edited", _median_time(
+            lambda: bank_lint.lint_bank(bank_path, cache_path), repeat=1), full)
+
+
+@benchmark("grading")
+def bench_grading():
+    """Grading one response: sort-and-compare lists vs. bitmask comparison"""
+    from comprehensive_quiz import ComprehensiveQuiz
+    from grading import grade, response_mask
+
+    questions = ComprehensiveQuiz().questions
+    keys = [q.correct_answers for q in questions]
+    responses = [list(reversed(key)) for key in keys]
+    masks = [response_mask(response) for response in responses]
+    pairs = list(zip(questions, responses, masks, keys))
+    rounds = 100
+
+    def sort_and_compare():
+        for _ in range(rounds):
+            for _, response, _, key in pairs:
+                sorted(response) == sorted(key)
+
+    def grade_indices():
+        for _ in range(rounds):
+            for question, response, _, _ in pairs:
+                grade(question, response)
+
+    def grade_masks():
+        for _ in range(rounds):
+            for question, _, mask, _ in pairs:
+                grade(question, mask)
+
+    def compare_masks():
+        for _ in range(rounds):
+            for question, _, mask, _ in pairs:
+                mask == question.answer_mask
+
+    gradings = rounds * len(pairs)
+    print(f"grading ({gradings} gradings, per-grading times in ns)")
+    baseline = _median_time(sort_and_compare) / gradings
+    for label, func in (("sort and compare lists", sort_and_compare),
+                        ("grade() from option indices", grade_indices),
+                        ("grade() from response mask", grade_masks),
+                        ("inline mask comparison", compare_masks)):
+        per_grading = _median_time(func) / gradings
+        print(f"  {label:<40} {per_grading * 1e9:10.1f} ns   ({baseline / per_grading:4.1f}x)")
+
+
+@benchmark("batch-grading")
+def bench_batch_grading():
+    """Grading 100k submissions of a 50-question form in one batch"""
+    import batch_grading
+    import grading
+    from comprehensive_quiz import ComprehensiveQuiz
+
+    students = 100_000
+    form = random.sample(ComprehensiveQuiz().questions, 50)
+    keys = batch_grading.answer_keys(form)
+    # Roughly 70% correct, otherwise a wrong single option
+    responses = [[key if random.random() < 0.7 else 1 << random.randrange(4) for key in keys]
+                 for _ in range(students)]
+
+    print(f"batch-grading ({students} students x {len(keys)} questions)")
+    one_at_a_time = _median_time(
+        lambda: [[grading.grade(q, r) for q, r in zip(form, row)] for row in responses], repeat=1)
+    _report("grade() per answer", one_at_a_time)
+    _report("grade_batch, pure Python", _median_time(
+        lambda: batch_grading.grade_batch(responses, keys, use_numpy=False), repeat=3), one_at_a_time)
+    if batch_grading.np is not None:
+        matrix = batch_grading.np.asarray(responses, dtype=batch_grading.np.uint64)
+        _report("grade_batch, NumPy", _median_time(
+            lambda: batch_grading.grade_batch(matrix, keys, use_numpy=True), repeat=3), one_at_a_time)
+    else:
+        print("  (NumPy not installed; skipping the vectorized path)")
+
+
+@benchmark("headless")
+def bench_headless():
+    """Simulated headless sessions per second (selection + parsing + grading)"""
+    from comprehensive_quiz import ComprehensiveQuiz
+
+    quiz = ComprehensiveQuiz()
+    sessions = 2_000
+    answers = [str(random.randint(1, 4)) for _ in range(50)]
+
+    def run():
+        for _ in range(sessions):
+            quiz.run_headless(answers)
+
+    elapsed = _median_time(run, repeat=3)
+    print(f"headless ({sessions} sessions x 50 questions)")
+    _report("all sessions", elapsed)
+    print(f"  {'sessions per second':<40} {sessions / elapsed:10.0f}")
+
+
+class _CountingRaw(io.RawIOBase):
+    """Raw byte sink that counts write() calls, i.e. the syscalls a terminal would see"""
+
+    def __init__(self):
+        self.writes = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.writes += 1
+        return len(data)
+
+
+def _terminal_stream() -> Tuple[io.TextIOWrapper, _CountingRaw]:
+    """Return a line-buffered text stream like stdout on a terminal, and its raw sink"""
+    raw = _CountingRaw()
+    return io.TextIOWrapper(io.BufferedWriter(raw), encoding="utf-8", line_buffering=True), raw
+
+
+def _print_question_screens(question, question_num: int, total: int, file):
+    """The original print-per-line question and feedback screens"""
+    print(f"\n{'='*80}", file=file)
+    print(f"Question {question_num} of {total} | Difficulty: {question.difficulty.upper()}", file=file)
+    print(f"{'='*80}", file=file)
+    print(f"\n{question.question}", file=file)
+    if len(question.correct_answers) > 1:
+        print("\n(Select ALL correct answers - separate multiple choices with commas)", file=file)
+    print("\nOptions:", file=file)
+    for i, option in enumerate(question.options, 1):
+        print(f"  {i}. {option}", file=file)
+    print(f"\nYour answer(s) (1-{len(question.options)}): ", end="", file=file)
+    file.flush()
+    print("\n❌ INCORRECT!", file=file)
+    if question.explanation:
+        print(f"\n💡 Explanation: {question.explanation}", file=file)
+    correct_indices = [i + 1 for i in question.correct_answers]
+    print(f"\n📝 Correct answer(s): {', '.join(map(str, correct_indices))}", file=file)
+    print("\nPress Enter to continue...", end="", file=file)
+    file.flush()
+
+
+@benchmark("render")
+def bench_render():
+    """Per-question render time and write syscalls: print per line vs. one buffer per screen"""
+    import quiz_render
+    from comprehensive_quiz import ComprehensiveQuiz
+    from quiz_session import QuizSession
+
+    questions = ComprehensiveQuiz().questions
+    session = QuizSession(questions)
+    records = [session.submit(0) for _ in questions]
+    total = len(questions)
+
+    def printed(file):
+        for num, question in enumerate(questions, 1):
+            _print_question_screens(question, num, total, file)
+
+    def buffered(file):
+        for num, (question, record) in enumerate(zip(questions, records), 1):
+            file.write(quiz_render.render_question(question, num, total)
+                       + quiz_render.render_answer_prompt(question))
+            file.flush()
+            file.write(quiz_render.render_feedback(record) + "\nPress Enter to continue...")
+            file.flush()
+
+    print(f"render ({total} questions, question + feedback screens)")
+    results = {}
+    for label, render in (("print per line", printed), ("one buffer per screen", buffered)):
+        stream, raw = _terminal_stream()
+        render(stream)
+        results[label] = (raw.writes / total,
+                          _median_time(lambda: render(_terminal_stream()[0])) / total)
+    baseline = results["print per line"][1]
+    for label, (writes, seconds) in results.items():
+        print(f"  {label:<40} {seconds * 1e6:8.1f} us/question"
+              f"   {writes:5.1f} writes/question   ({baseline / seconds:4.1f}x)")
+
+
+def _write_sessions(args: Tuple[str, int, int]) -> int:
+    """Worker: record sessions quiz-process style, returning how many were written"""
+    from quiz_question import QuizQuestion
+    from quiz_session import QuizSession
+    from results_store import ResultsStore
+
+    path, sessions, batch_size = args
+    question = QuizQuestion("Q", ["A", "B", "C", "D"], [1])
+    with ResultsStore(path, batch_size=batch_size) as store:
+        for _ in range(sessions):
+            session = QuizSession([question] * 50, list(range(50)))
+            while not session.finished:
+                session.submit(random.randrange(1, 16))
+            store.record_session(session.result, student="bench")
+    return sessions
+
+
+@benchmark("results-db")
+def bench_results_db():
+    """SQLite results store throughput with many concurrent writer processes"""
+    import multiprocessing
+
+    processes, sessions = 16, 200
+    print(f"results-db ({processes} processes x {sessions} sessions x 50 answers)")
+    for batch_size in (1, 50):
+        with tempfile.TemporaryDirectory(prefix="quiz-bench-") as tmp:
+            path = os.path.join(tmp, "results.db")
+            _write_sessions((path, 0, 1))  # create the schema before the writers race
+            with multiprocessing.Pool(processes) as pool:
+                start = time.perf_counter()
+                written = sum(pool.map(_write_sessions, [(path, sessions, batch_size)] * processes))
+                elapsed = time.perf_counter() - start
+            print(f"  {'batch size ' + str(batch_size):<40} {written / elapsed:10.0f} sessions/s"
+                  f"   {written * 50 / elapsed:10.0f} answers/s")
+
+
+@benchmark("event-log")
+def bench_event_log():
+    """Event log append throughput by fsync batch size, and compaction speed"""
+    import event_log
+    from quiz_question import QuizQuestion
+    from quiz_session import QuizSession
+
+    question = QuizQuestion("Q", ["A", "B", "C", "D"], [1])
+    print("event-log")
+    with tempfile.TemporaryDirectory(prefix="quiz-bench-") as tmp:
+        for fsync_every, answers in ((1, 2_000), (100, 100_000)):
+            path = os.path.join(tmp, f"answers-{fsync_every}.log")
+            with event_log.EventLog(path, fsync_every=fsync_every, fsync_interval=60) as log:
+                start = time.perf_counter()
+                for _ in range(answers // 50):
+                    session = QuizSession([question] * 50, list(range(50)), student="bench")
+                    session.listeners.append(log.record_answer)
+                    while not session.finished:
+                        session.submit(random.randrange(1, 16))
+                elapsed = time.perf_counter() - start
+            print(f"  {'fsync every ' + str(fsync_every) + ' events':<40} {answers / elapsed:10.0f} answers/s")
+
+        start = time.perf_counter()
+        count = event_log.compact([path], os.path.join(tmp, "summaries"))
+        print(f"  {'compact':<40} {count / (time.perf_counter() - start):10.0f} events/s")
+
+
+async def _http_client_session(port: int, num_questions: int) -> int:
+    """Run one quiz over a keep-alive connection, returning the number of requests made"""
+    import json
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+    async def request(method: str, path: str, payload: Dict[str, Any] = None) -> Dict[str, Any]:
+        body = json.dumps(payload).encode() if payload is not None else b""
+        writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+        await writer.drain()
+        await reader.readline()
+        length = 0
+        while True:
+            line = await reader.readline()
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode().partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        return json.loads(await reader.readexactly(length))
+
+    session_id = (await request("POST", "/quizzes", {"num_questions": num_questions}))["session_id"]
+    requests = 1
+    finished = False
+    while not finished:
+        finished = (await request("POST", f"/quizzes/{session_id}/answer", {"answer": "1"}))["finished"]
+        requests += 1
+    await request("GET", f"/quizzes/{session_id}/results")
+    writer.close()
+    return requests + 1
+
+
+@benchmark("http-server")
+def bench_http_server():
+    """Concurrent quiz sessions served by one asyncio HTTP server process"""
+    from comprehensive_quiz import load_quiz
+    from quiz_server import QuizServer
+
+    server = QuizServer(load_quiz())
+
+    async def run(clients: int, num_questions: int) -> Tuple[int, float]:
+        listener = await asyncio.start_server(server.handle_connection, "127.0.0.1", 0, backlog=1024)
+        port = listener.sockets[0].getsockname()[1]
+        start = time.perf_counter()
+        requests = await asyncio.gather(*(_http_client_session(port, num_questions)
+                                          for _ in range(clients)))
+        elapsed = time.perf_counter() - start
+        listener.close()
+        await listener.wait_closed()
+        return sum(requests), elapsed
+
+    print("http-server")
+    for clients in (10, 200, 1000):
+        requests, elapsed = asyncio.run(run(clients, 20))
+        print(f"  {str(clients) + ' concurrent 20-question sessions':<40} "
+              f"{clients / elapsed:8.0f} sessions/s {requests / elapsed:8.0f} requests/s")
+    print(f"  {'sessions held in memory':<40} {len(server.sessions):8d}")
+
+
+def main(argv: List[str] = None):
+    """Run the benchmarks named on the command line, or all of them"""
+    names = sys.argv[1:] if argv is None else argv
+    if names == ["--list"]:
+        for name, func in BENCHMARKS.items():
+            print(f"{name:<20} {func.__doc__}")
+        return
+    for name in names or list(BENCHMARKS):
+        if name not in BENCHMARKS:
+            print(f"❌ Unknown benchmark: {name}")
+            sys.exit(1)
+        BENCHMARKS[name]()
+        print()
+
+
+if __name__ == "__main__":
+    main()
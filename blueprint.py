@@ -0,0 +1,140 @@
+"""
+Blueprint-driven stratified question selection.
+
+A blueprint lists strata, each a difficulty and topic (either may be "*" for
+any) with the number of questions to draw from it, for example
+
+    easy/agile=3, medium/*=10, hard/git=2
+
+Strata are drawn from the QuestionIndex pools that are already built for the
+bank, so assembling an exam costs one small random.sample per stratum. There
+is no retry-until-balanced loop. balanced_blueprint spreads a question count
+evenly over the difficulty × topic cells instead of sampling uniformly,
+which would mirror the bank's skew (the built-in bank has more than twice as
+many medium items as easy ones).
+"""
+
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from question_index import QuestionIndex
+from quiz_question import DEFAULT_TOPIC, DIFFICULTIES, TOPICS
+
+ANY = "*"
+
+
+class BlueprintError(ValueError):
+    """Raised for a malformed blueprint, or one the bank cannot fill"""
+
+
+class Stratum(NamedTuple):
+    difficulty: Optional[str]  # None for any difficulty
+    topic: Optional[str]  # None for any topic
+    count: int
+
+    def __str__(self) -> str:
+        return f"{self.difficulty or ANY}/{self.topic or ANY}={self.count}"
+
+
+Blueprint = Tuple[Stratum, ...]
+
+
+def parse_blueprint(spec: str) -> Blueprint:
+    """Parse "difficulty/topic=count, ..." into a blueprint"""
+    strata = []
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        cell, _, count = entry.partition("=")
+        difficulty, _, topic = cell.strip().partition("/")
+        difficulty, topic = difficulty.strip(), topic.strip() or ANY
+        if difficulty != ANY and difficulty not in DIFFICULTIES:
+            raise BlueprintError(f"unknown difficulty in {entry!r}")
+        if topic != ANY and topic not in TOPICS and topic != DEFAULT_TOPIC:
+            raise BlueprintError(f"unknown topic in {entry!r}")
+        try:
+            count = int(count)
+        except ValueError:
+            raise BlueprintError(f"expected difficulty/topic=count, got {entry!r}") from None
+        if count < 1:
+            raise BlueprintError(f"count must be positive in {entry!r}")
+        strata.append(Stratum(None if difficulty == ANY else difficulty,
+                              None if topic == ANY else topic, count))
+    if not strata:
+        raise BlueprintError("blueprint is empty")
+    return tuple(strata)
+
+
+def format_blueprint(blueprint: Blueprint) -> str:
+    return ", ".join(str(stratum) for stratum in blueprint)
+
+
+def balanced_blueprint(index: QuestionIndex, total: int, difficulty: str = None,
+                       topic: str = None) -> Blueprint:
+    """Spread total questions as evenly as possible over the non-empty cells.
+
+    Cells too small for their share give it up to the others. Any remainder goes to
+    the largest cells, so the result depends only on the bank.
+    """
+    cells = sorted((cell for cell, ids in index.by_cell.items()
+                    if (difficulty is None or cell[0] == difficulty)
+                    and (topic is None or cell[1] == topic)),
+                   key=lambda cell: (-len(index.by_cell[cell]), cell))
+    counts = dict.fromkeys(cells, 0)
+    remaining = min(total, sum(len(index.by_cell[cell]) for cell in cells))
+    open_cells = list(cells)
+    while remaining and open_cells:
+        share, extra = divmod(remaining, len(open_cells))
+        still_open = []
+        for position, cell in enumerate(open_cells):
+            want = share + (position < extra)
+            take = min(want, len(index.by_cell[cell]) - counts[cell])
+            counts[cell] += take
+            remaining -= take
+            if counts[cell] < len(index.by_cell[cell]):
+                still_open.append(cell)
+        open_cells = still_open
+    return tuple(Stratum(cell[0], cell[1], count) for cell, count in counts.items() if count)
+
+
+def resolve_blueprint(spec: str, index: Optional[QuestionIndex], total: int,
+                      difficulty: str = None, topic: str = None) -> Blueprint:
+    """Parse a blueprint spec; "balanced" spreads total evenly over the matching cells"""
+    if index is None:
+        raise BlueprintError("blueprints need an indexed bank (built-in or .qstore)")
+    if spec == "balanced":
+        return balanced_blueprint(index, total, difficulty, topic)
+    blueprint = parse_blueprint(spec)
+    check_blueprint(index, blueprint)
+    return blueprint
+
+
+def check_blueprint(index: QuestionIndex, blueprint: Sequence[Stratum]):
+    """Raise BlueprintError naming every stratum the bank has too few questions for"""
+    shortfalls = []
+    for stratum in blueprint:
+        available = len(index.select(stratum.difficulty, stratum.topic))
+        if available < stratum.count:
+            shortfalls.append(f"{stratum} ({available} available)")
+    if shortfalls:
+        raise BlueprintError("not enough questions for " + ", ".join(shortfalls))
+
+
+def sample_blueprint(index: QuestionIndex, blueprint: Sequence[Stratum], rng) -> List[int]:
+    """Draw question ids for every stratum without repeats, in shuffled order"""
+    check_blueprint(index, blueprint)
+    picked: List[int] = []
+    taken = set()
+    for stratum in blueprint:
+        pool = index.select(stratum.difficulty, stratum.topic)
+        # Strata may overlap (e.g. hard/* and */git); oversampling by the number already
+        # taken guarantees enough fresh ids without retrying
+        candidates = rng.sample(pool, min(len(pool), stratum.count + len(taken)))
+        fresh = [question_id for question_id in candidates if question_id not in taken]
+        if len(fresh) < stratum.count:
+            raise BlueprintError(f"overlapping strata leave too few questions for {stratum}")
+        fresh = fresh[:stratum.count]
+        taken.update(fresh)
+        picked.extend(fresh)
+    rng.shuffle(picked)
+    return picked
@@ -0,0 +1,139 @@
+"""
+Incremental session checkpoints.
+
+A checkpoint is an append-only JSON Lines file. The first line is written when
+the session starts and records everything needed to rebuild it without
+re-sampling: the selected question ids, a checksum of each question's prompt
+(to detect an edited bank), the filters and the student. After that, each
+graded answer appends one short line, so the per-answer cost is one small
+write regardless of quiz length.
+
+Resuming reads the file once, looks the selected questions up by id, and
+restores the answers and score as recorded, continuing at the first
+unanswered question.
+"""
+
+import json
+import os
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from quiz_question import QuizQuestion
+from quiz_session import AnswerRecord, QuizSession
+
+CHECKPOINT_VERSION = 1
+
+
+class CheckpointError(Exception):
+    """Raised when a checkpoint cannot be used to resume a session"""
+
+
+def _prompt_checksum(question: QuizQuestion) -> int:
+    return zlib.crc32(question.question.encode("utf-8"))
+
+
+class Checkpoint:
+    def __init__(self, path: str, fsync: bool = False):
+        """Open an existing checkpoint for appending; use create() for a new session"""
+        self.path = path
+        self.fsync = fsync
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    @classmethod
+    def create(cls, path: str, session: QuizSession, fsync: bool = False,
+               **metadata: Any) -> "Checkpoint":
+        """Start a checkpoint for a new session, replacing any file at path"""
+        header = {
+            "version": CHECKPOINT_VERSION,
+            "session": session.session_id,
+            "student": session.student,
+            "question_ids": session.question_ids,
+            "checksums": [_prompt_checksum(question) for question in session.questions],
+            "seed": session.seed,
+            "option_orders": session.option_orders,
+        }
+        header.update(metadata)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(header) + "\n")
+        return cls(path, fsync)
+
+    def record_answer(self, session: QuizSession, record: AnswerRecord):
+        """QuizSession listener: append one graded answer"""
+        line = json.dumps([record.response_mask, int(record.correct), record.render_seconds,
+                           record.think_seconds, record.grade_seconds])
+        os.write(self._fd, line.encode() + b"\n")
+        if self.fsync:
+            os.fsync(self._fd)
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def finish(self):
+        """Close and delete the checkpoint once its session is complete"""
+        self.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def load_checkpoint(path: str) -> Tuple[Dict[str, Any], List[list]]:
+    """Return a checkpoint's header and its answer lines.
+
+    A torn final line from a crash is cut off the file, so answers appended
+    after resuming start on a line of their own; that answer is asked again.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    lines = data.split(b"\n")
+    # Every complete line ends in a newline; whatever follows the last one is torn
+    lines.pop()
+    if not lines:
+        raise CheckpointError(f"{path} is empty")
+    try:
+        header = json.loads(lines[0])
+    except ValueError:
+        raise CheckpointError(f"{path} has an unreadable header") from None
+    if not isinstance(header, dict) or header.get("version") != CHECKPOINT_VERSION:
+        raise CheckpointError(f"{path} is not a version {CHECKPOINT_VERSION} checkpoint")
+
+    answers = []
+    good_length = len(lines[0]) + 1
+    for line in lines[1:]:
+        try:
+            answers.append(json.loads(line))
+        except ValueError:
+            break
+        good_length += len(line) + 1
+    if good_length < len(data):
+        os.truncate(path, good_length)
+    return header, answers
+
+
+def restore_session(header: Dict[str, Any], answers: List[list],
+                    lookup: Callable[[Sequence[int]], List[QuizQuestion]]) -> QuizSession:
+    """Rebuild a session from a loaded checkpoint; lookup maps question ids to questions"""
+    question_ids: List[Optional[int]] = header["question_ids"]
+    if any(question_id is None for question_id in question_ids):
+        raise CheckpointError("checkpoint was written without bank question ids")
+    questions = lookup(question_ids)
+    if [_prompt_checksum(question) for question in questions] != header["checksums"]:
+        raise CheckpointError("the question bank has changed since this checkpoint was written")
+    option_orders = header.get("option_orders")
+    if option_orders is not None:
+        option_orders = [tuple(order) for order in option_orders]
+        questions = [question.shuffled(order) for question, order in zip(questions, option_orders)]
+
+    session = QuizSession(questions, question_ids, header["session"], header.get("student"),
+                          header.get("seed"), option_orders)
+    result = session.result
+    for num, (mask, correct, render_seconds, think_seconds, grade_seconds) in enumerate(
+            answers[:len(questions)], 1):
+        order = option_orders[num - 1] if option_orders is not None else None
+        result.answers.append(AnswerRecord(num, question_ids[num - 1], questions[num - 1], mask,
+                                           bool(correct), render_seconds, think_seconds,
+                                           grade_seconds, order))
+        result.score += bool(correct)
+    return session
@@ -11,28 +11,96 @@ Based on quiz content from desktop quizzes covering:
 - UI/UX Design (Design sprints, mobile design)
 """
 
+import argparse
+import json
+import os
 import random
 import sys
 import time
-from typing import List, Dict, Any, Tuple
+from collections import OrderedDict
+from typing import List, Dict, Any, Iterable, Optional, TextIO, Tuple
+
+from adaptive import AdaptiveTest, ItemPool
+import bank_cache
+from blueprint import Blueprint, BlueprintError, format_blueprint, resolve_blueprint, sample_blueprint
+from checkpoint import Checkpoint, CheckpointError, load_checkpoint, restore_session
+import question_bank
+from event_log import EventLog
+from irt_params import CalibrationError, read_params
+from question_index import QuestionIndex
+from question_store import QuestionStore
+from results_store import ResultsStore
+from spaced_repetition import ReviewSchedule
+from timing_stats import export_timings, session_timing
+from weighted_sampling import PracticeWeights
+from quiz_question import TOPICS, QuizQuestion
+from quiz_render import (render_answer_prompt, render_banner, render_config, render_feedback,
+                         render_menu, render_no_questions, render_nothing_due, render_question,
+                         render_results)
+from quiz_session import AnswerError, QuizResult, QuizSession, parse_answer, session_seed
+
+class QuizModeError(Exception):
+    """Raised when a quiz mode cannot be used with the loaded bank"""
+
+# Menu choice -> (number of questions, difficulty) for the fixed quizzes
+QUIZ_PRESETS = {
+    "1": (50, None),
+    "2": (20, "easy"),
+    "3": (30, "medium"),
+    "4": (25, "hard"),
+}
+
+# Generated forms remembered by seed and settings (as ids and option orders only)
+FORM_CACHE_SIZE = 4096
 
-class QuizQuestion:
-    def __init__(self, question: str, options: List[str], correct_answers: List[int], 
-                 explanation: str = "", difficulty: str = "medium"):
-        self.question = question
-        self.options = options
-        self.correct_answers = correct_answers  # List of indices (0-based)
-        self.explanation = explanation
-        self.difficulty = difficulty
 
 class ComprehensiveQuiz:
-    def __init__(self):
-        self.questions = self._load_questions()
-        self.score = 0
-        self.total_questions = 0
-        self.current_question = 0
-        self.incorrect_answers = []
+    def __init__(self, use_cache: bool = False, bank_path: str = None, output: TextIO = None,
+                 student: str = None, event_log: EventLog = None, checkpoint_path: str = None,
+                 exam: str = None, shuffle_options: bool = False):
+        self.bank_path = bank_path
+        self.output = output  # Defaults to the current sys.stdout
+        self.student = student
+        self.exam = exam  # With student, fixes every session's form (see next_seed)
+        self.shuffle_options = shuffle_options
+        self._forms = OrderedDict()
+        self.practice = None  # PracticeWeights, once enable_practice is called
+        self.review = None  # ReviewSchedule, once enable_review is called
+        self.new_per_review = 10
+        self.target_se = None  # Set by enable_adaptive
+        self.irt_params = None  # Calibrated question id -> (a, b), for adaptive mode
+        self._item_pools = {}  # topic -> adaptive ItemPool, built on first use
+        self.adaptive = None  # AdaptiveTest driving the current session, in adaptive mode
+        self.event_log = event_log
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint = None
+        if bank_path and bank_path.endswith(".qstore"):
+            # Memory-mapped store: questions are decoded on access
+            self.questions = QuestionStore(bank_path)
+        elif bank_path:
+            # Questions are streamed from the bank file when a quiz starts,
+            # but a missing file should fail now rather than mid-quiz
+            os.stat(bank_path)
+            self.questions = None
+        elif use_cache:
+            self.questions = self._load_cached_questions()
+        else:
+            self.questions = self._load_questions()
+        # Built once per bank so filtered selection never rescans it
+        self.index = QuestionIndex.build(self.questions) if self.questions is not None else None
+        self.session = None
+        self.difficulty = None
+        self.topic = None
+        
+    def _load_cached_questions(self) -> List[QuizQuestion]:
+        """Load the question bank from the compiled cache, rebuilding it if stale"""
+        def build() -> List[bank_cache.Record]:
+            return [(q.question, q.options, q.correct_answers, q.explanation, q.difficulty, q.topic)
+                    for q in self._load_questions()]
         
+        records = bank_cache.load_records(os.path.abspath(__file__), build)
+        return [QuizQuestion(*record) for record in records]
+    
     def _load_questions(self) -> List[QuizQuestion]:
         """Load all quiz questions from the analyzed content"""
         questions = []
@@ -50,14 +118,16 @@ class ComprehensiveQuiz:
                 ],
                 [0, 2, 3],
                 "The Product Owner focuses on product vision, backlog prioritization, and story evaluation, not technical implementation or team assignment.",
-                "hard"
+                "hard",
+                "agile"
             ),
             QuizQuestion(
                 "An agile/scrum advocate would likely say that one duty of the Product Owner is to decide what NOT to build.",
                 ["True", "False"],
                 [0],
                 "Saying 'No' is crucial for Product Owners to maintain focus and prevent scope creep.",
-                "medium"
+                "medium",
+                "agile"
             ),
             QuizQuestion(
                 "Which of the following are key elements of the agile methodology? (Select all that apply)",
@@ -70,7 +140,8 @@ class ComprehensiveQuiz:
                 ],
                 [0, 1, 2, 3],
                 "Agile emphasizes iterative development, continuous testing, minimal documentation, and cross-functional collaboration.",
-                "hard"
+                "hard",
+                "agile"
             ),
             QuizQuestion(
                 "Why does Kniberg emphasize that 'No' is the most important word for a Product Owner?",
@@ -82,7 +153,8 @@ class ComprehensiveQuiz:
                 ],
                 [2],
                 "Unlimited acceptance creates queues that destroy agility by causing context switching and multitasking inefficiencies.",
-                "hard"
+                "hard",
+                "agile"
             ),
             QuizQuestion(
                 "What is the relationship between value, size, and prioritization in Kniberg's framework?",
@@ -94,7 +166,8 @@ class ComprehensiveQuiz:
                 ],
                 [2],
                 "Value and size are independent variables - small features can have high value, large features can have low value.",
-                "hard"
+                "hard",
+                "agile"
             )
         ])
         
@@ -105,14 +178,16 @@ class ComprehensiveQuiz:
                 ["HTML", "CSS", "JavaScript", "XML"],
                 [1],
                 "CSS (Cascading Style Sheets) is specifically designed for styling and layout.",
-                "easy"
+                "easy",
+                "frontend"
             ),
             QuizQuestion(
                 "In the following piece of HTML, 'class' is most accurately called what? `<a href='/path/' class='offsite'>Foo</a>`",
                 ["an element", "a tag", "an attribute", "a value"],
                 [2],
                 "The 'class' is an attribute of the anchor tag element.",
-                "medium"
+                "medium",
+                "frontend"
             ),
             QuizQuestion(
                 "Which of the following is an accurate definition of 'the DOM'?",
@@ -124,7 +199,8 @@ class ComprehensiveQuiz:
                 ],
                 [0],
                 "The DOM (Document Object Model) is the browser's in-memory representation of the parsed HTML structure.",
-                "hard"
+                "hard",
+                "frontend"
             ),
             QuizQuestion(
                 "Consider a CSS rule like this: `p.foo { color: blue }`. What does this do?",
@@ -136,14 +212,16 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "The selector `p.foo` targets paragraph elements that have the class 'foo'.",
-                "medium"
+                "medium",
+                "frontend"
             ),
             QuizQuestion(
                 "Which of the following is a 'semantic' element in HTML?",
                 ["`<div>`", "`<span>`", "`<article>`", "`<b>`"],
                 [2],
                 "`<article>` is semantic because its name describes its purpose and meaning.",
-                "medium"
+                "medium",
+                "frontend"
             ),
             QuizQuestion(
                 "Front-end web applications typically divide their 'concerns' into three different categories: content, design, and behavior. Which ordering of technologies corresponds to these categories?",
@@ -156,14 +234,16 @@ class ComprehensiveQuiz:
                 ],
                 [0],
                 "HTML provides content structure, CSS handles design/styling, and JavaScript manages behavior/interactivity.",
-                "medium"
+                "medium",
+                "frontend"
             ),
             QuizQuestion(
                 "Where was JavaScript originally created?",
                 ["Netscape", "Microsoft", "Sun Microsystems", "Oracle", "Google"],
                 [0],
                 "JavaScript was created by Brendan Eich at Netscape in 1995.",
-                "easy"
+                "easy",
+                "frontend"
             ),
             QuizQuestion(
                 "Consider this snippet of code: `document.querySelector('button').onclick = function() { alert('Ouch! Stop poking me!');}`. What will this code do?",
@@ -175,7 +255,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "querySelector returns only the first matching element, so only the first button will trigger the alert.",
-                "hard"
+                "hard",
+                "frontend"
             )
         ])
         
@@ -186,7 +267,8 @@ class ComprehensiveQuiz:
                 ["Server", "Client"],
                 [0],
                 "Go is primarily used for server-side development, though it can be used for other purposes.",
-                "easy"
+                "easy",
+                "backend"
             ),
             QuizQuestion(
                 "Which of the following most accurately describes a 'web framework'?",
@@ -197,14 +279,16 @@ class ComprehensiveQuiz:
                 ],
                 [0],
                 "Web frameworks provide pre-built solutions for common web development tasks.",
-                "medium"
+                "medium",
+                "backend"
             ),
             QuizQuestion(
                 "Which of the following would most typically speak to a database storing customer information?",
                 ["Server-side code", "Client-side code"],
                 [0],
                 "Database interactions typically happen on the server side for security and performance reasons.",
-                "easy"
+                "easy",
+                "backend"
             ),
             QuizQuestion(
                 "The Go language is...",
@@ -214,7 +298,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Go is statically typed, requiring explicit type declarations for function parameters and variables.",
-                "medium"
+                "medium",
+                "backend"
             ),
             QuizQuestion(
                 "The Go language is known as which of the following, according to the article by Gosiar? (Select all that apply)",
@@ -226,14 +311,16 @@ class ComprehensiveQuiz:
                 ],
                 [0, 1, 2, 3],
                 "Go is designed to be fast, clear, scalable, and easy to learn.",
-                "hard"
+                "hard",
+                "backend"
             ),
             QuizQuestion(
                 "The Go programming language is most associated with which company?",
                 ["Google", "Microsoft", "Apple", "Amazon", "Meta"],
                 [0],
                 "Go was created by Google engineers Robert Griesemer, Rob Pike, and Ken Thompson.",
-                "easy"
+                "easy",
+                "backend"
             )
         ])
         
@@ -249,7 +336,8 @@ class ComprehensiveQuiz:
                 ],
                 [3],
                 "The port is part of the domain, the query doesn't include the ?, and the fragment doesn't include the #.",
-                "hard"
+                "hard",
+                "fullstack"
             ),
             QuizQuestion(
                 "Which is a correct classification of HTTP status codes?",
@@ -261,14 +349,16 @@ class ComprehensiveQuiz:
                 ],
                 [2],
                 "HTTP status codes follow this pattern: 1xx informational, 2xx success, 3xx redirection, 4xx client error, 5xx server error.",
-                "hard"
+                "hard",
+                "fullstack"
             ),
             QuizQuestion(
                 "HTTP is a 'stateless' protocol, but sometimes the server needs to track state between client requests. This is often accomplished with what?",
                 ["User-Agent", "HTTPS", "Cookies/Sessions", "URL fragments", "Protocols"],
                 [2],
                 "Cookies and sessions are the primary mechanisms for maintaining state in HTTP's stateless environment.",
-                "medium"
+                "medium",
+                "fullstack"
             ),
             QuizQuestion(
                 "Which of the following is a correct definition of 'routing' as it pertains to a web server?",
@@ -280,7 +370,8 @@ class ComprehensiveQuiz:
                 ],
                 [0],
                 "Web routing maps URL patterns to specific code handlers or functions.",
-                "medium"
+                "medium",
+                "fullstack"
             ),
             QuizQuestion(
                 "'Static files' refer to what in the context of a web server?",
@@ -292,14 +383,16 @@ class ComprehensiveQuiz:
                 ],
                 [3],
                 "Static files are served as-is without server-side processing (like images, CSS, JavaScript files).",
-                "medium"
+                "medium",
+                "fullstack"
             ),
             QuizQuestion(
                 "Imagine you're a PM for clone of Venmo. Kyle sends $10 to Kerwin. Where should this business logic happen?",
                 ["The client", "The server", "The caching layer", "The DNS server", "The IP layer"],
                 [1],
                 "Financial transactions and business logic must be processed server-side for security and data integrity.",
-                "medium"
+                "medium",
+                "fullstack"
             )
         ])
         
@@ -310,28 +403,32 @@ class ComprehensiveQuiz:
                 ["True", "False"],
                 [0],
                 "The internet is indeed a network of networks, connecting many local area networks globally.",
-                "easy"
+                "easy",
+                "networking"
             ),
             QuizQuestion(
                 "Which of the following best describes the internet?",
                 ["distributed", "centralized"],
                 [0],
                 "The internet is distributed with no single central authority controlling it.",
-                "easy"
+                "easy",
+                "networking"
             ),
             QuizQuestion(
                 "Which of the following has the lowest signal loss per unit distance?",
                 ["copper cable", "fiber optic cable"],
                 [1],
                 "Fiber optic cables have much lower signal loss than copper cables over long distances.",
-                "medium"
+                "medium",
+                "networking"
             ),
             QuizQuestion(
                 "Which of the following has more addresses?",
                 ["IPV4", "IPV6"],
                 [1],
                 "IPv6 has a much larger address space (128-bit) compared to IPv4 (32-bit).",
-                "easy"
+                "easy",
+                "networking"
             ),
             QuizQuestion(
                 "Which of the following best describes the function of DNS?",
@@ -343,14 +440,16 @@ class ComprehensiveQuiz:
                 ],
                 [2],
                 "DNS (Domain Name System) translates human-readable domain names to IP addresses.",
-                "medium"
+                "medium",
+                "networking"
             ),
             QuizQuestion(
                 "Data travels through the internet in the most direct path between two points",
                 ["True", "False"],
                 [1],
                 "Data often takes indirect paths through multiple routers and networks.",
-                "easy"
+                "easy",
+                "networking"
             ),
             QuizQuestion(
                 "Which protocol ensures that packets are not dropped when transferring files, for example a song from Spotify?",
@@ -361,14 +460,16 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "TCP (Transmission Control Protocol) provides reliable, ordered delivery of data packets.",
-                "medium"
+                "medium",
+                "networking"
             ),
             QuizQuestion(
                 "Which of the following is a common medium over which data on the internet travel? (Select all that apply)",
                 ["Light", "Electricity", "Sound", "Wind waves", "Gravity waves"],
                 [0, 1],
                 "Data travels as electrical signals in copper cables and as light in fiber optic cables.",
-                "medium"
+                "medium",
+                "networking"
             ),
             QuizQuestion(
                 "A 'protocol' is best described as which of the following?",
@@ -380,7 +481,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Protocols are agreed-upon rules and standards for communication between systems.",
-                "medium"
+                "medium",
+                "networking"
             ),
             QuizQuestion(
                 "Imagine you download an image of Kyle dressed like Chappell Roan for Halloween. It's a high-res 10MB image that is broken into packets for transmission. Which of the following two are true?",
@@ -392,7 +494,8 @@ class ComprehensiveQuiz:
                 ],
                 [1, 3],
                 "Packets can take different routes and may arrive out of order, which is why TCP handles reassembly.",
-                "hard"
+                "hard",
+                "networking"
             )
         ])
         
@@ -409,14 +512,16 @@ class ComprehensiveQuiz:
                 ],
                 [0, 1, 2],
                 "Version control enables collaboration, history tracking, and progress visibility, but doesn't provide error labeling or AI suggestions.",
-                "medium"
+                "medium",
+                "git"
             ),
             QuizQuestion(
                 "Which git command creates a permanent snapshot of your changes in the repository?",
                 ["commit", "save", "revert", "fork", "clone"],
                 [0],
                 "The `git commit` command creates a permanent snapshot of staged changes.",
-                "easy"
+                "easy",
+                "git"
             ),
             QuizQuestion(
                 "Which of the following most accurately describes the 'terminal' on your computer?",
@@ -429,7 +534,8 @@ class ComprehensiveQuiz:
                 ],
                 [0],
                 "The terminal is a command-line interface alternative to graphical user interfaces.",
-                "easy"
+                "easy",
+                "git"
             ),
             QuizQuestion(
                 "A git commit message ought to...",
@@ -441,7 +547,8 @@ class ComprehensiveQuiz:
                 ],
                 [0],
                 "Good commit messages describe what changes were made and why.",
-                "medium"
+                "medium",
+                "git"
             ),
             QuizQuestion(
                 "The structure of git commits is best described as which of the following?",
@@ -454,7 +561,8 @@ class ComprehensiveQuiz:
                 ],
                 [0],
                 "Git uses a tree structure where commits can branch and merge, creating a directed acyclic graph.",
-                "medium"
+                "medium",
+                "git"
             ),
             QuizQuestion(
                 "Imagine you see your developers sending files back-and-forth like `file_v1`, `file_v2`, `file_v3`. What does this suggest?",
@@ -467,7 +575,8 @@ class ComprehensiveQuiz:
                 ],
                 [0],
                 "Manual file versioning suggests they're not using proper version control systems like Git.",
-                "medium"
+                "medium",
+                "git"
             ),
             QuizQuestion(
                 "What is a 'repository' in version control?",
@@ -480,7 +589,8 @@ class ComprehensiveQuiz:
                 ],
                 [0],
                 "A repository contains all project files and their complete version history.",
-                "medium"
+                "medium",
+                "git"
             ),
             QuizQuestion(
                 "A 'branch' in Git is best described as...",
@@ -492,7 +602,8 @@ class ComprehensiveQuiz:
                 ],
                 [0],
                 "Branches allow independent development without affecting the main codebase until merged.",
-                "medium"
+                "medium",
+                "git"
             ),
             QuizQuestion(
                 "When should you make a git commit?",
@@ -504,14 +615,16 @@ class ComprehensiveQuiz:
                 ],
                 [0],
                 "Commits should be made after completing logical units of work, not on arbitrary time schedules.",
-                "medium"
+                "medium",
+                "git"
             ),
             QuizQuestion(
                 "What does git use to uniquely identify commits?",
                 ["SHA-1 hash", "Bubbles or circles", "Messages", "Developer email addresses", "HTML"],
                 [0],
                 "Git uses SHA-1 cryptographic hashes to uniquely identify each commit.",
-                "medium"
+                "medium",
+                "git"
             )
         ])
         
@@ -527,7 +640,8 @@ class ComprehensiveQuiz:
                 ],
                 [2],
                 "Design sprints focus on rapid problem-solving through user-centered design and testing.",
-                "medium"
+                "medium",
+                "uiux"
             ),
             QuizQuestion(
                 "Which is the correct sequence of phases in a design sprint?",
@@ -540,7 +654,8 @@ class ComprehensiveQuiz:
                 ],
                 [3],
                 "The standard design sprint follows: Understand → Ideate → Decide → Prototype → Test.",
-                "hard"
+                "hard",
+                "uiux"
             ),
             QuizQuestion(
                 "Why is user testing an essential part of the design sprint process?",
@@ -552,7 +667,8 @@ class ComprehensiveQuiz:
                 ],
                 [3],
                 "User testing validates design decisions before committing to expensive development.",
-                "medium"
+                "medium",
+                "uiux"
             ),
             QuizQuestion(
                 "What makes design sprints beneficial for teams?",
@@ -564,7 +680,8 @@ class ComprehensiveQuiz:
                 ],
                 [0],
                 "Design sprints compress months of decision-making into a focused week.",
-                "medium"
+                "medium",
+                "uiux"
             ),
             QuizQuestion(
                 "Which hand position is most common for mobile users, according to Steven Hoober's research?",
@@ -576,7 +693,8 @@ class ComprehensiveQuiz:
                 ],
                 [2],
                 "Most mobile users primarily use their thumb for one-handed interaction.",
-                "medium"
+                "medium",
+                "uiux"
             ),
             QuizQuestion(
                 "In the context of design sprints, what is the role of the 'sprint master'?",
@@ -588,7 +706,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "The sprint master facilitates and guides the team through the design sprint process.",
-                "medium"
+                "medium",
+                "uiux"
             ),
             QuizQuestion(
                 "Why should negative actions (like delete or erase) be placed in hard-to-reach areas in mobile design?",
@@ -600,7 +719,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Destructive actions should be hard to reach to prevent accidental activation.",
-                "medium"
+                "medium",
+                "uiux"
             )
         ])
         
@@ -616,21 +736,24 @@ class ComprehensiveQuiz:
                 ],
                 [2],
                 "Retrieving videos requires server-side database queries, while swipe handling is client-side UI interaction.",
-                "hard"
+                "hard",
+                "fullstack"
             ),
             QuizQuestion(
                 "Which HTTP method is most often used when submitting data via a form on a website?",
                 ["GET", "POST", "DELETE", "HEAD", "OPTIONS"],
                 [1],
                 "POST is used for form submissions as it can send data in the request body and doesn't expose data in the URL.",
-                "medium"
+                "medium",
+                "fullstack"
             ),
             QuizQuestion(
                 "I need to know the IP address for `hinge.com`. I use what?",
                 ["DNS", "HTTP", "HTTPS", "TCP", "CSS"],
                 [0],
                 "DNS (Domain Name System) translates domain names to IP addresses.",
-                "easy"
+                "easy",
+                "networking"
             ),
             QuizQuestion(
                 "The internet is most accurately described as which of the following?",
@@ -642,21 +765,24 @@ class ComprehensiveQuiz:
                 ],
                 [0],
                 "The internet is a network of interconnected networks, not a single unified network.",
-                "medium"
+                "medium",
+                "networking"
             ),
             QuizQuestion(
                 "After completing a unit of work, a developer likely makes a git...",
                 ["Commit", "Branch", "Merge", "Clone", "Fork"],
                 [0],
                 "Developers commit their completed work to save it to the repository.",
-                "easy"
+                "easy",
+                "git"
             ),
             QuizQuestion(
                 "Imagine you've just made some git commits and are going home for the day. What command should you run before you leave to save your work?",
                 ["`git branch`", "`git merge main`", "`git add`", "`git push`", "`git log`"],
                 [3],
                 "`git push` uploads local commits to the remote repository, ensuring work is backed up.",
-                "medium"
+                "medium",
+                "git"
             ),
             QuizQuestion(
                 "Imagine a developer tries to take credit for another person's work and alters a previous commit to add their name as the author. Why wouldn't this work?",
@@ -669,7 +795,8 @@ class ComprehensiveQuiz:
                 ],
                 [2],
                 "Git commits are immutable - changing any part of a commit (including author) creates a new commit with a different hash.",
-                "hard"
+                "hard",
+                "git"
             ),
             QuizQuestion(
                 "Imagine you're a PM, and a developer tells you they've found a bug in the code. What should you do next?",
@@ -682,21 +809,24 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Bugs should be added to the backlog and prioritized based on severity and impact.",
-                "medium"
+                "medium",
+                "agile"
             ),
             QuizQuestion(
                 "Where are passwords best stored?",
                 ["The client-side", "The server-side", "The network"],
                 [1],
                 "Passwords should be stored server-side with proper hashing and security measures.",
-                "easy"
+                "easy",
+                "fullstack"
             ),
             QuizQuestion(
                 "One of your developers makes a bunch of changes to your HTML structure. You would expect that your design, implemented in CSS, would _likely_:",
                 ["Need fixes", "Still work"],
                 [0],
                 "Changes to HTML structure often require corresponding CSS updates to maintain proper styling.",
-                "medium"
+                "medium",
+                "frontend"
             ),
             QuizQuestion(
                 "Consider these HTTP status codes: 2xx, 3xx, 4xx, 5xx and match them with these lay explanations from the perspective of the server:",
@@ -708,7 +838,8 @@ class ComprehensiveQuiz:
                 ],
                 [0],
                 "2xx = Ok (success), 3xx = see over there (redirection), 4xx = you messed up (client error), 5xx = I messed up (server error).",
-                "hard"
+                "hard",
+                "fullstack"
             )
         ])
         
@@ -720,21 +851,24 @@ class ComprehensiveQuiz:
                 ["Transparency, Inspection, Adaptation", "Planning, Execution, Review", "Design, Build, Test", "Analyze, Design, Implement"],
                 [0],
                 "The three pillars of Scrum are Transparency, Inspection, and Adaptation as defined in the Scrum Guide.",
-                "medium"
+                "medium",
+                "agile"
             ),
             QuizQuestion(
                 "In Scrum, who is responsible for managing the Product Backlog?",
                 ["Scrum Master", "Development Team", "Product Owner", "Stakeholders"],
                 [2],
                 "The Product Owner is solely responsible for managing the Product Backlog according to the Scrum Guide.",
-                "easy"
+                "easy",
+                "agile"
             ),
             QuizQuestion(
                 "What is the maximum recommended duration for a Sprint?",
                 ["1 week", "2 weeks", "4 weeks", "1 month"],
                 [3],
                 "The Scrum Guide states that Sprints are limited to one calendar month, with shorter Sprints being preferred.",
-                "medium"
+                "medium",
+                "agile"
             ),
             QuizQuestion(
                 "According to the Scrum Guide, what happens during the Sprint Planning event?",
@@ -746,7 +880,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Sprint Planning is where the Scrum Team plans the work to be performed in the upcoming Sprint.",
-                "medium"
+                "medium",
+                "agile"
             ),
             QuizQuestion(
                 "What is the purpose of the Daily Scrum according to the Scrum Guide?",
@@ -758,7 +893,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "The Daily Scrum is a 15-minute event to synchronize activities and create a plan for the next 24 hours.",
-                "medium"
+                "medium",
+                "agile"
             ),
             QuizQuestion(
                 "What is the purpose of the Sprint Review in Scrum?",
@@ -770,7 +906,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "The Sprint Review is for inspecting the increment and adapting the Product Backlog based on feedback.",
-                "medium"
+                "medium",
+                "agile"
             ),
             QuizQuestion(
                 "What is the Definition of Done in Scrum?",
@@ -782,7 +919,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "The Definition of Done is a shared understanding of what it means for work to be complete.",
-                "medium"
+                "medium",
+                "agile"
             ),
 
             # Questions based on User Story Primer (https://scalingsoftwareagility.files.wordpress.com/2009/11/user-story-primer_1.pdf)
@@ -796,14 +934,16 @@ class ComprehensiveQuiz:
                 ],
                 [0],
                 "The standard user story format is 'As a [user type], I want [functionality], so that [benefit]'.",
-                "easy"
+                "easy",
+                "agile"
             ),
             QuizQuestion(
                 "What are the three C's of user stories?",
                 ["Card, Conversation, Confirmation", "Create, Complete, Close", "Context, Content, Conclusion", "Capture, Clarify, Confirm"],
                 [0],
                 "The three C's of user stories are Card (physical or digital representation), Conversation (discussion), and Confirmation (acceptance criteria).",
-                "medium"
+                "medium",
+                "agile"
             ),
             QuizQuestion(
                 "What is the primary purpose of user story acceptance criteria?",
@@ -815,7 +955,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Acceptance criteria define the conditions that must be met for a user story to be considered complete and working as intended.",
-                "medium"
+                "medium",
+                "agile"
             ),
             QuizQuestion(
                 "What is the purpose of story points in user stories?",
@@ -827,7 +968,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Story points are used to estimate the relative effort and complexity of user stories.",
-                "medium"
+                "medium",
+                "agile"
             ),
 
             # Questions based on HTML/CSS tutorials (http://learn.shayhowe.com/html-css/building-your-first-web-page/)
@@ -841,14 +983,16 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "The <head> element contains metadata about the document and links to external resources like CSS and JavaScript files.",
-                "easy"
+                "easy",
+                "frontend"
             ),
             QuizQuestion(
                 "Which HTML element is used to create the main heading of a page?",
                 ["<title>", "<h1>", "<header>", "<main>"],
                 [1],
                 "The <h1> element is used for the main heading of a page, representing the most important heading.",
-                "easy"
+                "easy",
+                "frontend"
             ),
             QuizQuestion(
                 "What is the difference between <div> and <span> elements?",
@@ -860,7 +1004,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "<div> is a block-level element that takes up the full width, while <span> is an inline element that only takes up necessary space.",
-                "medium"
+                "medium",
+                "frontend"
             ),
             QuizQuestion(
                 "What is the purpose of CSS selectors?",
@@ -872,7 +1017,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "CSS selectors are used to target specific HTML elements so that styles can be applied to them.",
-                "easy"
+                "easy",
+                "frontend"
             ),
             QuizQuestion(
                 "What does the CSS property 'margin' control?",
@@ -884,7 +1030,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "The margin property controls the space outside an element, between the element and other elements.",
-                "easy"
+                "easy",
+                "frontend"
             ),
             QuizQuestion(
                 "What is the CSS box model composed of?",
@@ -896,7 +1043,8 @@ class ComprehensiveQuiz:
                 ],
                 [0],
                 "The CSS box model consists of content, padding, border, and margin layers.",
-                "medium"
+                "medium",
+                "frontend"
             ),
             QuizQuestion(
                 "What is the purpose of the HTML <meta> viewport tag?",
@@ -908,7 +1056,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "The viewport meta tag controls how the page is displayed on mobile devices, making it responsive.",
-                "medium"
+                "medium",
+                "frontend"
             ),
             QuizQuestion(
                 "What is the purpose of CSS media queries?",
@@ -920,7 +1069,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Media queries apply different CSS styles based on device characteristics like screen size.",
-                "medium"
+                "medium",
+                "frontend"
             ),
 
             # Questions based on JavaScript basics (https://developer.mozilla.org/en-US/docs/Learn/Getting_started_with_the_web/JavaScript_basics)
@@ -934,7 +1084,8 @@ class ComprehensiveQuiz:
                 ],
                 [2],
                 "JavaScript is primarily used to add interactivity and dynamic behavior to web pages.",
-                "easy"
+                "easy",
+                "frontend"
             ),
             QuizQuestion(
                 "What is a variable in JavaScript?",
@@ -946,7 +1097,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "A variable in JavaScript is a container for storing data values that can be referenced and manipulated.",
-                "easy"
+                "easy",
+                "frontend"
             ),
             QuizQuestion(
                 "What is the purpose of the 'addEventListener' method in JavaScript?",
@@ -958,7 +1110,8 @@ class ComprehensiveQuiz:
                 ],
                 [2],
                 "addEventListener is used to attach event handlers to DOM elements, allowing JavaScript to respond to user interactions.",
-                "medium"
+                "medium",
+                "frontend"
             ),
             QuizQuestion(
                 "What is the difference between 'let' and 'var' in JavaScript?",
@@ -970,7 +1123,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "'let' has block scope (limited to the block it's declared in), while 'var' has function scope.",
-                "hard"
+                "hard",
+                "frontend"
             ),
             QuizQuestion(
                 "What is an array in JavaScript?",
@@ -982,7 +1136,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "An array in JavaScript is a collection of values stored in a single variable, accessible by index.",
-                "easy"
+                "easy",
+                "frontend"
             ),
             QuizQuestion(
                 "What is the difference between '==' and '===' in JavaScript?",
@@ -994,7 +1149,8 @@ class ComprehensiveQuiz:
                 ],
                 [2],
                 "'==' compares only values (with type coercion), while '===' compares both value and type.",
-                "hard"
+                "hard",
+                "frontend"
             ),
 
             # Questions based on Git Handbook (https://guides.github.com/introduction/git-handbook/)
@@ -1008,7 +1164,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "'git init' initializes a new Git repository in the current directory, creating a .git folder.",
-                "easy"
+                "easy",
+                "git"
             ),
             QuizQuestion(
                 "What does 'git clone' do?",
@@ -1020,7 +1177,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "'git clone' downloads a complete copy of a remote repository to your local machine.",
-                "easy"
+                "easy",
+                "git"
             ),
             QuizQuestion(
                 "What is the purpose of 'git status'?",
@@ -1032,7 +1190,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "'git status' shows which files have been modified, staged, or are untracked.",
-                "easy"
+                "easy",
+                "git"
             ),
             QuizQuestion(
                 "What is a 'remote' in Git?",
@@ -1044,7 +1203,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "A remote in Git is a version of the repository hosted on another computer or server, typically GitHub or similar.",
-                "medium"
+                "medium",
+                "git"
             ),
             QuizQuestion(
                 "What does 'git branch' do?",
@@ -1056,7 +1216,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "'git branch' lists all local branches, or with a name, creates a new branch.",
-                "easy"
+                "easy",
+                "git"
             ),
             QuizQuestion(
                 "What is the purpose of 'git merge'?",
@@ -1068,7 +1229,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "'git merge' combines changes from different branches into the current branch.",
-                "medium"
+                "medium",
+                "git"
             ),
             QuizQuestion(
                 "What is the purpose of 'git stash'?",
@@ -1080,7 +1242,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "'git stash' temporarily saves uncommitted changes so you can work on something else.",
-                "medium"
+                "medium",
+                "git"
             ),
 
             # Questions based on Go programming (https://tour.golang.org/)
@@ -1094,7 +1257,8 @@ class ComprehensiveQuiz:
                 ],
                 [2],
                 "The main function is the entry point of a Go program, where execution begins.",
-                "easy"
+                "easy",
+                "backend"
             ),
             QuizQuestion(
                 "How do you declare a variable in Go?",
@@ -1106,7 +1270,8 @@ class ComprehensiveQuiz:
                 ],
                 [3],
                 "In Go, you can declare variables with 'var name type' or use short declaration with 'name := value'.",
-                "medium"
+                "medium",
+                "backend"
             ),
             QuizQuestion(
                 "What is a package in Go?",
@@ -1118,7 +1283,8 @@ class ComprehensiveQuiz:
                 ],
                 [0],
                 "A package in Go is a collection of functions, variables, and other code that can be imported and used.",
-                "medium"
+                "medium",
+                "backend"
             ),
             QuizQuestion(
                 "What is the purpose of 'fmt.Println' in Go?",
@@ -1130,7 +1296,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "'fmt.Println' is used to print output to the console in Go programs.",
-                "easy"
+                "easy",
+                "backend"
             ),
             QuizQuestion(
                 "What is a struct in Go?",
@@ -1142,7 +1309,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "A struct in Go is a collection of fields with different types, similar to a class in other languages.",
-                "medium"
+                "medium",
+                "backend"
             ),
             QuizQuestion(
                 "What is the purpose of Go's 'go mod' command?",
@@ -1154,7 +1322,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "'go mod' is used to manage Go modules and dependencies.",
-                "medium"
+                "medium",
+                "backend"
             ),
             QuizQuestion(
                 "What is the purpose of Go's 'go test' command?",
@@ -1166,7 +1335,8 @@ class ComprehensiveQuiz:
                 ],
                 [2],
                 "'go test' runs tests in Go packages, executing test functions.",
-                "medium"
+                "medium",
+                "backend"
             ),
 
             # Questions based on Design Sprint methodology (https://designsprintkit.withgoogle.com/methodology/overview)
@@ -1180,14 +1350,16 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Design sprints focus on solving critical design challenges through rapid prototyping and user testing.",
-                "medium"
+                "medium",
+                "uiux"
             ),
             QuizQuestion(
                 "How long does a typical design sprint last?",
                 ["1 day", "5 days", "2 weeks", "1 month"],
                 [1],
                 "A typical design sprint lasts 5 days, following a structured process from understanding to testing.",
-                "easy"
+                "easy",
+                "uiux"
             ),
             QuizQuestion(
                 "What happens on Day 1 of a design sprint?",
@@ -1199,7 +1371,8 @@ class ComprehensiveQuiz:
                 ],
                 [2],
                 "Day 1 of a design sprint focuses on understanding the problem and setting clear goals.",
-                "medium"
+                "medium",
+                "uiux"
             ),
             QuizQuestion(
                 "What is the purpose of 'How Might We' questions in design sprints?",
@@ -1211,7 +1384,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "'How Might We' questions help reframe problems as opportunities for design solutions.",
-                "medium"
+                "medium",
+                "uiux"
             ),
             QuizQuestion(
                 "What is the role of the 'Decider' in a design sprint?",
@@ -1223,7 +1397,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "The Decider is someone with authority to make final decisions when the team can't reach consensus.",
-                "medium"
+                "medium",
+                "uiux"
             ),
 
             # Questions based on Mobile UX Design principles (https://uxplanet.org/mobile-ux-design-key-principles-dee1a632f9e6)
@@ -1237,7 +1412,8 @@ class ComprehensiveQuiz:
                 ],
                 [0],
                 "The thumb zone refers to the area on a mobile screen that users can comfortably reach with their thumb.",
-                "medium"
+                "medium",
+                "uiux"
             ),
             QuizQuestion(
                 "Why is it important to minimize the number of taps in mobile design?",
@@ -1249,14 +1425,16 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Minimizing taps reduces user friction and makes the mobile experience more efficient and user-friendly.",
-                "medium"
+                "medium",
+                "uiux"
             ),
             QuizQuestion(
                 "What is the recommended minimum touch target size for mobile interfaces?",
                 ["32px", "44px", "56px", "64px"],
                 [1],
                 "The recommended minimum touch target size is 44px to ensure easy tapping on mobile devices.",
-                "hard"
+                "hard",
+                "uiux"
             ),
             QuizQuestion(
                 "Why should important actions be placed in the thumb zone?",
@@ -1268,7 +1446,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Important actions should be in the thumb zone to ensure they're easily accessible during one-handed mobile use.",
-                "medium"
+                "medium",
+                "uiux"
             ),
 
             # Questions based on Web Application Architecture (https://blog.isquaredsoftware.com/2020/11/how-web-apps-work-http-server/)
@@ -1277,7 +1456,8 @@ class ComprehensiveQuiz:
                 ["FTP", "HTTP", "SMTP", "TCP"],
                 [1],
                 "HTTP (HyperText Transfer Protocol) is the primary protocol for web browser-server communication.",
-                "easy"
+                "easy",
+                "fullstack"
             ),
             QuizQuestion(
                 "What is the purpose of a web server?",
@@ -1289,7 +1469,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "A web server processes HTTP requests and serves web content (HTML, CSS, JS, images) to clients.",
-                "easy"
+                "easy",
+                "fullstack"
             ),
             QuizQuestion(
                 "What is the difference between static and dynamic web content?",
@@ -1301,7 +1482,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Static content is served as-is from files, while dynamic content is generated by server-side code on-demand.",
-                "medium"
+                "medium",
+                "fullstack"
             ),
             QuizQuestion(
                 "What is the purpose of middleware in web applications?",
@@ -1313,7 +1495,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Middleware processes requests between the client and server, often handling authentication, logging, or data transformation.",
-                "hard"
+                "hard",
+                "fullstack"
             ),
             QuizQuestion(
                 "What is the role of a database in web applications?",
@@ -1325,7 +1508,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Databases store and retrieve application data, providing persistent storage for web applications.",
-                "easy"
+                "easy",
+                "fullstack"
             ),
             QuizQuestion(
                 "What is the purpose of HTTP headers?",
@@ -1337,7 +1521,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "HTTP headers provide metadata about the request or response, such as content type and caching directives.",
-                "medium"
+                "medium",
+                "fullstack"
             ),
             QuizQuestion(
                 "What is the purpose of HTTP cookies?",
@@ -1349,7 +1534,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "HTTP cookies store data on the client side to maintain state between requests.",
-                "medium"
+                "medium",
+                "fullstack"
             ),
 
             # Additional networking questions based on provided URLs
@@ -1363,7 +1549,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "DNS caching improves performance by storing DNS lookup results to avoid repeated queries.",
-                "medium"
+                "medium",
+                "networking"
             ),
             QuizQuestion(
                 "What is the purpose of TCP's three-way handshake?",
@@ -1375,7 +1562,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "TCP's three-way handshake establishes a reliable connection before data transmission.",
-                "hard"
+                "hard",
+                "networking"
             ),
 
             # Additional UX questions based on provided URLs
@@ -1389,7 +1577,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "User personas represent target users and help designers understand user needs and behaviors.",
-                "medium"
+                "medium",
+                "uiux"
             ),
             QuizQuestion(
                 "What is the purpose of wireframes in UX design?",
@@ -1401,7 +1590,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Wireframes create low-fidelity layouts that focus on structure and content placement.",
-                "medium"
+                "medium",
+                "uiux"
             ),
             QuizQuestion(
                 "What is the purpose of A/B testing in UX design?",
@@ -1413,7 +1603,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "A/B testing compares two versions of a design to determine which performs better with users.",
-                "medium"
+                "medium",
+                "uiux"
             ),
 
             # Additional comprehensive questions from provided URLs
@@ -1428,7 +1619,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "The Development Team is responsible for creating the Sprint Backlog and delivering potentially releasable increments of 'Done' product.",
-                "hard"
+                "hard",
+                "agile"
             ),
             QuizQuestion(
                 "What is the recommended size for a Development Team according to the Scrum Guide?",
@@ -1440,7 +1632,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "The Scrum Guide recommends 3-9 people for the Development Team to maintain effectiveness and communication.",
-                "medium"
+                "medium",
+                "agile"
             ),
             QuizQuestion(
                 "In Scrum, what happens if the Product Owner is not available during Sprint Planning?",
@@ -1452,7 +1645,8 @@ class ComprehensiveQuiz:
                 ],
                 [2],
                 "The Sprint cannot start without the Product Owner, as they are essential for clarifying requirements and answering questions.",
-                "hard"
+                "hard",
+                "agile"
             ),
             QuizQuestion(
                 "What is the purpose of the Sprint Retrospective according to the Scrum Guide?",
@@ -1464,7 +1658,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "The Sprint Retrospective is for the team to inspect itself and create a plan for improvements to be enacted during the next Sprint.",
-                "medium"
+                "medium",
+                "agile"
             ),
 
             # User Story Primer - Advanced concepts
@@ -1478,7 +1673,8 @@ class ComprehensiveQuiz:
                 ],
                 [0],
                 "INVEST stands for Independent, Negotiable, Valuable, Estimable, Small, and Testable - criteria for well-written user stories.",
-                "hard"
+                "hard",
+                "agile"
             ),
             QuizQuestion(
                 "What is the primary purpose of the 'Conversation' aspect of user stories?",
@@ -1490,7 +1686,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "The Conversation aspect of user stories facilitates communication and creates shared understanding between stakeholders.",
-                "medium"
+                "medium",
+                "agile"
             ),
             QuizQuestion(
                 "What is the difference between a user story and a use case?",
@@ -1502,7 +1699,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "User stories are brief, value-focused descriptions, while use cases are detailed specifications of system behavior.",
-                "hard"
+                "hard",
+                "agile"
             ),
 
             # HTML/CSS - Advanced concepts
@@ -1516,7 +1714,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "The <section> element represents a thematic grouping of content, typically with a heading.",
-                "medium"
+                "medium",
+                "frontend"
             ),
             QuizQuestion(
                 "What is the CSS specificity order from highest to lowest?",
@@ -1528,7 +1727,8 @@ class ComprehensiveQuiz:
                 ],
                 [0],
                 "CSS specificity follows: inline styles (highest), IDs, classes, elements (lowest).",
-                "hard"
+                "hard",
+                "frontend"
             ),
             QuizQuestion(
                 "What is the purpose of CSS flexbox?",
@@ -1540,7 +1740,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Flexbox provides a flexible way to layout, align and distribute space among items in a container.",
-                "medium"
+                "medium",
+                "frontend"
             ),
             QuizQuestion(
                 "What is the difference between CSS Grid and Flexbox?",
@@ -1552,7 +1753,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "CSS Grid is designed for 2D layouts (rows and columns), while Flexbox is designed for 1D layouts (either row or column).",
-                "hard"
+                "hard",
+                "frontend"
             ),
             QuizQuestion(
                 "What is the purpose of CSS custom properties (CSS variables)?",
@@ -1564,7 +1766,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "CSS custom properties allow you to store values that can be reused throughout a stylesheet, making CSS more maintainable.",
-                "medium"
+                "medium",
+                "frontend"
             ),
 
             # JavaScript - Advanced concepts
@@ -1578,7 +1781,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "A closure is a function that has access to variables in its outer (enclosing) scope even after the outer function returns.",
-                "hard"
+                "hard",
+                "frontend"
             ),
             QuizQuestion(
                 "What is the difference between 'null' and 'undefined' in JavaScript?",
@@ -1590,7 +1794,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "'null' is an assigned value representing no value, while 'undefined' means a variable has been declared but not assigned a value.",
-                "hard"
+                "hard",
+                "frontend"
             ),
             QuizQuestion(
                 "What is the purpose of the 'this' keyword in JavaScript?",
@@ -1602,7 +1807,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "The 'this' keyword refers to the current object or context, and its value depends on how a function is called.",
-                "hard"
+                "hard",
+                "frontend"
             ),
             QuizQuestion(
                 "What is a Promise in JavaScript?",
@@ -1614,7 +1820,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "A Promise is an object representing the eventual completion or failure of an asynchronous operation.",
-                "hard"
+                "hard",
+                "frontend"
             ),
             QuizQuestion(
                 "What is the purpose of 'async/await' in JavaScript?",
@@ -1626,7 +1833,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "async/await allows you to write asynchronous code in a more readable, synchronous style using Promises.",
-                "hard"
+                "hard",
+                "frontend"
             ),
 
             # Git - Advanced concepts
@@ -1640,7 +1848,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Git rebase reapplies commits on top of another base tip, creating a linear project history.",
-                "hard"
+                "hard",
+                "git"
             ),
             QuizQuestion(
                 "What is the difference between 'git merge' and 'git rebase'?",
@@ -1652,7 +1861,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Merge creates a merge commit combining branches, while rebase replays commits on top of another branch for a linear history.",
-                "hard"
+                "hard",
+                "git"
             ),
             QuizQuestion(
                 "What is the purpose of 'git cherry-pick'?",
@@ -1664,7 +1874,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Git cherry-pick applies the changes from specific commits to the current branch.",
-                "hard"
+                "hard",
+                "git"
             ),
             QuizQuestion(
                 "What is a 'git hook'?",
@@ -1676,7 +1887,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Git hooks are scripts that run automatically at certain points in the Git workflow, like before commits or pushes.",
-                "hard"
+                "hard",
+                "git"
             ),
             QuizQuestion(
                 "What is the purpose of 'git bisect'?",
@@ -1688,7 +1900,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Git bisect uses binary search to find the commit that introduced a bug by testing commits systematically.",
-                "hard"
+                "hard",
+                "git"
             ),
 
             # Go Programming - Advanced concepts
@@ -1702,7 +1915,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Goroutines enable concurrent execution of functions, allowing Go programs to handle multiple tasks simultaneously.",
-                "hard"
+                "hard",
+                "backend"
             ),
             QuizQuestion(
                 "What is a 'channel' in Go?",
@@ -1714,7 +1928,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Channels are communication mechanisms that allow goroutines to send and receive values safely.",
-                "hard"
+                "hard",
+                "backend"
             ),
             QuizQuestion(
                 "What is the purpose of Go's 'interface'?",
@@ -1726,7 +1941,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Go interfaces define a set of method signatures that a type must implement to satisfy the interface.",
-                "hard"
+                "hard",
+                "backend"
             ),
             QuizQuestion(
                 "What is 'garbage collection' in Go?",
@@ -1738,7 +1954,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Garbage collection in Go is automatic memory management that frees memory that is no longer being used.",
-                "medium"
+                "medium",
+                "backend"
             ),
             QuizQuestion(
                 "What is the purpose of Go's 'defer' statement?",
@@ -1750,7 +1967,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "The defer statement schedules a function call to be executed when the surrounding function returns.",
-                "hard"
+                "hard",
+                "backend"
             ),
 
             # Design Sprint - Advanced concepts
@@ -1764,7 +1982,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Crazy 8s is a rapid ideation technique where participants sketch 8 different solutions to a problem in 8 minutes.",
-                "medium"
+                "medium",
+                "uiux"
             ),
             QuizQuestion(
                 "What is the purpose of 'dot voting' in design sprints?",
@@ -1776,7 +1995,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Dot voting allows team members to democratically select the best ideas by placing dots on their preferred options.",
-                "medium"
+                "medium",
+                "uiux"
             ),
             QuizQuestion(
                 "What is the 'Decider' responsible for in a design sprint?",
@@ -1788,7 +2008,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "The Decider has the authority to make final decisions when the team cannot reach consensus during the sprint.",
-                "medium"
+                "medium",
+                "uiux"
             ),
             QuizQuestion(
                 "What happens on Day 3 of a design sprint?",
@@ -1800,7 +2021,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Day 3 focuses on deciding which solutions to pursue and creating a storyboard for the prototype.",
-                "medium"
+                "medium",
+                "uiux"
             ),
 
             # Mobile UX - Advanced concepts
@@ -1814,7 +2036,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "The F-pattern describes how users typically scan content on mobile devices, focusing on the top and left areas.",
-                "hard"
+                "hard",
+                "uiux"
             ),
             QuizQuestion(
                 "What is the purpose of 'progressive disclosure' in mobile design?",
@@ -1826,7 +2049,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Progressive disclosure shows only essential information initially and reveals more details as the user needs them.",
-                "hard"
+                "hard",
+                "uiux"
             ),
             QuizQuestion(
                 "What is the 'fat finger problem' in mobile design?",
@@ -1838,7 +2062,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "The fat finger problem refers to accidental taps caused by touch targets being too small or too close together.",
-                "medium"
+                "medium",
+                "uiux"
             ),
             QuizQuestion(
                 "What is the purpose of 'gesture-based navigation' in mobile design?",
@@ -1850,7 +2075,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Gesture-based navigation provides intuitive ways to navigate mobile apps using touch gestures like swiping and pinching.",
-                "medium"
+                "medium",
+                "uiux"
             ),
 
             # Web Architecture - Advanced concepts
@@ -1864,7 +2090,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Load balancing distributes incoming requests across multiple servers to improve performance, reliability, and availability.",
-                "hard"
+                "hard",
+                "fullstack"
             ),
             QuizQuestion(
                 "What is the difference between 'stateless' and 'stateful' web applications?",
@@ -1876,7 +2103,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Stateless applications don't store client data between requests, while stateful applications maintain client state.",
-                "hard"
+                "hard",
+                "fullstack"
             ),
             QuizQuestion(
                 "What is the purpose of 'CDN' (Content Delivery Network)?",
@@ -1888,7 +2116,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "CDNs deliver content from servers geographically closer to users, reducing latency and improving performance.",
-                "medium"
+                "medium",
+                "fullstack"
             ),
             QuizQuestion(
                 "What is 'caching' in web applications?",
@@ -1900,7 +2129,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Caching stores frequently accessed data in memory or fast storage to enable quicker retrieval and better performance.",
-                "medium"
+                "medium",
+                "fullstack"
             ),
             QuizQuestion(
                 "What is the purpose of 'API versioning'?",
@@ -1912,7 +2142,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "API versioning allows maintaining backward compatibility while introducing new features and changes to the API.",
-                "hard"
+                "hard",
+                "fullstack"
             ),
 
             # Networking - Advanced concepts
@@ -1926,7 +2157,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "HTTPS provides secure communication over HTTP by encrypting the data transmitted between client and server.",
-                "medium"
+                "medium",
+                "networking"
             ),
             QuizQuestion(
                 "What is the difference between 'TCP' and 'UDP'?",
@@ -1938,7 +2170,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "TCP provides reliable, connection-oriented communication, while UDP is faster but unreliable and connectionless.",
-                "hard"
+                "hard",
+                "networking"
             ),
             QuizQuestion(
                 "What is the purpose of 'DNS'?",
@@ -1950,7 +2183,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "DNS (Domain Name System) translates human-readable domain names to IP addresses that computers can understand.",
-                "easy"
+                "easy",
+                "networking"
             ),
             QuizQuestion(
                 "What is 'latency' in networking?",
@@ -1962,7 +2196,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Latency is the time it takes for data to travel from source to destination, often measured in milliseconds.",
-                "medium"
+                "medium",
+                "networking"
             ),
 
             # Additional practical scenario questions
@@ -1976,7 +2211,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Product Owners should first evaluate new requests against the product vision and current priorities before making decisions.",
-                "hard"
+                "hard",
+                "agile"
             ),
             QuizQuestion(
                 "You're designing a mobile app for food delivery. What should be your primary consideration for the checkout button?",
@@ -1988,7 +2224,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "For critical actions like checkout, the button should be in the thumb zone and large enough for easy one-handed use.",
-                "medium"
+                "medium",
+                "uiux"
             ),
             QuizQuestion(
                 "Your web application is experiencing slow loading times. What should you investigate first?",
@@ -2000,7 +2237,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Performance issues should be investigated by looking at database queries, image optimization, and caching strategies.",
-                "hard"
+                "hard",
+                "fullstack"
             ),
             QuizQuestion(
                 "You need to implement user authentication in your web application. Where should the password validation logic be placed?",
@@ -2012,7 +2250,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Password validation should be on both sides, but server-side validation is critical for security as client-side can be bypassed.",
-                "hard"
+                "hard",
+                "backend"
             ),
             QuizQuestion(
                 "Your team is using Git for version control. A developer accidentally committed sensitive data. What should you do?",
@@ -2024,7 +2263,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Sensitive data in Git history should be removed using history rewriting tools, as simply deleting files doesn't remove them from history.",
-                "hard"
+                "hard",
+                "git"
             )
         ])
         
@@ -2040,7 +2280,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "The Sprint's primary purpose is to create a 'Done' increment of potentially releasable functionality, following the Scrum Guide principles.",
-                "medium"
+                "medium",
+                "agile"
             ),
             QuizQuestion(
                 "In Scrum, who is responsible for ensuring that the Development Team understands the items in the Product Backlog?",
@@ -2052,7 +2293,8 @@ class ComprehensiveQuiz:
                 ],
                 [2],
                 "The Product Owner is responsible for ensuring the Development Team understands the Product Backlog items to the level needed.",
-                "medium"
+                "medium",
+                "agile"
             ),
             QuizQuestion(
                 "What is the recommended format for writing user stories according to the User Story Primer?",
@@ -2064,7 +2306,8 @@ class ComprehensiveQuiz:
                 ],
                 [0],
                 "The standard user story format is 'As a [user type], I want [functionality] so that [benefit]' as outlined in the User Story Primer.",
-                "easy"
+                "easy",
+                "agile"
             ),
             QuizQuestion(
                 "Which of the following are characteristics of a good user story? (Select all that apply)",
@@ -2078,7 +2321,8 @@ class ComprehensiveQuiz:
                 ],
                 [0, 1, 2, 3, 4, 5],
                 "Good user stories follow the INVEST criteria: Independent, Negotiable, Valuable, Estimable, Small, and Testable.",
-                "hard"
+                "hard",
+                "agile"
             ),
             QuizQuestion(
                 "What is the maximum recommended duration for a Sprint according to the Scrum Guide?",
@@ -2090,7 +2334,8 @@ class ComprehensiveQuiz:
                 ],
                 [2],
                 "The Scrum Guide states that Sprints are limited to one calendar month, with 4 weeks being the maximum recommended duration.",
-                "easy"
+                "easy",
+                "agile"
             ),
             QuizQuestion(
                 "In Scrum, what happens if the Product Owner is not available during a Sprint?",
@@ -2102,7 +2347,8 @@ class ComprehensiveQuiz:
                 ],
                 [3],
                 "If the Product Owner is unavailable, the Sprint continues but no new work can be started, as only the Product Owner can clarify requirements.",
-                "hard"
+                "hard",
+                "agile"
             )
         ])
         
@@ -2118,7 +2364,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Semantic HTML elements provide meaning and structure to content, making it more accessible and maintainable.",
-                "medium"
+                "medium",
+                "frontend"
             ),
             QuizQuestion(
                 "In CSS, what does the 'cascading' in Cascading Style Sheets refer to?",
@@ -2130,7 +2377,8 @@ class ComprehensiveQuiz:
                 ],
                 [0],
                 "Cascading refers to how CSS determines which styles to apply when multiple rules target the same element, based on specificity and source order.",
-                "hard"
+                "hard",
+                "frontend"
             ),
             QuizQuestion(
                 "Which HTML element is most appropriate for marking up the main content of a webpage?",
@@ -2142,7 +2390,8 @@ class ComprehensiveQuiz:
                 ],
                 [2],
                 "The <main> element is specifically designed to contain the main content of a webpage, as recommended in modern HTML standards.",
-                "medium"
+                "medium",
+                "frontend"
             ),
             QuizQuestion(
                 "What is the correct way to link an external CSS file in HTML?",
@@ -2154,7 +2403,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "External CSS files are linked using the <link> element with rel='stylesheet' and href attributes.",
-                "easy"
+                "easy",
+                "frontend"
             ),
             QuizQuestion(
                 "In CSS, what does the box model consist of? (Select all that apply)",
@@ -2167,7 +2417,8 @@ class ComprehensiveQuiz:
                 ],
                 [0, 1, 2, 3],
                 "The CSS box model consists of content, padding, border, and margin. Outline is separate from the box model.",
-                "medium"
+                "medium",
+                "frontend"
             ),
             QuizQuestion(
                 "What is the difference between <div> and <span> elements in HTML?",
@@ -2179,7 +2430,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "<div> is a block-level element that creates line breaks, while <span> is an inline element that flows with text.",
-                "easy"
+                "easy",
+                "frontend"
             )
         ])
         
@@ -2195,7 +2447,8 @@ class ComprehensiveQuiz:
                 ],
                 [2],
                 "JavaScript's primary purpose is to add interactivity and dynamic behavior to web pages.",
-                "easy"
+                "easy",
+                "frontend"
             ),
             QuizQuestion(
                 "Which of the following is a valid way to declare a variable in JavaScript?",
@@ -2207,7 +2460,8 @@ class ComprehensiveQuiz:
                 ],
                 [3],
                 "JavaScript supports var, let, and const for variable declaration, each with different scoping rules.",
-                "medium"
+                "medium",
+                "frontend"
             ),
             QuizQuestion(
                 "What does the DOM (Document Object Model) represent in JavaScript?",
@@ -2219,7 +2473,8 @@ class ComprehensiveQuiz:
                 ],
                 [2],
                 "The DOM represents HTML elements as objects that JavaScript can interact with to modify page content and behavior.",
-                "medium"
+                "medium",
+                "frontend"
             ),
             QuizQuestion(
                 "Which JavaScript method is used to select an element by its ID?",
@@ -2231,7 +2486,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "getElementById() is the specific method for selecting elements by their ID attribute.",
-                "easy"
+                "easy",
+                "frontend"
             ),
             QuizQuestion(
                 "What is the difference between == and === in JavaScript?",
@@ -2243,7 +2499,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "== performs type coercion before comparison, while === compares both value and type without coercion.",
-                "medium"
+                "medium",
+                "frontend"
             ),
             QuizQuestion(
                 "Which of the following are JavaScript data types? (Select all that apply)",
@@ -2258,7 +2515,8 @@ class ComprehensiveQuiz:
                 ],
                 [0, 1, 2, 3, 4, 5, 6],
                 "JavaScript has six primitive data types: String, Number, Boolean, Undefined, Null, and Symbol, plus Object.",
-                "hard"
+                "hard",
+                "frontend"
             )
         ])
         
@@ -2274,7 +2532,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Git is a distributed version control system designed to track changes and manage different versions of code.",
-                "easy"
+                "easy",
+                "git"
             ),
             QuizQuestion(
                 "Which Git command is used to create a new branch?",
@@ -2286,7 +2545,8 @@ class ComprehensiveQuiz:
                 ],
                 [2, 3],
                 "Both 'git branch <name>' and 'git checkout -b <name>' can create new branches, with checkout -b also switching to the new branch.",
-                "medium"
+                "medium",
+                "git"
             ),
             QuizQuestion(
                 "What does 'git clone' do?",
@@ -2298,7 +2558,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "git clone downloads a complete copy of an existing repository to your local machine.",
-                "easy"
+                "easy",
+                "git"
             ),
             QuizQuestion(
                 "Which of the following are Git workflow stages? (Select all that apply)",
@@ -2310,7 +2571,8 @@ class ComprehensiveQuiz:
                 ],
                 [0, 1, 2, 3],
                 "Git has four main areas: Working Directory (untracked changes), Staging Area (staged changes), Local Repository (committed changes), and Remote Repository (shared changes).",
-                "hard"
+                "hard",
+                "git"
             ),
             QuizQuestion(
                 "What is the purpose of 'git pull'?",
@@ -2322,7 +2584,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "git pull downloads changes from the remote repository and merges them into your current branch.",
-                "medium"
+                "medium",
+                "git"
             ),
             QuizQuestion(
                 "Which command shows the commit history in Git?",
@@ -2334,7 +2597,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "git log displays the commit history with details about each commit.",
-                "easy"
+                "easy",
+                "git"
             )
         ])
         
@@ -2350,7 +2614,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Go's main advantages are its fast compilation to native code and built-in concurrency features like goroutines.",
-                "medium"
+                "medium",
+                "backend"
             ),
             QuizQuestion(
                 "In Go, what is a goroutine?",
@@ -2362,7 +2627,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Goroutines are lightweight threads managed by the Go runtime, enabling efficient concurrent programming.",
-                "hard"
+                "hard",
+                "backend"
             ),
             QuizQuestion(
                 "What is the main purpose of a web server in backend development?",
@@ -2374,7 +2640,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Web servers primarily handle HTTP requests from clients and send back appropriate responses.",
-                "easy"
+                "easy",
+                "backend"
             ),
             QuizQuestion(
                 "Which of the following are common backend development tasks? (Select all that apply)",
@@ -2387,7 +2654,8 @@ class ComprehensiveQuiz:
                 ],
                 [0, 1, 2, 3],
                 "Backend development focuses on server-side tasks like APIs, databases, security, and business logic, not UI design.",
-                "medium"
+                "medium",
+                "backend"
             ),
             QuizQuestion(
                 "What does REST stand for in API development?",
@@ -2399,7 +2667,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "REST stands for Representational State Transfer, a popular architectural style for web APIs.",
-                "medium"
+                "medium",
+                "backend"
             ),
             QuizQuestion(
                 "In server-side development, what is middleware?",
@@ -2411,7 +2680,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Middleware is software that executes between receiving a request and sending a response, often handling cross-cutting concerns.",
-                "hard"
+                "hard",
+                "backend"
             )
         ])
         
@@ -2427,7 +2697,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Design Sprints focus on rapidly testing and validating ideas with users to reduce risk and uncertainty.",
-                "medium"
+                "medium",
+                "uiux"
             ),
             QuizQuestion(
                 "According to mobile UX principles, what is the recommended minimum touch target size?",
@@ -2439,7 +2710,8 @@ class ComprehensiveQuiz:
                 ],
                 [2],
                 "The recommended minimum touch target size for mobile interfaces is 44px to ensure easy interaction.",
-                "hard"
+                "hard",
+                "uiux"
             ),
             QuizQuestion(
                 "What is the purpose of user personas in UX design?",
@@ -2451,7 +2723,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "User personas represent target users and their needs, helping designers make user-centered decisions.",
-                "medium"
+                "medium",
+                "uiux"
             ),
             QuizQuestion(
                 "Which of the following are key principles of mobile UX design? (Select all that apply)",
@@ -2464,7 +2737,8 @@ class ComprehensiveQuiz:
                 ],
                 [0, 1, 2, 3, 4],
                 "All of these are key principles for effective mobile UX design.",
-                "hard"
+                "hard",
+                "uiux"
             ),
             QuizQuestion(
                 "What is the main benefit of conducting user testing?",
@@ -2476,7 +2750,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "User testing helps identify usability issues early, preventing costly fixes after launch.",
-                "medium"
+                "medium",
+                "uiux"
             ),
             QuizQuestion(
                 "In design thinking, what does 'empathize' mean?",
@@ -2488,7 +2763,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Empathize is the first stage of design thinking, focusing on understanding users' needs and challenges.",
-                "easy"
+                "easy",
+                "uiux"
             )
         ])
         
@@ -2504,7 +2780,8 @@ class ComprehensiveQuiz:
                 ],
                 [0],
                 "HTTP stands for HyperText Transfer Protocol, the foundation of data communication on the web.",
-                "easy"
+                "easy",
+                "fullstack"
             ),
             QuizQuestion(
                 "What is the difference between HTTP and HTTPS?",
@@ -2516,7 +2793,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "HTTPS adds SSL/TLS encryption to HTTP, providing secure communication between client and server.",
-                "medium"
+                "medium",
+                "fullstack"
             ),
             QuizQuestion(
                 "In a typical web application architecture, what role does the client play?",
@@ -2528,7 +2806,8 @@ class ComprehensiveQuiz:
                 ],
                 [2],
                 "The client (browser) sends requests to the server and displays the responses to users.",
-                "easy"
+                "easy",
+                "fullstack"
             ),
             QuizQuestion(
                 "What is the purpose of a web server in a web application?",
@@ -2540,7 +2819,8 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "Web servers process incoming requests and generate appropriate responses, often by executing server-side code.",
-                "medium"
+                "medium",
+                "fullstack"
             ),
             QuizQuestion(
                 "Which of the following are common HTTP methods? (Select all that apply)",
@@ -2553,7 +2833,8 @@ class ComprehensiveQuiz:
                 ],
                 [0, 1, 2, 3, 4],
                 "All of these are standard HTTP methods used for different types of operations on web resources.",
-                "medium"
+                "medium",
+                "fullstack"
             ),
             QuizQuestion(
                 "What happens when a user types a URL into their browser?",
@@ -2565,198 +2846,408 @@ class ComprehensiveQuiz:
                 ],
                 [1],
                 "When a URL is entered, the browser sends an HTTP request to the server to fetch the requested resource.",
-                "easy"
+                "easy",
+                "fullstack"
             )
         ])
         
         return questions
     
-    def start_quiz(self, num_questions: int = None, difficulty: str = None):
+    def start_quiz(self, num_questions: int = None, difficulty: str = None, topic: str = None,
+                   blueprint: Blueprint = None):
         """Start the quiz with specified parameters"""
-        print("=" * 80)
-        print("🎯 COMPREHENSIVE 656.MBA EXAM PREPARATION QUIZ")
-        print("=" * 80)
-        print("This quiz covers all topics from your desktop quizzes:")
-        print("• Agile/Scrum Methodology")
-        print("• Front-end Development (HTML, CSS, JavaScript)")
-        print("• Back-end Development (Go, web frameworks)")
-        print("• Full-stack Development (HTTP, routing, client-server)")
-        print("• Networking and Communication (TCP/IP, DNS)")
-        print("• Version Control (Git)")
-        print("• UI/UX Design (Design sprints, mobile design)")
-        print("=" * 80)
+        # Randomly select questions, filtered by difficulty and topic or drawn to a blueprint
+        if num_questions is None:
+            num_questions = 50
+        seed = self.next_seed()
+        if self.target_se is not None:
+            self._start_adaptive(num_questions, topic, seed)
+            return
+        selected_ids, selected_questions, option_orders = self.build_form(
+            seed, num_questions, difficulty, topic, self.shuffle_options, blueprint)
+        if not selected_questions and self.review is not None:
+            next_due = self.review.next_due()
+            self._write(render_banner() + render_nothing_due(
+                None if next_due is None else time.strftime("%Y-%m-%d %H:%M", time.localtime(next_due))))
+            return
+        if not selected_questions:
+            self._write(render_banner() + render_no_questions(difficulty, topic))
+            return
+        num_questions = len(selected_questions)
         
-        # Filter questions by difficulty if specified
-        available_questions = self.questions
-        if difficulty:
-            available_questions = [q for q in self.questions if q.difficulty == difficulty]
-            if not available_questions:
-                print(f"❌ No questions found for difficulty level: {difficulty}")
-                return
+        self._write(render_banner()
+                    + render_config(num_questions, difficulty, topic,
+                                    format_blueprint(blueprint) if blueprint else None)
+                    + "Press Enter to start the quiz...")
+        input()
         
-        # Set number of questions
-        if num_questions is None:
-            num_questions = min(50, len(available_questions))
-        else:
-            num_questions = min(num_questions, len(available_questions))
+        self.session = self._new_session(selected_ids, selected_questions, difficulty, topic,
+                                         seed, option_orders)
+        self.difficulty = difficulty
+        self.topic = topic
+        self._run_session()
+    
+    def _start_adaptive(self, max_questions: int, topic: str, seed: int):
+        """Start an adaptive quiz of at most max_questions, ending early once the estimate is precise"""
+        session = self._new_adaptive_session(max_questions, topic, seed)
+        if session.finished:
+            self._write(render_banner() + render_no_questions(None, topic))
+            return
+        self._write(render_banner()
+                    + render_config(self.adaptive.max_items, None, topic, target_se=self.target_se)
+                    + "Press Enter to start the quiz...")
+        input()
+        self.session = session
+        self.difficulty = None
+        self.topic = topic
+        self._run_session()
+    
+    def resume_quiz(self, checkpoint_path: str):
+        """Resume an interrupted quiz at the first unanswered question"""
+        self.session = self.load_session(checkpoint_path)
+        session = self.session
+        self._write(f"🔁 Resuming quiz at question {session.position + 1} of {len(session.questions)} "
+                    f"({session.result.score} correct so far)\nPress Enter to continue...")
+        input()
+        self._run_session()
+    
+    def _run_session(self):
+        """Ask the remaining questions of self.session, then show the results"""
+        session = self.session
         
-        # Randomly select questions
-        selected_questions = random.sample(available_questions, num_questions)
+        # Start the quiz; an adaptive session grows by one question per answer until it ends
+        total = self.adaptive.max_items if self.adaptive is not None else len(session.questions)
+        while not session.finished:
+            i = session.position
+            self._ask_question(session.questions[i], i + 1, total)
         
-        print(f"\n📊 Quiz Configuration:")
-        print(f"   • Total questions: {num_questions}")
-        print(f"   • Difficulty filter: {difficulty or 'All levels'}")
-        print(f"   • Time limit: None (take your time!)")
-        print("\n" + "=" * 80)
+        self._finish_checkpoint()
+        self._show_results()
+    
+    def _write(self, text: str):
+        """Write a fully composed screen with a single write and flush"""
+        output = self.output or sys.stdout
+        output.write(text)
+        output.flush()
+    
+    def run_headless(self, answers: Iterable[str], num_questions: int = None,
+                     difficulty: str = None, topic: str = None,
+                     session: QuizSession = None, blueprint: Blueprint = None) -> QuizResult:
+        """Run a quiz without a terminal, taking typed answers from an iterable.
         
-        input("Press Enter to start the quiz...")
+        Malformed answers are skipped, as the interactive prompt would re-ask.
+        If answers run out early the result covers the questions answered so far.
+        Pass a session (e.g. from load_session) to continue it instead of starting one.
+        """
+        if session is None and self.target_se is not None:
+            session = self._new_adaptive_session(50 if num_questions is None else num_questions,
+                                                 topic, self.next_seed())
+            self.difficulty = None
+            self.topic = topic
+        if session is None:
+            if num_questions is None:
+                num_questions = 50
+            seed = self.next_seed()
+            selected_ids, selected_questions, option_orders = self.build_form(
+                seed, num_questions, difficulty, topic, self.shuffle_options, blueprint)
+            session = self._new_session(selected_ids, selected_questions, difficulty, topic,
+                                        seed, option_orders)
+            self.difficulty = difficulty
+            self.topic = topic
+        self.session = session
+        answers = iter(answers)
         
-        self.total_questions = num_questions
-        self.score = 0
-        self.current_question = 0
-        self.incorrect_answers = []
+        while not session.finished:
+            think_started = time.perf_counter()
+            text = next(answers, None)
+            if text is None:
+                break
+            try:
+                session.submit_text(text, think_seconds=time.perf_counter() - think_started)
+            except AnswerError:
+                continue
         
-        # Start the quiz
-        for i, question in enumerate(selected_questions, 1):
-            self.current_question = i
-            self._ask_question(question, i, num_questions)
+        if session.finished:
+            self._finish_checkpoint()
+        return session.result
+    
+    def _new_session(self, question_ids: List[int], questions: List[QuizQuestion],
+                     difficulty: str = None, topic: str = None, seed: int = None,
+                     option_orders: List[Tuple[int, ...]] = None) -> QuizSession:
+        """Create a session for the selected questions with this quiz's listeners attached"""
+        session = QuizSession(questions, question_ids, student=self.student, seed=seed,
+                              option_orders=option_orders)
+        if self.checkpoint_path:
+            self.checkpoint = Checkpoint.create(self.checkpoint_path, session, difficulty=difficulty,
+                                                topic=topic, bank=_bank_key(self.bank_path))
+        self._attach_listeners(session)
+        return session
+    
+    def _new_adaptive_session(self, max_questions: int, topic: str = None, seed: int = None
+                              ) -> QuizSession:
+        """Create an adaptive session holding its first question, with listeners attached"""
+        pool = self._item_pools.get(topic)
+        if pool is None:
+            pool = self._item_pools[topic] = ItemPool(self.index, self.irt_params, topic)
+        self.adaptive = AdaptiveTest(pool, self.questions.__getitem__, max_items=max_questions,
+                                     target_se=self.target_se, rng=random.Random(seed))
+        session = self.adaptive.start_session(self.student)
+        session.seed = seed
+        self._attach_listeners(session)
+        return session
+    
+    def _attach_listeners(self, session: QuizSession):
+        if self.event_log is not None:
+            session.listeners.append(self.event_log.record_answer)
+        if self.checkpoint is not None:
+            session.listeners.append(self.checkpoint.record_answer)
+        if self.practice is not None:
+            session.listeners.append(self.practice.record_answer)
+        if self.review is not None:
+            session.listeners.append(self.review.record_answer)
+    
+    def load_session(self, checkpoint_path: str) -> QuizSession:
+        """Rebuild a session from a checkpoint without re-sampling; later answers keep appending to it"""
+        header, answers = load_checkpoint(checkpoint_path)
+        if _bank_key(header.get("bank")) != _bank_key(self.bank_path):
+            raise CheckpointError(f"checkpoint was written for bank {header.get('bank') or 'built-in'}")
+        session = restore_session(header, answers, self._questions_by_id)
+        self.difficulty = header.get("difficulty")
+        self.topic = header.get("topic")
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint = Checkpoint(checkpoint_path)
+        self._attach_listeners(session)
+        return session
+    
+    def _finish_checkpoint(self):
+        """Delete the checkpoint of a session that has been answered to the end"""
+        if self.checkpoint is not None and self.session.finished:
+            self.checkpoint.finish()
+            self.checkpoint = None
+    
+    def _questions_by_id(self, question_ids: List[int]) -> List[QuizQuestion]:
+        if self.questions is None:
+            return question_bank.questions_by_id(self.bank_path, question_ids)
+        return [self.questions[i] for i in question_ids]
+    
+    def require_index(self, mode: str):
+        """Raise QuizModeError unless the bank is indexed, as mode needs"""
+        if self.index is None:
+            raise QuizModeError(f"{mode} needs an indexed bank (built-in or .qstore)")
+    
+    def enable_practice(self, history: Iterable[Tuple[int, bool]] = ()):
+        """Favor questions the student keeps missing, given past (question_id, correct) answers"""
+        self.require_index("practice mode")
+        self.practice = PracticeWeights(self.index, history)
+    
+    def enable_review(self, schedule: ReviewSchedule, new_per_review: int = 10):
+        """Serve due spaced-repetition cards, topped up with up to new_per_review new questions"""
+        self.require_index("review mode")
+        self.review = schedule
+        self.new_per_review = new_per_review
+    
+    def enable_adaptive(self, target_se: float = 0.4, irt_params: Dict[int, Tuple[float, float]] = None):
+        """Pick each question from a running ability estimate, stopping once its standard error is target_se.
         
-        self._show_results()
+        irt_params holds calibrated (a, b) by question id; other questions are placed by their label.
+        """
+        self.require_index("adaptive mode")
+        self.target_se = target_se
+        self.irt_params = irt_params
+        self._item_pools.clear()
     
-    def _ask_question(self, question: QuizQuestion, question_num: int, total: int):
-        """Ask a single question and handle the response"""
-        print(f"\n{'='*80}")
-        print(f"Question {question_num} of {total} | Difficulty: {question.difficulty.upper()}")
-        print(f"{'='*80}")
-        print(f"\n{question.question}")
+    def next_seed(self) -> int:
+        """Seed for the next session: fixed by (exam, student) when both are known"""
+        if self.exam and self.student:
+            return session_seed(self.exam, self.student)
+        return random.getrandbits(64)
+    
+    def build_form(self, seed: int, num_questions: int, difficulty: str = None, topic: str = None,
+                   shuffle_options: bool = False, blueprint: Blueprint = None
+                   ) -> Tuple[List[int], List[QuizQuestion], Optional[List[Tuple[int, ...]]]]:
+        """Generate the form for a seed; the same seed and settings always give the same form.
         
-        if len(question.correct_answers) > 1:
-            print("\n(Select ALL correct answers - separate multiple choices with commas)")
+        Returns the question ids, the questions (with options in display order) and, if
+        shuffled, each question's option order. Forms are cached by seed and settings, so
+        regenerating one only looks its questions up again. Practice and review forms
+        depend on the student's changing history, so they are never cached.
+        """
+        key = (seed, num_questions, difficulty, topic, shuffle_options, blueprint)
+        cacheable = self.practice is None and self.review is None
+        form = self._forms.get(key) if cacheable else None
+        if form is not None:
+            self._forms.move_to_end(key)
+            question_ids, option_orders = form
+            questions = self._questions_by_id(question_ids)
+        else:
+            rng = random.Random(seed)
+            question_ids, questions = self.select_questions(num_questions, difficulty, topic, rng,
+                                                            blueprint)
+            option_orders = None
+            if shuffle_options:
+                option_orders = [tuple(rng.sample(range(len(question.options)), len(question.options)))
+                                 for question in questions]
+            if cacheable:
+                self._forms[key] = (question_ids, option_orders)
+            if len(self._forms) > FORM_CACHE_SIZE:
+                self._forms.popitem(last=False)
+        if option_orders is not None:
+            questions = [question.shuffled(order) for question, order in zip(questions, option_orders)]
+        return question_ids, questions, option_orders
+    
+    def select_questions(self, num_questions: int, difficulty: str = None, topic: str = None,
+                         rng: random.Random = None, blueprint: Blueprint = None
+                         ) -> Tuple[List[int], List[QuizQuestion]]:
+        """Randomly pick up to num_questions questions, optionally of one difficulty and topic.
         
-        print("\nOptions:")
-        for i, option in enumerate(question.options, 1):
-            print(f"  {i}. {option}")
+        With a blueprint, the questions are instead drawn stratum by stratum and the
+        other filters are ignored. Returns the picked questions' bank positions
+        alongside the questions. Pass a seeded rng to make the selection reproducible.
+        In practice mode, questions are drawn in proportion to their practice weights;
+        in review mode, due cards come first (most overdue first), then new questions.
+        """
+        rng = rng or random
+        if blueprint is not None:
+            if self.index is None:
+                raise BlueprintError("blueprints need an indexed bank (built-in or .qstore)")
+            selected_ids = sample_blueprint(self.index, blueprint, rng)
+            return selected_ids, [self.questions[i] for i in selected_ids]
+        if self.practice is not None:
+            selected_ids = self.practice.sample(num_questions, difficulty, topic, rng)
+            return selected_ids, [self.questions[i] for i in selected_ids]
+        if self.review is not None:
+            selected_ids = self.review.pick(num_questions, self.new_per_review, self.index,
+                                            difficulty, topic, rng)
+            return selected_ids, [self.questions[i] for i in selected_ids]
+        if self.questions is None:
+            # Streamed bank: only the picked questions are ever built
+            picked = question_bank.sample_lines(self.bank_path, num_questions, difficulty,
+                                                rng, topic)
+            return ([question_id for question_id, _ in picked],
+                    [QuizQuestion.from_record(json.loads(line)) for _, line in picked])
+        
+        # Sample positions rather than objects so a store only decodes what is picked
+        available_ids = self.index.select(difficulty, topic)
+        selected_ids = rng.sample(available_ids, min(num_questions, len(available_ids)))
+        return selected_ids, [self.questions[i] for i in selected_ids]
+    
+    def _ask_question(self, question: QuizQuestion, question_num: int, total: int):
+        """Ask a single question and handle the response"""
+        render_started = time.perf_counter()
+        prompt = render_answer_prompt(question)
+        self._write(render_question(question, question_num, total) + prompt)
+        render_seconds = time.perf_counter() - render_started
         
-        # Get user input
+        # Get user input; think time covers every re-prompt
+        think_started = time.perf_counter()
         while True:
             try:
-                user_input = input(f"\nYour answer(s) (1-{len(question.options)}): ").strip()
-                if not user_input:
-                    print("Please enter an answer.")
-                    continue
-                
-                # Parse multiple answers
-                if ',' in user_input:
-                    user_answers = [int(x.strip()) - 1 for x in user_input.split(',')]
-                else:
-                    user_answers = [int(user_input) - 1]
-                
-                # Validate input
-                if any(ans < 0 or ans >= len(question.options) for ans in user_answers):
-                    print(f"Please enter numbers between 1 and {len(question.options)}")
-                    continue
-                
+                user_answers = parse_answer(input(), len(question.options))
                 break
-            except ValueError:
-                print("Please enter valid numbers.")
+            except AnswerError as e:
+                self._write(f"{e}\n{prompt}")
                 continue
+        think_seconds = time.perf_counter() - think_started
         
         # Check answers
-        user_answers.sort()
-        correct_answers = sorted(question.correct_answers)
-        
-        if user_answers == correct_answers:
-            self.score += 1
-            print("\n✅ CORRECT!")
-        else:
-            print("\n❌ INCORRECT!")
-            self.incorrect_answers.append({
-                'question': question,
-                'user_answers': user_answers,
-                'correct_answers': correct_answers,
-                'question_num': question_num
-            })
-        
-        # Show explanation if available
-        if question.explanation:
-            print(f"\n💡 Explanation: {question.explanation}")
+        record = self.session.submit(user_answers, render_seconds, think_seconds)
         
-        # Show correct answers
-        correct_indices = [i + 1 for i in correct_answers]
-        print(f"\n📝 Correct answer(s): {', '.join(map(str, correct_indices))}")
-        
-        input("\nPress Enter to continue...")
+        self._write(render_feedback(record) + "\nPress Enter to continue...")
+        input()
     
     def _show_results(self):
         """Display the final quiz results"""
-        print("\n" + "="*80)
-        print("🏁 QUIZ COMPLETE!")
-        print("="*80)
-        
-        percentage = (self.score / self.total_questions) * 100
-        
-        print(f"\n📊 FINAL SCORE: {self.score}/{self.total_questions} ({percentage:.1f}%)")
-        
-        # Simple message based on performance
-        if percentage >= 80:
-            message = "Great job! Keep up the good work!"
-        elif percentage >= 60:
-            message = "Good effort! Review the incorrect answers to improve."
-        else:
-            message = "Keep studying! Review the material and try again."
-        
-        print(f"\n💬 {message}")
-        
-        # Show incorrect answers for review
-        if self.incorrect_answers:
-            print(f"\n📝 INCORRECT ANSWERS TO REVIEW:")
-            print("="*50)
-            
-            for item in self.incorrect_answers:
-                q = item['question']
-                user_ans = [i + 1 for i in item['user_answers']]
-                correct_ans = [i + 1 for i in item['correct_answers']]
-                
-                print(f"\nQuestion {item['question_num']}: {q.question}")
-                print(f"Your answer(s): {', '.join(map(str, user_ans))}")
-                print(f"Correct answer(s): {', '.join(map(str, correct_ans))}")
-                if q.explanation:
-                    print(f"Explanation: {q.explanation}")
-                print("-" * 50)
-        
-        print(f"\n🔄 Want to retake the quiz? Run the script again!")
-        print("="*80)
+        result = self.session.result
+        ability = self.adaptive.summary() if self.adaptive is not None else None
+        self._write(render_results(result, session_timing(result), ability))
 
-def main():
-    """Main function to run the quiz"""
-    quiz = ComprehensiveQuiz()
+def _bank_key(bank_path: Optional[str]) -> Optional[str]:
+    """Identify a bank file regardless of the relative path or symlink it was named by"""
+    return os.path.realpath(bank_path) if bank_path else None
+
+
+def load_quiz(bank_path: str = None) -> ComprehensiveQuiz:
+    """Load a bank fully, for tools and servers that use it many times; JSONL banks are read into memory"""
+    quiz = ComprehensiveQuiz(bank_path=bank_path)
+    if quiz.questions is None:
+        quiz.questions = list(question_bank.iter_questions(bank_path))
+        quiz.index = QuestionIndex.build(quiz.questions)
+    return quiz
+
+def _save_session(args: argparse.Namespace, quiz: ComprehensiveQuiz):
+    """Export or persist the quiz's session as requested on the command line"""
+    if quiz.session is None or quiz.checkpoint is not None:
+        return  # Nothing ran, or an unfinished checkpointed session that will be resumed
+    result = quiz.session.result
+    if args.timings_json:
+        export_timings([result], args.timings_json)
+    if args.results_db:
+        with ResultsStore(args.results_db) as store:
+            store.record_session(result, quiz.session.student, quiz.difficulty, quiz.topic,
+                                 quiz.session.session_id)
+
+def _practice_history(args: argparse.Namespace) -> List[Tuple[int, bool]]:
+    """The student's past (question_id, correct) answers from the results database, if any"""
+    if not (args.results_db and args.student and os.path.exists(args.results_db)):
+        return []
+    with ResultsStore(args.results_db) as store:
+        return [(question_id, correct) for _, _, _, question_id, _, correct
+                in store.iter_answers(student=args.student)]
+
+def _blueprint(args: argparse.Namespace, quiz: ComprehensiveQuiz) -> Optional[Blueprint]:
+    """Resolve --blueprint; "balanced" spreads --num-questions evenly over the bank's cells"""
+    if not args.blueprint:
+        return None
+    return resolve_blueprint(args.blueprint, quiz.index, args.num_questions or 50,
+                             args.difficulty, args.topic)
+
+def _run(args: argparse.Namespace, quiz: ComprehensiveQuiz):
+    """Run the headless or interactive quiz selected on the command line"""
+    # An existing checkpoint file means an interrupted session to pick up again
+    resume = bool(args.checkpoint) and os.path.exists(args.checkpoint)
+    
+    if args.headless:
+        session = quiz.load_session(args.checkpoint) if resume else None
+        answers = sys.stdin if args.answers == "-" else open(args.answers, encoding="utf-8")
+        with answers:
+            result = quiz.run_headless(answers, args.num_questions, args.difficulty, args.topic,
+                                       session=session, blueprint=_blueprint(args, quiz))
+        payload = result.to_dict()
+        if quiz.adaptive is not None:
+            payload["ability"] = quiz.adaptive.summary()
+        print(json.dumps(payload, indent=2))
+        _save_session(args, quiz)
+        return
     
-    print("MGT 656 - Exam 1 Practice Quiz")
-    print("=" * 40)
+    if resume:
+        try:
+            quiz.resume_quiz(args.checkpoint)
+        except KeyboardInterrupt:
+            print("\n\nQuiz paused. Run the same command again to resume.")
+            sys.exit(0)
+        _save_session(args, quiz)
+        return
     
-    print("🎯 Welcome to the MGT656 Exam Preparation Quiz!")
-    print("\n📚 Quiz Options:")
-    print("1. Take full quiz (50 questions, all difficulties)")
-    print("2. Take easy quiz (20 questions, easy difficulty)")
-    print("3. Take medium quiz (30 questions, medium difficulty)")
-    print("4. Take hard quiz (25 questions, hard difficulty)")
-    print("5. Custom quiz")
+    blueprint = _blueprint(args, quiz)
+    if blueprint or quiz.review is not None or quiz.target_se is not None:
+        # Blueprint, review and adaptive quizzes start straight away rather than offering the menu
+        try:
+            quiz.start_quiz(args.num_questions, args.difficulty, args.topic, blueprint)
+        except KeyboardInterrupt:
+            print("\n\nQuiz cancelled. Goodbye!")
+            sys.exit(0)
+        _save_session(args, quiz)
+        return
+    
+    print(render_menu(), end="")
     
     while True:
         try:
             choice = input("\nEnter your choice (1-5): ").strip()
             
-            if choice == "1":
-                quiz.start_quiz()
-                break
-            elif choice == "2":
-                quiz.start_quiz(num_questions=20, difficulty="easy")
-                break
-            elif choice == "3":
-                quiz.start_quiz(num_questions=30, difficulty="medium")
-                break
-            elif choice == "4":
-                quiz.start_quiz(num_questions=25, difficulty="hard")
+            if choice in QUIZ_PRESETS:
+                num_q, diff = QUIZ_PRESETS[choice]
+                quiz.start_quiz(num_questions=num_q, difficulty=diff)
                 break
             elif choice == "5":
                 try:
@@ -2765,7 +3256,11 @@ def main():
                     if diff and diff not in ["easy", "medium", "hard"]:
                         print("Invalid difficulty. Using all difficulties.")
                         diff = None
-                    quiz.start_quiz(num_questions=num_q, difficulty=diff)
+                    topic = input(f"Topic ({'/'.join(TOPICS)} or press Enter for all): ").strip()
+                    if topic and topic not in TOPICS:
+                        print("Invalid topic. Using all topics.")
+                        topic = None
+                    quiz.start_quiz(num_questions=num_q, difficulty=diff, topic=topic or None)
                 except ValueError:
                     print("Invalid number. Using default settings.")
                     quiz.start_quiz()
@@ -2775,6 +3270,107 @@ def main():
         except KeyboardInterrupt:
             print("\n\nQuiz cancelled. Goodbye!")
             sys.exit(0)
+    
+    _save_session(args, quiz)
+
+def main():
+    """Main function to run the quiz"""
+    parser = argparse.ArgumentParser(description="MGT 656 - Exam 1 Practice Quiz")
+    parser.add_argument("--bank", metavar="PATH",
+                        help="load questions from a JSONL bank or .qstore file instead of the built-in bank")
+    parser.add_argument("--headless", action="store_true",
+                        help="run without prompts, reading one answer per line and printing JSON results")
+    parser.add_argument("--answers", metavar="PATH", default="-",
+                        help="answers file for --headless ('-' for stdin, the default)")
+    parser.add_argument("--num-questions", type=int,
+                        help="number of questions for --headless, --blueprint and --review quizzes "
+                             "(default 50), or the maximum for --adaptive")
+    parser.add_argument("--difficulty", choices=["easy", "medium", "hard"],
+                        help="difficulty filter for --headless, --blueprint and --review quizzes")
+    parser.add_argument("--topic", choices=list(TOPICS),
+                        help="topic filter for --headless, --blueprint, --review and --adaptive quizzes")
+    parser.add_argument("--student", metavar="ID", help="student identifier recorded with results")
+    parser.add_argument("--blueprint", metavar="SPEC",
+                        help='draw questions per difficulty/topic cell, e.g. "easy/agile=3,hard/*=5", '
+                             'or "balanced" to spread --num-questions evenly')
+    parser.add_argument("--practice", action="store_true",
+                        help="favor questions you keep missing (history from --results-db and --student)")
+    parser.add_argument("--review", metavar="PATH",
+                        help="spaced-repetition review of due questions, with the schedule kept in PATH "
+                             "(needs --student)")
+    parser.add_argument("--new-per-review", type=int, default=10, metavar="N",
+                        help="new questions to add to a review session (default 10)")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="pick each question from a running ability estimate; --num-questions "
+                             "becomes the maximum")
+    parser.add_argument("--target-se", type=float, default=0.4, metavar="SE",
+                        help="end an adaptive quiz once the ability estimate's standard error "
+                             "is this small (default 0.4)")
+    parser.add_argument("--irt-params", metavar="PATH",
+                        help="calibrated question parameters for --adaptive (see irt_calibration.py)")
+    parser.add_argument("--exam", metavar="ID",
+                        help="exam identifier; with --student, the same form is generated every time")
+    parser.add_argument("--shuffle-options", action="store_true",
+                        help="show each question's options in a (seeded) random order")
+    parser.add_argument("--results-db", metavar="PATH",
+                        help="record the session and every answer in a SQLite results database")
+    parser.add_argument("--event-log", metavar="PATH",
+                        help="append every answer to a JSONL event log (see event_log.py compact)")
+    parser.add_argument("--checkpoint", metavar="PATH",
+                        help="checkpoint progress to PATH after every answer; if PATH exists, resume from it")
+    parser.add_argument("--timings-json", metavar="PATH",
+                        help="write per-session and per-question response-time statistics to PATH")
+    args = parser.parse_args()
+    if args.num_questions is not None and args.num_questions < 1:
+        parser.error("--num-questions must be at least 1")
+    if args.review and not args.student:
+        parser.error("--review needs --student")
+    if args.irt_params and not args.adaptive:
+        parser.error("--irt-params needs --adaptive")
+    if args.adaptive:
+        for option in ("difficulty", "blueprint", "practice", "review", "checkpoint", "shuffle_options"):
+            if getattr(args, option):
+                parser.error(f"--adaptive cannot be combined with --{option.replace('_', '-')}")
+    
+    event_log = EventLog(args.event_log) if args.event_log else None
+    try:
+        quiz = ComprehensiveQuiz(bank_path=args.bank, student=args.student, event_log=event_log,
+                                 checkpoint_path=args.checkpoint, exam=args.exam,
+                                 shuffle_options=args.shuffle_options)
+    except (OSError, ValueError, KeyError) as e:
+        if event_log is not None:
+            event_log.close()
+        print(f"❌ Cannot load bank {args.bank}: {e}")
+        sys.exit(1)
+    try:
+        if args.practice:
+            quiz.enable_practice(_practice_history(args))
+        if args.review:
+            quiz.require_index("review mode")  # Before the schedule database is created
+            quiz.enable_review(ReviewSchedule(args.review, args.student), args.new_per_review)
+        if args.adaptive:
+            quiz.enable_adaptive(args.target_se,
+                                 read_params(args.irt_params, args.bank) if args.irt_params else None)
+        _run(args, quiz)
+    except CheckpointError as e:
+        print(f"❌ Cannot resume from {args.checkpoint}: {e}")
+        sys.exit(1)
+    except BlueprintError as e:
+        print(f"❌ Invalid blueprint: {e}")
+        sys.exit(1)
+    except CalibrationError as e:
+        print(f"❌ Cannot use IRT parameters: {e}")
+        sys.exit(1)
+    except QuizModeError as e:
+        print(f"❌ Cannot start quiz: {e}")
+        sys.exit(1)
+    finally:
+        if event_log is not None:
+            event_log.close()
+        if quiz.checkpoint is not None:
+            quiz.checkpoint.close()
+        if quiz.review is not None:
+            quiz.review.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Append-only answer event log with offline compaction.
+
+A lighter alternative to the SQLite results store: every graded answer is
+appended to a JSON Lines log as one short event. Events are buffered in
+memory and written with a single os.write on an O_APPEND descriptor, so
+several quiz processes can share one log without interleaving partial
+lines. fsync happens once per batch (every fsync_every events or
+fsync_interval seconds, whichever comes first) rather than per answer.
+
+The compactor reads raw logs once and rolls them into per-question and
+per-student summary files. Summaries hold only additive counters, so new logs
+can be folded into existing summaries. Compacted logs are renamed with a
+".compacted" suffix so they are never counted twice; only compact logs that
+no quiz process still has open (e.g. yesterday's).
+
+Compact logs:  python3 event_log.py compact summaries/ answers.log [more.log ...]
+"""
+
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, Iterable, Iterator, List
+
+from quiz_session import AnswerRecord, QuizSession
+
+QUESTION_SUMMARY = "questions.json"
+STUDENT_SUMMARY = "students.json"
+
+
+class EventLog:
+    def __init__(self, path: str, fsync_every: int = 100, fsync_interval: float = 1.0):
+        self.path = path
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._pending: List[bytes] = []
+        self._last_sync = time.monotonic()
+
+    def __enter__(self) -> "EventLog":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def append(self, event: Dict[str, Any]):
+        """Queue one event, writing and syncing the batch when it is due"""
+        self._pending.append(json.dumps(event, separators=(",", ":")).encode() + b"\n")
+        if (len(self._pending) >= self.fsync_every
+                or time.monotonic() - self._last_sync >= self.fsync_interval):
+            self.flush()
+
+    def record_answer(self, session: QuizSession, record: AnswerRecord):
+        """QuizSession listener: append the outcome of one graded answer"""
+        self.append({
+            "t": round(time.time(), 3),
+            "session": session.session_id,
+            "student": session.student,
+            "qid": record.question_id,
+            "num": record.question_num,
+            "mask": record.bank_mask,  # Bank option order, even if options were shuffled
+            "correct": record.correct,
+            "think": round(record.think_seconds, 4),
+        })
+
+    def flush(self):
+        """Write every queued event with one write() and fsync it"""
+        if self._pending:
+            os.write(self._fd, b"".join(self._pending))
+            os.fsync(self._fd)
+            self._pending.clear()
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            os.close(self._fd)
+
+
+def iter_events(paths: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Yield events from raw logs, skipping a torn final line from a crashed writer"""
+    for path in paths:
+        with open(path, "rb") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+
+def _load_summary(path: str) -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _write_summary(path: str, summary: Dict[str, Dict[str, Any]]):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def compact(log_paths: List[str], out_dir: str, keep_logs: bool = False) -> int:
+    """Fold raw logs into the summaries in out_dir, returning the number of events read"""
+    os.makedirs(out_dir, exist_ok=True)
+    question_path = os.path.join(out_dir, QUESTION_SUMMARY)
+    student_path = os.path.join(out_dir, STUDENT_SUMMARY)
+    questions = _load_summary(question_path)
+    students = _load_summary(student_path)
+
+    count = 0
+    for event in iter_events(log_paths):
+        count += 1
+        correct = int(bool(event["correct"]))
+
+        question = questions.setdefault(str(event["qid"]), {
+            "attempts": 0, "correct": 0, "think_total": 0.0, "responses": {}})
+        question["attempts"] += 1
+        question["correct"] += correct
+        question["think_total"] += event.get("think", 0.0)
+        # Response masks are counted so distractor choices can be analysed later
+        mask = str(event["mask"])
+        question["responses"][mask] = question["responses"].get(mask, 0) + 1
+
+        student = students.setdefault(str(event["student"]), {
+            "attempts": 0, "correct": 0, "sessions": 0, "last_seen": 0.0})
+        student["attempts"] += 1
+        student["correct"] += correct
+        if event["num"] == 1:
+            student["sessions"] += 1
+        student["last_seen"] = max(student["last_seen"], event["t"])
+
+    _write_summary(question_path, questions)
+    _write_summary(student_path, students)
+    if not keep_logs:
+        for path in log_paths:
+            os.replace(path, path + ".compacted")
+    return count
+
+
+def main():
+    """Command-line entry point for compacting logs"""
+    if len(sys.argv) < 4 or sys.argv[1] != "compact":
+        print("Usage: python3 event_log.py compact <summary-dir> <log> [<log> ...]")
+        sys.exit(1)
+
+    count = compact(sys.argv[3:], sys.argv[2])
+    print(f"✅ Compacted {count} events from {len(sys.argv) - 3} log(s) into {sys.argv[2]}")
+
+
+if __name__ == "__main__":
+    main()
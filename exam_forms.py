@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Batch generation of individual exam forms for a cohort.
+
+Every student on a roster gets their own form, picked with the same selection
+rules as start_quiz. The form is seeded from (exam, student), so it can be
+regenerated exactly at any time, e.g. for an appeal, without being stored;
+`show` does just that for one student.
+
+The bank is loaded once in the parent first, so a missing or broken bank is
+reported before any work starts. Work is then spread over a process pool.
+Each worker loads the bank once (or inherits the parent's copy where
+processes are forked), and writes the forms it generates straight to disk.
+Form files are named after the student and the form id, so two ids that
+sanitize to the same name (e.g. "a/b" and "a_b") never overwrite each other.
+Only a short manifest entry (student, form id, question ids, answer key)
+comes back to the parent, which appends it to manifest.jsonl as it arrives.
+The roster is read lazily and only a few chunks are in flight at a time, so
+memory stays flat however large the cohort is.
+
+Generate forms:  python3 exam_forms.py generate roster.txt forms/ --exam midterm-1 --num-questions 30
+Regenerate one:  python3 exam_forms.py show alice --exam midterm-1 --num-questions 30 --answers
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional
+
+from blueprint import Blueprint, BlueprintError, resolve_blueprint
+from quiz_question import TOPICS
+from quiz_render import render_form
+from quiz_session import session_seed
+
+MANIFEST = "manifest.jsonl"
+CHUNK_SIZE = 64
+
+_worker_quiz = None  # The bank, loaded once in each worker process
+_worker_bank = None  # Which bank _worker_quiz holds
+
+
+def form_filename(student: str, form_id: str) -> str:
+    """File name for a student's form, safe for any student id and unique per form"""
+    return f"{re.sub(r'[^A-Za-z0-9_.-]', '_', student)}-{form_id}.txt"
+
+
+def iter_roster(path: str) -> Iterator[str]:
+    """Yield student ids from a roster file with one per line"""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            student = line.strip()
+            if student and not student.startswith("#"):
+                yield student
+
+
+def _chunks(students: Iterable[str], size: int) -> Iterator[List[str]]:
+    chunk: List[str] = []
+    for student in students:
+        chunk.append(student)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _init_worker(bank_path: Optional[str]):
+    """Load the bank, unless this process already has it (e.g. forked from the parent)"""
+    global _worker_quiz, _worker_bank
+    if _worker_quiz is not None and _worker_bank == bank_path:
+        return
+    from comprehensive_quiz import load_quiz
+    _worker_quiz = load_quiz(bank_path)
+    _worker_bank = bank_path
+
+
+def _generate_chunk(students: List[str], out_dir: str, exam: str, num_questions: int,
+                    difficulty: Optional[str], topic: Optional[str], shuffle_options: bool,
+                    blueprint: Optional[Blueprint]) -> List[Dict[str, Any]]:
+    """Write the forms for a chunk of students, returning their manifest entries"""
+    entries = []
+    for student in students:
+        seed = session_seed(exam, student)
+        question_ids, questions, _ = _worker_quiz.build_form(seed, num_questions, difficulty, topic,
+                                                             shuffle_options, blueprint)
+        form_id = f"{seed:016x}"
+        filename = form_filename(student, form_id)
+        with open(os.path.join(out_dir, filename), "w", encoding="utf-8") as f:
+            f.write(render_form(exam, student, form_id, questions))
+        entries.append({
+            "student": student,
+            "form": form_id,
+            "file": filename,
+            "question_ids": question_ids,
+            "answer_key": [[i + 1 for i in question.correct_answers] for question in questions],
+        })
+    return entries
+
+
+def generate_forms(students: Iterable[str], out_dir: str, exam: str, num_questions: int = 50,
+                   difficulty: str = None, topic: str = None, bank_path: str = None,
+                   shuffle_options: bool = False, blueprint: Blueprint = None,
+                   workers: int = None, chunk_size: int = CHUNK_SIZE) -> int:
+    """Generate one form per student into out_dir, returning how many were written.
+
+    The bank is loaded here first, so an unusable bank raises its error (OSError,
+    ValueError or KeyError) before the pool starts rather than breaking every worker.
+    """
+    _init_worker(bank_path)
+    os.makedirs(out_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    count = 0
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(bank_path,)) as pool, \
+            open(os.path.join(out_dir, MANIFEST), "w", encoding="utf-8") as manifest:
+        in_flight: Deque[Future] = deque()
+
+        def write_oldest():
+            nonlocal count
+            for entry in in_flight.popleft().result():
+                manifest.write(json.dumps(entry) + "\n")
+                count += 1
+
+        for chunk in _chunks(students, chunk_size):
+            in_flight.append(pool.submit(_generate_chunk, chunk, out_dir, exam, num_questions,
+                                         difficulty, topic, shuffle_options, blueprint))
+            # Bound the work queued ahead of the workers; the manifest keeps roster order
+            if len(in_flight) >= 2 * workers:
+                write_oldest()
+        while in_flight:
+            write_oldest()
+    return count
+
+
+def main():
+    """Command-line entry point for generating exam forms"""
+    parser = argparse.ArgumentParser(description="Generate individual exam forms for a cohort")
+    commands = parser.add_subparsers(dest="command", required=True)
+    generate = commands.add_parser("generate", help="write one form per student on a roster")
+    generate.add_argument("roster", help="text file with one student id per line")
+    generate.add_argument("out_dir", help="directory for the forms and manifest.jsonl")
+    generate.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    show = commands.add_parser("show", help="regenerate one student's form")
+    show.add_argument("student")
+    show.add_argument("--answers", action="store_true", help="also print the answer key")
+    for command in (generate, show):
+        command.add_argument("--exam", required=True, help="exam identifier; part of every form's seed")
+        command.add_argument("--num-questions", type=int, default=50)
+        command.add_argument("--difficulty", choices=["easy", "medium", "hard"])
+        command.add_argument("--topic", choices=list(TOPICS))
+        command.add_argument("--shuffle-options", action="store_true",
+                             help="also shuffle each question's options")
+        command.add_argument("--blueprint", metavar="SPEC",
+                             help='questions per difficulty/topic cell, e.g. "easy/agile=3,hard/*=5", '
+                                  'or "balanced"')
+        command.add_argument("--bank", metavar="PATH",
+                             help="pick from a .jsonl or .qstore bank instead of the built-in set")
+    args = parser.parse_args()
+
+    try:
+        _init_worker(args.bank)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Cannot load bank {args.bank}: {e}")
+        sys.exit(1)
+
+    blueprint = None
+    if args.blueprint:
+        # Resolved once here so every worker draws to the same blueprint
+        try:
+            blueprint = resolve_blueprint(args.blueprint, _worker_quiz.index, args.num_questions,
+                                          args.difficulty, args.topic)
+        except BlueprintError as e:
+            print(f"❌ Invalid blueprint: {e}")
+            sys.exit(1)
+
+    if args.command == "show":
+        seed = session_seed(args.exam, args.student)
+        _, questions, _ = _worker_quiz.build_form(seed, args.num_questions, args.difficulty,
+                                                  args.topic, args.shuffle_options, blueprint)
+        print(render_form(args.exam, args.student, f"{seed:016x}", questions), end="")
+        if args.answers:
+            print("\nAnswer key:")
+            for question_num, question in enumerate(questions, 1):
+                print(f"  {question_num}. {', '.join(str(i + 1) for i in question.correct_answers)}")
+        return
+
+    if not os.path.exists(args.roster):
+        print(f"❌ Roster not found: {args.roster}")
+        sys.exit(1)
+    start = time.perf_counter()
+    count = generate_forms(iter_roster(args.roster), args.out_dir, args.exam, args.num_questions,
+                           args.difficulty, args.topic, args.bank, args.shuffle_options, blueprint,
+                           args.workers)
+    print(f"✅ Wrote {count} forms to {args.out_dir} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
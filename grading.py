@@ -0,0 +1,29 @@
+"""
+Answer grading with integer bitmasks.
+
+A question's answer key is stored as a bitmask (bit i set means option i is
+correct), so grading a response is one integer comparison, with no sorting and
+no temporary lists. grade() accepts either a precomputed response mask or the
+0-based option indices a test-taker chose.
+
+Grading a whole cohort at once lives in batch_grading, so that the quiz
+itself never imports NumPy.
+"""
+
+from typing import Iterable, Union
+
+from quiz_question import QuizQuestion, answer_mask
+
+Response = Union[int, Iterable[int]]
+
+
+def response_mask(response: Response) -> int:
+    """Return a response as a bitmask, packing 0-based indices if needed"""
+    if isinstance(response, int):
+        return response
+    return answer_mask(response)
+
+
+def grade(question: QuizQuestion, response: Response) -> bool:
+    """Return True if the response selects exactly the question's correct options"""
+    return response_mask(response) == question.answer_mask
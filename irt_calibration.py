@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Item response theory (2PL) calibration from stored answers.
+
+The easy/medium/hard labels on questions are hand-assigned guesses. This job
+fits each question's discrimination a and difficulty b to real answers, read
+from a results database and/or event logs. It writes the parameters to a
+JSON file that adaptive mode can use (--irt-params). It can also write them
+into a JSONL bank, relabelling each question's difficulty from its fitted b.
+
+Estimation is marginal maximum likelihood by EM (Bock-Aitkin):
+
+- abilities are integrated over a fixed quadrature grid with a standard
+  normal prior, so no per-student parameters are fitted
+- the E-step computes each student's posterior over the grid, then the
+  expected correct/attempt counts per (question, grid point)
+- the M-step takes vectorized Newton steps on every question at once,
+  with weak priors that keep all-correct or all-wrong questions finite
+
+Answers are read in chunks into compact NumPy arrays (student, question,
+correct), at about 13 bytes per answer, and sorted by student once.
+Each E-step then walks the arrays in chunks of whole students, so temporary
+memory is bounded by the chunk size however many answers there are.
+
+NumPy is required. Reading a parameters file (irt_params.read_params) is not
+part of this module, so the quiz can use one without importing NumPy.
+
+Calibrate:  python3 irt_calibration.py irt.json --results-db results.db
+Update a JSONL bank too:  python3 irt_calibration.py irt.json --results-db results.db --bank bank.jsonl --update-bank
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from event_log import iter_events
+from irt_params import CalibrationError, bank_key, read_params  # read_params re-exported for callers
+from results_store import ResultsStore
+
+try:
+    import numpy as np
+except ImportError:  # Reading parameters works without NumPy; calibrating does not
+    np = None
+
+CHUNK_SIZE = 100_000  # Answers per read and per E-step chunk
+QUADRATURE = 41  # Ability grid points from -4 to +4
+MIN_RESPONSES = 30  # Questions answered fewer times are left uncalibrated
+NEWTON_STEPS = 3  # Per M-step
+PRIOR_SD_A = 1.0  # Discrimination prior: normal around 1
+PRIOR_SD_D = 3.0  # Intercept prior: normal around 0
+# Fitted difficulty cut points for relabelling questions
+EASY_BELOW = -0.5
+HARD_ABOVE = 0.5
+
+Chunk = List[Tuple[str, int, int]]  # (person, question_id, correct)
+
+
+class ItemEstimate(NamedTuple):
+    a: float  # Discrimination
+    b: float  # Difficulty, on the ability scale
+    responses: int
+
+
+class Calibration(NamedTuple):
+    items: Dict[int, ItemEstimate]
+    responses: int
+    persons: int
+    iterations: int
+    converged: bool
+    log_likelihood: float
+
+
+def _require_numpy():
+    if np is None:
+        raise CalibrationError("IRT calibration needs NumPy (pip install numpy)")
+
+
+def iter_db_chunks(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Chunk]:
+    """Stream (person, question_id, correct) answers from a results database"""
+    with ResultsStore(path) as store:
+        yield from store.iter_response_chunks(chunk_size)
+
+
+def iter_log_chunks(paths: Sequence[str], chunk_size: int = CHUNK_SIZE) -> Iterator[Chunk]:
+    """Stream (person, question_id, correct) answers from raw event logs"""
+    chunk: Chunk = []
+    for event in iter_events(paths):
+        if event.get("qid") is None:
+            continue
+        person = event.get("student") or "s:" + str(event.get("session"))
+        chunk.append((person, event["qid"], int(bool(event["correct"]))))
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class Responses:
+    def __init__(self, chunks: Iterable[Chunk], min_responses: int = MIN_RESPONSES):
+        """Load answers into compact arrays sorted by person, dropping rarely answered questions"""
+        _require_numpy()
+        person_numbers: Dict[str, int] = {}
+        persons, question_ids, correct = [], [], []
+        for chunk in chunks:
+            persons.append(np.fromiter((person_numbers.setdefault(person, len(person_numbers))
+                                        for person, _, _ in chunk), np.int32, len(chunk)))
+            question_ids.append(np.fromiter((qid for _, qid, _ in chunk), np.int64, len(chunk)))
+            correct.append(np.fromiter((c for _, _, c in chunk), np.bool_, len(chunk)))
+        if not persons:
+            raise CalibrationError("no answers to calibrate from")
+        persons = np.concatenate(persons)
+        question_ids = np.concatenate(question_ids)
+        correct = np.concatenate(correct)
+
+        self.question_ids, items = np.unique(question_ids, return_inverse=True)
+        counts = np.bincount(items)
+        keep = counts[items] >= min_responses
+        if not keep.all():
+            frequent = counts >= min_responses
+            renumber = np.cumsum(frequent) - 1
+            self.question_ids = self.question_ids[frequent]
+            persons, items, correct = persons[keep], renumber[items[keep]], correct[keep]
+        if not len(self.question_ids):
+            raise CalibrationError(f"no question has {min_responses} or more answers")
+
+        order = np.argsort(persons, kind="stable")
+        self.persons = persons[order]
+        self.items = items[order].astype(np.int32)
+        self.correct = correct[order]
+        self.counts = np.bincount(self.items, minlength=len(self.question_ids))
+        # Row of each answer in a stacked (wrong, correct) per-item table: 2 * item + correct
+        self.keys = self.items * 2 + self.correct
+        # Offset of each person's first answer
+        self.person_starts = np.flatnonzero(np.r_[True, self.persons[1:] != self.persons[:-1]])
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @property
+    def num_persons(self) -> int:
+        return len(self.person_starts)
+
+    @property
+    def num_items(self) -> int:
+        return len(self.question_ids)
+
+    def chunk_bounds(self, chunk_size: int) -> List[Tuple[int, int]]:
+        """(start, end) answer ranges of about chunk_size answers, never splitting a person"""
+        cuts = np.searchsorted(self.person_starts, np.arange(0, len(self), chunk_size))
+        edges = np.unique(np.r_[self.person_starts[cuts], len(self)])
+        return list(zip(edges[:-1].tolist(), edges[1:].tolist()))
+
+
+def _expected_counts(responses: Responses, log_p, log_q, log_prior, bounds) -> Tuple[Any, Any, float]:
+    """E-step: expected correct answers and attempts per (item, grid point), and the log-likelihood"""
+    items, points = log_p.shape
+    table = np.stack([log_q, log_p], axis=1).reshape(2 * items, points)
+    sums = np.zeros(2 * items * points)
+    log_likelihood = 0.0
+    starts = responses.person_starts
+    offsets = np.arange(points)
+    for start, end in bounds:
+        key = responses.keys[start:end]
+        contributions = table[key]
+        first = starts[np.searchsorted(starts, start):np.searchsorted(starts, end)] - start
+        person_log = np.add.reduceat(contributions, first, axis=0) + log_prior
+        peak = person_log.max(axis=1, keepdims=True)
+        weights = np.exp(person_log - peak)
+        totals = weights.sum(axis=1, keepdims=True)
+        log_likelihood += float((peak + np.log(totals)).sum())
+        posterior = np.repeat(weights / totals, np.diff(np.r_[first, end - start]), axis=0)
+        # One bincount sums every answer's posterior into its (item, correct, point) cell
+        sums += np.bincount((key[:, None] * points + offsets).ravel(), weights=posterior.ravel(),
+                            minlength=len(sums))
+    sums = sums.reshape(items, 2, points)
+    return sums[:, 1], sums.sum(axis=1), log_likelihood
+
+
+def _maximize(a, d, theta, correct_counts, attempts):
+    """M-step: Newton steps on every item's slope a and intercept d at once"""
+    for _ in range(NEWTON_STEPS):
+        p = 1.0 / (1.0 + np.exp(-(a[:, None] * theta + d[:, None])))
+        residual = correct_counts - attempts * p
+        weight = attempts * p * (1.0 - p)
+        grad_a = (residual * theta).sum(axis=1) - (a - 1.0) / PRIOR_SD_A ** 2
+        grad_d = residual.sum(axis=1) - d / PRIOR_SD_D ** 2
+        h_aa = (weight * theta * theta).sum(axis=1) + 1.0 / PRIOR_SD_A ** 2
+        h_ad = (weight * theta).sum(axis=1)
+        h_dd = weight.sum(axis=1) + 1.0 / PRIOR_SD_D ** 2
+        det = h_aa * h_dd - h_ad * h_ad
+        a = np.clip(a + np.clip((h_dd * grad_a - h_ad * grad_d) / det, -1.0, 1.0), 0.05, 5.0)
+        d = d + np.clip((h_aa * grad_d - h_ad * grad_a) / det, -2.0, 2.0)
+    return a, d
+
+
+def calibrate(responses: Responses, max_iter: int = 200, tol: float = 1e-3,
+              chunk_size: int = CHUNK_SIZE, progress=None) -> Calibration:
+    """Fit 2PL parameters to every question in responses by EM.
+
+    Stops once no a or b moves by more than tol in an iteration. progress, if
+    given, is called as progress(iteration, log_likelihood, largest_change).
+    """
+    _require_numpy()
+    theta = np.linspace(-4.0, 4.0, QUADRATURE)
+    log_prior = -0.5 * theta * theta
+    # Start from the proportion correct, on the logit scale
+    p_values = np.bincount(responses.items, weights=responses.correct,
+                           minlength=responses.num_items) / responses.counts
+    a = np.ones(responses.num_items)
+    d = np.log(np.clip(p_values, 0.02, 0.98) / (1.0 - np.clip(p_values, 0.02, 0.98)))
+    bounds = responses.chunk_bounds(chunk_size)
+
+    iteration, converged, log_likelihood = 0, False, float("nan")
+    while iteration < max_iter and not converged:
+        iteration += 1
+        logit = a[:, None] * theta + d[:, None]
+        log_p = -np.logaddexp(0.0, -logit)
+        log_q = -np.logaddexp(0.0, logit)
+        correct_counts, attempts, log_likelihood = _expected_counts(responses, log_p, log_q,
+                                                                    log_prior, bounds)
+        new_a, new_d = _maximize(a, d, theta, correct_counts, attempts)
+        change = float(max(np.abs(new_a - a).max(), np.abs(-new_d / new_a + d / a).max()))
+        a, d = new_a, new_d
+        converged = change < tol
+        if progress is not None:
+            progress(iteration, log_likelihood, change)
+
+    b = -d / a
+    items = {int(question_id): ItemEstimate(float(a[i]), float(b[i]), int(responses.counts[i]))
+             for i, question_id in enumerate(responses.question_ids)}
+    return Calibration(items, len(responses), responses.num_persons, iteration, converged,
+                       log_likelihood)
+
+
+def difficulty_label(b: float) -> str:
+    """The easy/medium/hard label for a fitted difficulty"""
+    if b < EASY_BELOW:
+        return "easy"
+    if b > HARD_ABOVE:
+        return "hard"
+    return "medium"
+
+
+def write_params(path: str, calibration: Calibration, bank: Optional[str] = None):
+    """Write calibrated parameters as JSON, atomically"""
+    document = {
+        "model": "2pl",
+        "bank": bank_key(bank),
+        "calibrated_at": time.time(),
+        "responses": calibration.responses,
+        "persons": calibration.persons,
+        "iterations": calibration.iterations,
+        "converged": calibration.converged,
+        "items": {str(question_id): {"a": round(item.a, 4), "b": round(item.b, 4),
+                                     "responses": item.responses}
+                  for question_id, item in sorted(calibration.items.items())},
+    }
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=1)
+    os.replace(tmp_path, path)
+
+
+def update_bank(bank_path: str, calibration: Calibration, relabel: bool = True) -> int:
+    """Store each calibrated question's parameters in a JSONL bank, returning how many were updated.
+
+    With relabel, each calibrated question's difficulty is also set from its fitted b.
+    """
+    import question_bank
+
+    if not bank_path.endswith(".jsonl"):
+        raise CalibrationError("only .jsonl banks can be updated in place")
+    updated = 0
+    tmp_path = bank_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as out:
+        for question_id, line in question_bank.iter_lines(bank_path):
+            item = calibration.items.get(question_id)
+            if item is not None:
+                record = json.loads(line)
+                record["irt"] = {"a": round(item.a, 4), "b": round(item.b, 4)}
+                if relabel:
+                    record["difficulty"] = difficulty_label(item.b)
+                line = json.dumps(record, ensure_ascii=False) + "\n"
+                updated += 1
+            out.write(line)
+    os.replace(tmp_path, bank_path)
+    return updated
+
+
+def main():
+    """Command-line entry point for IRT calibration"""
+    parser = argparse.ArgumentParser(description="Fit 2PL IRT parameters to stored answers")
+    parser.add_argument("out", help="parameters file to write (JSON)")
+    parser.add_argument("--results-db", metavar="PATH", help="read answers from a results database")
+    parser.add_argument("--event-log", metavar="PATH", nargs="+", default=[],
+                        help="read answers from raw event logs")
+    parser.add_argument("--bank", metavar="PATH",
+                        help="the bank the answers were given on (default: built-in)")
+    parser.add_argument("--update-bank", action="store_true",
+                        help="also store the parameters in the --bank JSONL file and relabel difficulties")
+    parser.add_argument("--min-responses", type=int, default=MIN_RESPONSES, metavar="N",
+                        help=f"skip questions with fewer answers (default {MIN_RESPONSES})")
+    parser.add_argument("--max-iter", type=int, default=200, metavar="N")
+    args = parser.parse_args()
+    if not args.results_db and not args.event_log:
+        parser.error("give --results-db and/or --event-log")
+    if args.update_bank and not args.bank:
+        parser.error("--update-bank needs --bank")
+
+    def chunks() -> Iterator[Chunk]:
+        if args.results_db:
+            yield from iter_db_chunks(args.results_db)
+        yield from iter_log_chunks(args.event_log)
+
+    def report(iteration: int, log_likelihood: float, change: float):
+        print(f"  iteration {iteration:3d}: log-likelihood {log_likelihood:14.1f}, "
+              f"largest change {change:.4f}")
+
+    try:
+        start = time.perf_counter()
+        responses = Responses(chunks(), args.min_responses)
+        print(f"📥 Loaded {len(responses)} answers from {responses.num_persons} students "
+              f"on {responses.num_items} questions in {time.perf_counter() - start:.1f}s")
+        calibration = calibrate(responses, args.max_iter, progress=report)
+        write_params(args.out, calibration, args.bank)
+        updated = update_bank(args.bank, calibration) if args.update_bank else 0
+    except CalibrationError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    status = "converged" if calibration.converged else "stopped without converging"
+    print(f"✅ Calibrated {len(calibration.items)} questions ({status} after "
+          f"{calibration.iterations} iterations, {time.perf_counter() - start:.1f}s) into {args.out}")
+    if updated:
+        print(f"✅ Updated {updated} questions in {args.bank}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""
+Calibrated IRT parameters files, as written by irt_calibration.py.
+
+Reading parameters is all the quiz needs for adaptive mode, so it lives here,
+apart from the calibration job, and never imports NumPy.
+"""
+
+import json
+import os
+from typing import Dict, Optional, Tuple
+
+
+class CalibrationError(Exception):
+    """Raised when calibration cannot run or a parameters file cannot be used"""
+
+
+def bank_key(bank: Optional[str]) -> Optional[str]:
+    """Identify a bank file regardless of the relative path or symlink it was named by"""
+    return os.path.realpath(bank) if bank else None
+
+
+def read_params(path: str, bank: Optional[str] = None) -> Dict[int, Tuple[float, float]]:
+    """Read question id -> (a, b) from a parameters file written for the given bank"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            document = json.load(f)
+    except (OSError, ValueError) as e:
+        raise CalibrationError(f"cannot read {path}: {e}") from None
+    if bank_key(document.get("bank")) != bank_key(bank):
+        raise CalibrationError(f"{path} was calibrated for bank {document.get('bank') or 'built-in'}")
+    return {int(question_id): (item["a"], item["b"]) for question_id, item in document["items"].items()}
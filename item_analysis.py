@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Classical item analysis of recorded quiz answers.
+
+For every question answered often enough, the report gives:
+
+- p-value: the proportion of answers that were correct
+- point-biserial discrimination: the correlation between answering the
+  question correctly and the student's score on the rest of that session,
+  as a proportion since sessions differ in length
+- option rates: how often each option was selected, so distractors nobody
+  picks (or that strong students pick) stand out
+
+It also gives Cronbach's alpha for a form of the typical session length.
+Every session draws its own questions, so alpha is computed from the mean
+question variance and the mean covariance between questions asked in the
+same session. For a fixed form this is exactly Cronbach's formula.
+
+Answers are loaded from a results database or event logs into flat NumPy
+arrays with one entry per answer. Every per-question statistic is then a
+bincount over those arrays, with no per-question or per-student Python
+loops, so large cohorts take seconds. NumPy is required.
+
+Report:  python3 item_analysis.py --results-db results.db
+"""
+
+import argparse
+import itertools
+import json
+import sys
+import time
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from event_log import iter_events
+from results_store import ResultsStore
+
+try:
+    import numpy as np
+except ImportError:  # Checked when an analysis runs
+    np = None
+
+CHUNK_SIZE = 100_000
+MIN_RESPONSES = 20  # Questions answered fewer times are left out of the report
+# Thresholds for flagging questions in the report
+TOO_EASY = 0.9
+TOO_HARD = 0.2
+LOW_DISCRIMINATION = 0.2
+UNUSED_DISTRACTOR = 0.05
+
+Answer = Tuple[str, int, int, int]  # (session, question_id, response mask, correct)
+
+
+class ItemAnalysisError(Exception):
+    """Raised when an item analysis cannot run"""
+
+
+class ItemStats(NamedTuple):
+    question_id: int
+    responses: int
+    p_value: float
+    point_biserial: float  # nan when undefined, e.g. everyone answered correctly
+    option_rates: Tuple[float, ...]  # Bank option order
+
+
+class Reliability(NamedTuple):
+    form_length: int  # Median questions per session
+    alpha: float  # nan without sessions of two or more questions
+    mean_variance: float
+    mean_covariance: float
+
+
+class ItemAnalysis(NamedTuple):
+    items: List[ItemStats]
+    reliability: Reliability
+    sessions: int
+    responses: int
+
+
+def _require_numpy():
+    if np is None:
+        raise ItemAnalysisError("item analysis needs NumPy (pip install numpy)")
+
+
+def iter_db_answers(path: str) -> Iterator[Answer]:
+    """Stream (session, question_id, mask, correct) answers from a results database"""
+    with ResultsStore(path) as store:
+        for session_id, _, _, question_id, mask, correct in store.iter_answers():
+            if question_id is not None:
+                yield session_id, question_id, mask, int(correct)
+
+
+def iter_log_answers(paths: Sequence[str]) -> Iterator[Answer]:
+    """Stream (session, question_id, mask, correct) answers from raw event logs"""
+    for event in iter_events(paths):
+        if event.get("qid") is not None:
+            yield event["session"], event["qid"], event["mask"], int(bool(event["correct"]))
+
+
+class AnswerArrays:
+    def __init__(self, answers: Iterable[Answer], chunk_size: int = CHUNK_SIZE):
+        """Load answers into flat arrays, reading chunk_size answers at a time"""
+        _require_numpy()
+        session_numbers: Dict[str, int] = {}
+        sessions, question_ids, masks, correct = [], [], [], []
+        answers = iter(answers)
+        while True:
+            chunk = list(itertools.islice(answers, chunk_size))
+            if not chunk:
+                break
+            sessions.append(np.fromiter((session_numbers.setdefault(session, len(session_numbers))
+                                         for session, _, _, _ in chunk), np.int64, len(chunk)))
+            question_ids.append(np.fromiter((qid for _, qid, _, _ in chunk), np.int64, len(chunk)))
+            masks.append(np.fromiter((mask for _, _, mask, _ in chunk), np.uint64, len(chunk)))
+            correct.append(np.fromiter((c for _, _, _, c in chunk), np.float64, len(chunk)))
+        if not sessions:
+            raise ItemAnalysisError("no answers to analyze")
+        self.sessions = np.concatenate(sessions)
+        self.question_ids = np.concatenate(question_ids)
+        self.masks = np.concatenate(masks)
+        self.correct = np.concatenate(correct)
+        self.num_sessions = len(session_numbers)
+
+    def __len__(self) -> int:
+        return len(self.correct)
+
+
+def _item_stats(answers: AnswerArrays, option_counts: Dict[int, int],
+                min_responses: int) -> List[ItemStats]:
+    question_ids, items = np.unique(answers.question_ids, return_inverse=True)
+    num_items = len(question_ids)
+    correct = answers.correct
+
+    # Each answer's rest score: the session's proportion correct on its other questions
+    session_totals = np.bincount(answers.sessions, weights=correct)
+    session_counts = np.bincount(answers.sessions)
+    others = session_counts[answers.sessions] - 1
+    usable = others > 0
+    rest = np.where(usable, (session_totals[answers.sessions] - correct) / np.maximum(others, 1), 0.0)
+
+    def per_item(values, where=None):
+        return np.bincount(items, weights=values if where is None else values * where,
+                           minlength=num_items)
+
+    responses = np.bincount(items, minlength=num_items)
+    p_values = per_item(correct) / np.maximum(responses, 1)
+    # Pearson correlation from per-item sums, over answers whose session had other questions
+    n = per_item(usable.astype(np.float64))
+    sx, sy = per_item(correct, usable), per_item(rest, usable)
+    sxy, syy = per_item(correct * rest, usable), per_item(rest * rest, usable)
+    sxx = sx  # correct is 0/1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        point_biserial = (n * sxy - sx * sy) / np.sqrt((n * sxx - sx * sx) * (n * syy - sy * sy))
+
+    max_options = max(option_counts.values(), default=0)
+    option_rates = np.empty((num_items, max_options))
+    for option in range(max_options):
+        selected = ((answers.masks >> np.uint64(option)) & np.uint64(1)).astype(np.float64)
+        option_rates[:, option] = per_item(selected)
+    option_rates /= np.maximum(responses, 1)[:, None]
+
+    stats = []
+    for i, question_id in enumerate(question_ids.tolist()):
+        if responses[i] < min_responses or question_id not in option_counts:
+            continue
+        stats.append(ItemStats(question_id, int(responses[i]), float(p_values[i]),
+                               float(point_biserial[i]),
+                               tuple(option_rates[i, :option_counts[question_id]].tolist())))
+    return stats
+
+
+def _reliability(answers: AnswerArrays) -> Reliability:
+    """Cronbach's alpha from the mean question variance and mean within-session covariance"""
+    _, items = np.unique(answers.question_ids, return_inverse=True)
+    p_values = np.bincount(items, weights=answers.correct) / np.bincount(items)
+    deviation = answers.correct - p_values[items]
+    session_counts = np.bincount(answers.sessions)
+    session_sums = np.bincount(answers.sessions, weights=deviation)
+    session_squares = np.bincount(answers.sessions, weights=deviation * deviation)
+    # Sum of dev_i * dev_j over every ordered pair of distinct questions in each session
+    pair_products = (session_sums * session_sums - session_squares).sum()
+    pairs = (session_counts * (session_counts - 1)).sum()
+    mean_variance = float((deviation * deviation).mean())
+    form_length = int(np.median(session_counts[session_counts > 0]))
+    if not pairs or form_length < 2:
+        return Reliability(form_length, float("nan"), mean_variance, float("nan"))
+    mean_covariance = float(pair_products / pairs)
+    k = form_length
+    alpha = k * mean_covariance / (mean_variance + (k - 1) * mean_covariance)
+    return Reliability(form_length, alpha, mean_variance, mean_covariance)
+
+
+def analyze(answers: AnswerArrays, option_counts: Dict[int, int],
+            min_responses: int = MIN_RESPONSES) -> ItemAnalysis:
+    """Item statistics for every question in option_counts (question id -> number of options)"""
+    return ItemAnalysis(_item_stats(answers, option_counts, min_responses), _reliability(answers),
+                        answers.num_sessions, len(answers))
+
+
+def item_flags(item: ItemStats, correct_answers: Sequence[int]) -> List[str]:
+    """Reasons a question may need rewriting"""
+    flags = []
+    if item.p_value > TOO_EASY:
+        flags.append("too easy")
+    elif item.p_value < TOO_HARD:
+        flags.append("too hard")
+    if not item.point_biserial >= LOW_DISCRIMINATION:  # Also catches nan
+        flags.append("low discrimination")
+    unused = [str(option + 1) for option, rate in enumerate(item.option_rates)
+              if option not in correct_answers and rate < UNUSED_DISTRACTOR]
+    if unused:
+        flags.append(f"distractor(s) {', '.join(unused)} rarely chosen")
+    return flags
+
+
+def render_report(analysis: ItemAnalysis, questions, flagged_only: bool = False) -> str:
+    """Format the analysis; questions maps question ids to QuizQuestions"""
+    parts = [f"📊 Item analysis: {analysis.responses} answers from {analysis.sessions} sessions, "
+             f"{len(analysis.items)} questions\n"]
+    for item in analysis.items:
+        question = questions[item.question_id]
+        correct_answers = question.correct_answers
+        flags = item_flags(item, correct_answers)
+        if flagged_only and not flags:
+            continue
+        discrimination = "  -  " if item.point_biserial != item.point_biserial else f"{item.point_biserial:+.2f}"
+        rates = " | ".join(f"{option + 1}{'*' if option in correct_answers else ' '} {rate:4.0%}"
+                           for option, rate in enumerate(item.option_rates))
+        parts.append(f"\nQ{item.question_id:<5} n={item.responses:<7} p={item.p_value:.2f}  "
+                     f"r_pb={discrimination}  [{question.difficulty}] {question.question[:60]}\n"
+                     f"       options: {rates}\n")
+        if flags:
+            parts.append(f"       ⚠️  {'; '.join(flags)}\n")
+    reliability = analysis.reliability
+    if reliability.alpha == reliability.alpha:
+        parts.append(f"\n📐 Cronbach's alpha for a {reliability.form_length}-question form: "
+                     f"{reliability.alpha:.2f}\n")
+    else:
+        parts.append("\n📐 Cronbach's alpha needs sessions with two or more questions\n")
+    return "".join(parts)
+
+
+def main():
+    """Command-line entry point for item analysis"""
+    parser = argparse.ArgumentParser(description="Item analysis of recorded quiz answers")
+    parser.add_argument("--results-db", metavar="PATH", help="read answers from a results database")
+    parser.add_argument("--event-log", metavar="PATH", nargs="+", default=[],
+                        help="read answers from raw event logs")
+    parser.add_argument("--bank", metavar="PATH",
+                        help="the bank the answers were given on (default: built-in)")
+    parser.add_argument("--min-responses", type=int, default=MIN_RESPONSES, metavar="N",
+                        help=f"skip questions with fewer answers (default {MIN_RESPONSES})")
+    parser.add_argument("--flagged", action="store_true", help="only list questions with a warning")
+    parser.add_argument("--json", metavar="PATH", help="also write the statistics as JSON")
+    args = parser.parse_args()
+    if not args.results_db and not args.event_log:
+        parser.error("give --results-db and/or --event-log")
+
+    from comprehensive_quiz import load_quiz
+    questions = load_quiz(args.bank).questions
+
+    def answers() -> Iterator[Answer]:
+        if args.results_db:
+            yield from iter_db_answers(args.results_db)
+        yield from iter_log_answers(args.event_log)
+
+    start = time.perf_counter()
+    try:
+        arrays = AnswerArrays(answers())
+        option_counts = {question_id: len(questions[question_id].options)
+                         for question_id in np.unique(arrays.question_ids).tolist()
+                         if 0 <= question_id < len(questions)}
+        analysis = analyze(arrays, option_counts, args.min_responses)
+    except ItemAnalysisError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+    print(render_report(analysis, questions, args.flagged), end="")
+    print(f"\n⏱️  Analyzed in {elapsed:.1f}s")
+    if args.json:
+        def finite(value: float) -> Optional[float]:
+            return None if value != value else value
+
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"sessions": analysis.sessions, "responses": analysis.responses,
+                       "items": [dict(item._asdict(), point_biserial=finite(item.point_biserial))
+                                 for item in analysis.items],
+                       "reliability": {name: finite(value) for name, value
+                                       in analysis.reliability._asdict().items()}}, f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate question detection with MinHash and locality-sensitive hashing.
+
+The bank grew from several sources, and some questions ask the same thing in
+slightly different words. Comparing every pair of questions is quadratic:
+50 million comparisons at 10k questions. Instead:
+
+- each question becomes a set of word shingles (2-word windows of the
+  question and of each option, so option order doesn't matter)
+- a MinHash signature of NUM_HASHES minimums summarizes each set; two
+  signatures agree in a position with probability equal to the sets'
+  Jaccard similarity
+- signatures are cut into BANDS bands, and questions sharing any band
+  bucket become candidate pairs; questions that share no band are never
+  compared
+- candidates are confirmed by their exact Jaccard similarity
+
+With 32 bands of 3 rows, a pair at similarity 0.4 is found with probability
+0.88, at 0.5 with 0.986 and at 0.6 with 0.9996. A pair at a typical
+unrelated-question similarity of 0.05 becomes a candidate with probability
+0.004. Signatures are computed with NumPy when it is installed and in pure
+Python otherwise; both give the same signatures.
+
+Find duplicates:  python3 near_duplicates.py --threshold 0.5
+"""
+
+import argparse
+import json
+import random
+import re
+import time
+import zlib
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Sequence, Set, Tuple
+
+from quiz_question import QuizQuestion
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; signatures fall back to pure Python
+    np = None
+
+SHINGLE_WORDS = 2
+BANDS = 32
+ROWS = 3
+NUM_HASHES = BANDS * ROWS
+THRESHOLD = 0.4
+_MASK64 = (1 << 64) - 1
+
+# Multiply-shift hash functions h(x) = ((a * x + b) mod 2^64) >> 32, with odd a
+_rng = random.Random(656)
+HASH_A = [_rng.getrandbits(64) | 1 for _ in range(NUM_HASHES)]
+HASH_B = [_rng.getrandbits(64) for _ in range(NUM_HASHES)]
+if np is not None:
+    _HASH_A = np.array(HASH_A, dtype=np.uint64)
+    _HASH_B = np.array(HASH_B, dtype=np.uint64)
+
+
+class DuplicatePair(NamedTuple):
+    first: int  # Question ids, first < second
+    second: int
+    similarity: float  # Jaccard similarity of the shingle sets
+
+
+def _words(text: str) -> List[str]:
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+
+def shingles(question: QuizQuestion, size: int = SHINGLE_WORDS) -> FrozenSet[int]:
+    """Hashed word shingles of a question's text and of each of its options"""
+    hashed: Set[int] = set()
+    for text in (question.question, *question.options):
+        words = _words(text)
+        # Texts shorter than a shingle still count as one
+        for start in range(max(1, len(words) - size + 1)):
+            hashed.add(zlib.crc32(" ".join(words[start:start + size]).encode()))
+    return frozenset(hashed)
+
+
+def jaccard(a: FrozenSet[int], b: FrozenSet[int]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def signature(shingle_set: FrozenSet[int], use_numpy: bool = None) -> Tuple[int, ...]:
+    """The MinHash signature of a shingle set: its minimum under each hash function"""
+    if use_numpy is None:
+        use_numpy = np is not None
+    if not shingle_set:
+        return (0,) * NUM_HASHES
+    if use_numpy:
+        values = np.fromiter(shingle_set, np.uint64, len(shingle_set))
+        # uint64 arithmetic wraps, which is exactly mod 2^64
+        hashed = (values[:, None] * _HASH_A + _HASH_B) >> np.uint64(32)
+        return tuple(hashed.min(axis=0).tolist())
+    return tuple(min(((a * x + b) & _MASK64) >> 32 for x in shingle_set)
+                 for a, b in zip(HASH_A, HASH_B))
+
+
+def candidate_pairs(signatures: Sequence[Tuple[int, ...]]) -> Set[Tuple[int, int]]:
+    """Pairs of positions whose signatures match in at least one band"""
+    candidates: Set[Tuple[int, int]] = set()
+    for band in range(BANDS):
+        start = band * ROWS
+        buckets: Dict[Tuple[int, ...], List[int]] = {}
+        for position, sig in enumerate(signatures):
+            buckets.setdefault(sig[start:start + ROWS], []).append(position)
+        for members in buckets.values():
+            for i in range(len(members)):
+                for j in range(i + 1, len(members)):
+                    candidates.add((members[i], members[j]))
+    return candidates
+
+
+def find_near_duplicates(questions: Iterable[QuizQuestion], threshold: float = THRESHOLD,
+                         use_numpy: bool = None) -> List[DuplicatePair]:
+    """Pairs of questions whose shingle sets have Jaccard similarity of at least threshold"""
+    shingle_sets = [shingles(question) for question in questions]
+    signatures = [signature(shingle_set, use_numpy) for shingle_set in shingle_sets]
+    pairs = []
+    for i, j in candidate_pairs(signatures):
+        similarity = jaccard(shingle_sets[i], shingle_sets[j])
+        if similarity >= threshold:
+            pairs.append(DuplicatePair(i, j, similarity))
+    pairs.sort(key=lambda pair: (-pair.similarity, pair.first, pair.second))
+    return pairs
+
+
+def duplicate_groups(pairs: Iterable[DuplicatePair]) -> List[List[int]]:
+    """Merge pairs into groups of mutually linked question ids (union-find)"""
+    parent: Dict[int, int] = {}
+
+    def root(x: int) -> int:
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for pair in pairs:
+        parent[root(pair.first)] = root(pair.second)
+    groups: Dict[int, List[int]] = {}
+    for x in parent:
+        groups.setdefault(root(x), []).append(x)
+    return sorted((sorted(group) for group in groups.values()), key=lambda group: group[0])
+
+
+def render_duplicates(pairs: Sequence[DuplicatePair], questions: Sequence[QuizQuestion]) -> str:
+    if not pairs:
+        return "✅ No near-duplicate questions found\n"
+    similarity = {(pair.first, pair.second): pair.similarity for pair in pairs}
+    groups = duplicate_groups(pairs)
+    parts = [f"🔍 {len(pairs)} near-duplicate pairs in {len(groups)} groups\n"]
+    for group in groups:
+        best = max(similarity.get((i, j), 0.0) for i in group for j in group if i < j)
+        parts.append(f"\n{'-' * 60}\nGroup of {len(group)} (similarity up to {best:.0%}):\n")
+        for question_id in group:
+            question = questions[question_id]
+            parts.append(f"  Q{question_id:<5} [{question.difficulty}/{question.topic}] "
+                         f"{question.question[:90]}\n")
+    return "".join(parts)
+
+
+def main():
+    """Command-line entry point for finding near-duplicate questions"""
+    parser = argparse.ArgumentParser(description="Find near-duplicate questions in a bank")
+    parser.add_argument("--bank", metavar="PATH",
+                        help="check a .jsonl or .qstore bank instead of the built-in set")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help=f"minimum Jaccard similarity of shingles (default {THRESHOLD})")
+    parser.add_argument("--json", metavar="PATH", help="also write the pairs as JSON")
+    args = parser.parse_args()
+    if not 0.0 < args.threshold <= 1.0:
+        parser.error("--threshold must be in (0, 1]")
+
+    from comprehensive_quiz import load_quiz
+    questions = load_quiz(args.bank).questions
+    start = time.perf_counter()
+    pairs = find_near_duplicates(questions, args.threshold)
+    elapsed = time.perf_counter() - start
+    print(render_duplicates(pairs, questions), end="")
+    print(f"\n⏱️  Checked {len(questions)} questions in {elapsed:.2f}s")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump([pair._asdict() for pair in pairs], f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Streaming question banks stored as JSON Lines.
+
+Each line of a bank file is one question as produced by QuizQuestion.to_record.
+Banks are read as generators, and sampling keeps only the raw lines of the
+questions it has picked so far, so memory grows with the quiz length rather
+than with the size of the bank.
+
+Export the built-in bank:  python3 question_bank.py export questions.jsonl
+"""
+
+import json
+import random
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from quiz_question import DEFAULT_TOPIC, QuizQuestion
+
+
+def iter_lines(path: str) -> Iterator[Tuple[int, str]]:
+    """Yield (question_id, raw_line) for every question in a bank file"""
+    with open(path, "r", encoding="utf-8") as f:
+        question_id = 0
+        for line in f:
+            if not line.strip():
+                continue
+            yield question_id, line
+            question_id += 1
+
+
+def iter_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield each question in a bank file as a dict"""
+    for _, line in iter_lines(path):
+        yield json.loads(line)
+
+
+def iter_questions(path: str) -> Iterator[QuizQuestion]:
+    """Yield each question in a bank file as a QuizQuestion"""
+    for record in iter_records(path):
+        yield QuizQuestion.from_record(record)
+
+
+def questions_by_id(path: str, question_ids: Sequence[int]) -> List[QuizQuestion]:
+    """Return the questions with the given ids, in the order given, in one pass"""
+    wanted = set(question_ids)
+    found: Dict[int, QuizQuestion] = {}
+    for question_id, line in iter_lines(path):
+        if question_id in wanted:
+            found[question_id] = QuizQuestion.from_record(json.loads(line))
+            if len(found) == len(wanted):
+                break
+    missing = wanted - found.keys()
+    if missing:
+        raise IndexError(f"question ids not in {path}: {sorted(missing)[:5]}")
+    return [found[question_id] for question_id in question_ids]
+
+
+def write_bank(questions: Iterable[QuizQuestion], path: str) -> int:
+    """Write questions to a bank file, returning how many were written"""
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for question in questions:
+            f.write(json.dumps(question.to_record(), ensure_ascii=False))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def sample_lines(path: str, k: int, difficulty: Optional[str] = None,
+                 rng: random.Random = None, topic: Optional[str] = None) -> List[Tuple[int, str]]:
+    """Pick k raw lines uniformly at random in one pass (reservoir sampling)"""
+    rng = rng or random
+    reservoir: List[Tuple[int, str]] = []
+    seen = 0
+    for question_id, line in iter_lines(path):
+        if difficulty or topic:
+            record = json.loads(line)
+            if difficulty and record.get("difficulty", "medium") != difficulty:
+                continue
+            if topic and record.get("topic", DEFAULT_TOPIC) != topic:
+                continue
+        seen += 1
+        if len(reservoir) < k:
+            reservoir.append((question_id, line))
+        else:
+            slot = rng.randrange(seen)
+            if slot < k:
+                reservoir[slot] = (question_id, line)
+    rng.shuffle(reservoir)
+    return reservoir
+
+
+def sample_questions(path: str, k: int, difficulty: Optional[str] = None,
+                     rng: random.Random = None, topic: Optional[str] = None) -> List[QuizQuestion]:
+    """Pick k questions at random, building objects only for the ones picked"""
+    return [QuizQuestion.from_record(json.loads(line))
+            for _, line in sample_lines(path, k, difficulty, rng, topic)]
+
+
+def main():
+    """Command-line entry point for bank file utilities"""
+    if len(sys.argv) != 3 or sys.argv[1] != "export":
+        print("Usage: python3 question_bank.py export <bank.jsonl>")
+        sys.exit(1)
+
+    from comprehensive_quiz import ComprehensiveQuiz
+    count = write_bank(ComprehensiveQuiz().questions, sys.argv[2])
+    print(f"✅ Exported {count} questions to {sys.argv[2]}")
+
+
+if __name__ == "__main__":
+    main()
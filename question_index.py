@@ -0,0 +1,104 @@
+"""
+Precomputed question indexes by difficulty, topic and difficulty × topic.
+
+The index is built once when a bank is loaded. Every question id (its position
+in the bank) goes into exactly one difficulty × topic cell, and each filter
+combination is answered by joining the matching cells. Selection therefore
+costs time proportional to the result, never a rescan of the bank.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+Filter = Union[None, str, Iterable[str]]
+
+
+def _as_values(value: Filter) -> Optional[Tuple[str, ...]]:
+    """Normalize a filter argument into a tuple of values, or None for 'any'"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        return (value,)
+    return tuple(value)
+
+
+class QuestionIndex:
+    def __init__(self, metadata: Iterable[Tuple[str, str]] = ()):
+        """Index question ids given each question's (difficulty, topic) in bank order"""
+        self.size = 0
+        self.by_cell: Dict[Tuple[str, str], List[int]] = {}
+        self.by_difficulty: Dict[str, List[int]] = {}
+        self.by_topic: Dict[str, List[int]] = {}
+        for question_id, (difficulty, topic) in enumerate(metadata):
+            self.by_cell.setdefault((difficulty, topic), []).append(question_id)
+            self.by_difficulty.setdefault(difficulty, []).append(question_id)
+            self.by_topic.setdefault(topic, []).append(question_id)
+            self.size = question_id + 1
+
+    @classmethod
+    def build(cls, questions: Sequence) -> "QuestionIndex":
+        """Index a bank, reading only metadata when the bank supports it"""
+        if hasattr(questions, "cell_codes"):
+            return cls.from_cell_codes(*questions.cell_codes())
+        if hasattr(questions, "metadata_at"):
+            metadata = (questions.metadata_at(i) for i in range(len(questions)))
+        else:
+            metadata = ((q.difficulty, q.topic) for q in questions)
+        return cls(metadata)
+
+    @classmethod
+    def from_cell_codes(cls, cells: Sequence[Tuple[str, str]], codes: Sequence[int]) -> "QuestionIndex":
+        """Index question ids given one code per question, where cells[code] is its (difficulty, topic)"""
+        members: List[List[int]] = [[] for _ in cells]
+        for question_id, code in enumerate(codes):
+            members[code].append(question_id)
+        index = cls()
+        index.size = len(codes)
+        # Cells in order of first appearance, as the per-question constructor adds them
+        for cell, ids in sorted(((cell, ids) for cell, ids in zip(cells, members) if ids),
+                                key=lambda item: item[1][0]):
+            index.by_cell[cell] = ids
+            index.by_difficulty.setdefault(cell[0], []).extend(ids)
+            index.by_topic.setdefault(cell[1], []).extend(ids)
+        for lists in (index.by_difficulty, index.by_topic):
+            for ids in lists.values():
+                ids.sort()  # Merges the already sorted runs of each cell
+        return index
+
+    @property
+    def difficulties(self) -> List[str]:
+        return list(self.by_difficulty)
+
+    @property
+    def topics(self) -> List[str]:
+        return list(self.by_topic)
+
+    def select(self, difficulty: Filter = None, topic: Filter = None) -> Sequence[int]:
+        """Return the ids matching every filter; each filter may name one value or several.
+
+        The result may be a list owned by the index, so treat it as read-only.
+        """
+        difficulties = _as_values(difficulty)
+        topics = _as_values(topic)
+
+        if difficulties is None and topics is None:
+            return range(self.size)
+        if topics is None:
+            return self._join(self.by_difficulty, difficulties)
+        if difficulties is None:
+            return self._join(self.by_topic, topics)
+        return self._join(self.by_cell, [(d, t) for d in difficulties for t in topics])
+
+    def count(self, difficulty: Filter = None, topic: Filter = None) -> int:
+        """Return how many questions match the filters"""
+        return len(self.select(difficulty, topic))
+
+    @staticmethod
+    def _join(lists: Dict, keys: Iterable) -> List[int]:
+        """Concatenate the id lists for keys; a single key returns the list itself"""
+        keys = list(dict.fromkeys(keys))
+        if len(keys) == 1:
+            return lists.get(keys[0], [])
+        ids: List[int] = []
+        for key in keys:
+            ids.extend(lists.get(key, ()))
+        return ids
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Memory-mapped question store with a fixed-width offset index.
+
+A .qstore file is laid out as:
+
+    header   magic "QSTR", format version, question count, index position,
+             cell column position
+    records  per question: difficulty code, option count, answer bitmask,
+             uint32 byte lengths of the question, explanation, topic and options,
+             then the UTF-8 text of each, back to back
+    cells    count little-endian uint16 cell codes, then the cell table: a JSON
+             list of [difficulty, topic] pairs that the codes index
+    index    count + 1 little-endian uint64 offsets; question i spans
+             offsets[i]..offsets[i + 1]
+
+The cells and index go last so a store can be written in one streaming pass.
+
+Looking up question i reads one index slot and one record, so sampling N
+questions touches N records no matter how big the bank is. Text accessors
+return memoryview slices of the mapping, decoded only when a QuizQuestion is
+built. The difficulty and topic of every question sit together in the cell
+column, so indexing a store reads that one slice rather than every record.
+
+Build a store:  python3 question_store.py build questions.jsonl questions.qstore
+"""
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from quiz_question import DIFFICULTIES, QuizQuestion, mask_indices
+
+STORE_MAGIC = b"QSTR"
+STORE_VERSION = 3
+MAX_CELLS = 1 << 16  # Cell codes are uint16
+
+_HEADER = struct.Struct("<4sHxxQQQ")
+_OFFSET = struct.Struct("<Q")
+_RECORD = struct.Struct("<BBQ")  # difficulty code, option count, answer bitmask
+
+
+def _encode_record(question: QuizQuestion) -> bytes:
+    """Serialize one question into its on-disk record"""
+    if question.difficulty not in DIFFICULTIES:
+        raise ValueError(f"Unknown difficulty: {question.difficulty!r}")
+    if len(question.options) > 64:
+        raise ValueError("Questions may have at most 64 options")
+
+    texts = [question.question, question.explanation, question.topic] + list(question.options)
+    encoded = [text.encode("utf-8") for text in texts]
+    return b"".join([
+        _RECORD.pack(DIFFICULTIES.index(question.difficulty), len(question.options),
+                     question.answer_mask),
+        struct.pack(f"<{len(encoded)}I", *(len(data) for data in encoded)),
+    ] + encoded)
+
+
+def build_store(questions: Iterable[QuizQuestion], path: str) -> int:
+    """Write questions to a .qstore file, returning how many were written"""
+    offsets = array("Q")
+    cell_codes = array("H")
+    cells: Dict[Tuple[str, str], int] = {}
+    position = _HEADER.size
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(STORE_MAGIC, STORE_VERSION, 0, 0, 0))
+        for question in questions:
+            record = _encode_record(question)
+            cell = (question.difficulty, question.topic)
+            if cell not in cells and len(cells) == MAX_CELLS:
+                raise ValueError(f"Stores support at most {MAX_CELLS} difficulty/topic cells")
+            cell_codes.append(cells.setdefault(cell, len(cells)))
+            offsets.append(position)
+            f.write(record)
+            position += len(record)
+        offsets.append(position)
+
+        count = len(offsets) - 1
+        cells_position = position
+        table = json.dumps([list(cell) for cell in cells], ensure_ascii=False).encode("utf-8")
+        if sys.byteorder != "little":
+            offsets.byteswap()
+            cell_codes.byteswap()
+        f.write(cell_codes.tobytes())
+        f.write(table)
+        index_position = cells_position + 2 * count + len(table)
+        f.write(offsets.tobytes())
+        f.seek(0)
+        f.write(_HEADER.pack(STORE_MAGIC, STORE_VERSION, count, index_position, cells_position))
+    return count
+
+
+def _read_array(view: memoryview, typecode: str):
+    """A little-endian array in the mapping, as a zero-copy view where possible"""
+    if sys.byteorder == "little":
+        return view.cast(typecode)
+    values = array(typecode, view.tobytes())
+    values.byteswap()
+    return values
+
+
+class QuestionStore:
+    """Read-only, random-access sequence of QuizQuestion backed by a .qstore file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        self._offsets = None
+        self._cell_codes = None
+
+        if len(self._map) < _HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is not a version {STORE_VERSION} question store")
+        magic, version, self._count, index_position, cells_position = _HEADER.unpack_from(self._map, 0)
+        if magic != STORE_MAGIC or version != STORE_VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {STORE_VERSION} question store")
+
+        index = self._view[index_position:index_position + _OFFSET.size * (self._count + 1)]
+        self._offsets = _read_array(index, "Q")
+        table_position = cells_position + 2 * self._count
+        self._cell_codes = _read_array(self._view[cells_position:table_position], "H")
+        self.cells: List[Tuple[str, str]] = [
+            tuple(cell) for cell in json.loads(str(self._view[table_position:index_position], "utf-8"))]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> QuizQuestion:
+        difficulty, option_count, mask, spans = self._record(index)
+        texts = [str(self._view[start:end], "utf-8") for start, end in spans]
+        return QuizQuestion(texts[0], texts[3:], mask_indices(mask), texts[1],
+                            DIFFICULTIES[difficulty], texts[2])
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+    def __enter__(self) -> "QuestionStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Release the mapping and the underlying file"""
+        # Views into the mapping must be released before it can be closed
+        for column in (self._offsets, self._cell_codes):
+            if isinstance(column, memoryview):
+                column.release()
+        self._view.release()
+        self._map.close()
+        self._file.close()
+
+    def _position(self, index: int) -> int:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("question index out of range")
+        return self._offsets[index]
+
+    def _record(self, index: int) -> Tuple[int, int, int, List[Tuple[int, int]]]:
+        """Return difficulty code, option count, answer mask and text byte spans"""
+        position = self._position(index)
+        difficulty, option_count, mask = _RECORD.unpack_from(self._map, position)
+        position += _RECORD.size
+        lengths = struct.unpack_from(f"<{option_count + 3}I", self._map, position)
+        position += 4 * len(lengths)
+
+        spans = []
+        for length in lengths:
+            spans.append((position, position + length))
+            position += length
+        return difficulty, option_count, mask, spans
+
+    def difficulty_at(self, index: int) -> str:
+        """Return a question's difficulty from the cell column"""
+        return self.metadata_at(index)[0]
+
+    def metadata_at(self, index: int) -> Tuple[str, str]:
+        """Return a question's (difficulty, topic) from the cell column, without reading its record"""
+        self._position(index)  # Bounds check
+        return self.cells[self._cell_codes[index]]
+
+    def cell_codes(self) -> Tuple[Sequence[Tuple[str, str]], Sequence[int]]:
+        """The cell table and every question's code into it, for indexing the whole store"""
+        return self.cells, self._cell_codes
+
+    def question_text(self, index: int) -> memoryview:
+        """Return the UTF-8 bytes of a question's prompt without copying"""
+        start, end = self._record(index)[3][0]
+        return self._view[start:end]
+
+    def option_texts(self, index: int) -> List[memoryview]:
+        """Return the UTF-8 bytes of a question's options without copying"""
+        return [self._view[start:end] for start, end in self._record(index)[3][3:]]
+
+
+def main():
+    """Command-line entry point for building stores"""
+    if len(sys.argv) != 4 or sys.argv[1] != "build":
+        print("Usage: python3 question_store.py build <bank.jsonl> <bank.qstore>")
+        sys.exit(1)
+
+    import question_bank
+    count = build_store(question_bank.iter_questions(sys.argv[2]), sys.argv[3])
+    print(f"✅ Wrote {count} questions to {sys.argv[3]}")
+
+
+if __name__ == "__main__":
+    main()
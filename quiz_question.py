@@ -0,0 +1,155 @@
+"""
+Question model shared by the quiz application and the question bank tools
+"""
+
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+DIFFICULTIES = ("easy", "medium", "hard")
+
+# Topic ids used in bank files, mapped to the names shown to test-takers
+TOPICS = {
+    "agile": "Agile/Scrum Methodology",
+    "frontend": "Front-end Development (HTML, CSS, JavaScript)",
+    "backend": "Back-end Development (Go, web frameworks)",
+    "fullstack": "Full-stack Development (HTTP, routing, client-server)",
+    "networking": "Networking and Communication (TCP/IP, DNS)",
+    "git": "Version Control (Git)",
+    "uiux": "UI/UX Design (Design sprints, mobile design)",
+}
+DEFAULT_TOPIC = "general"
+
+
+def answer_mask(indices: Iterable[int]) -> int:
+    """Pack 0-based answer indices into an integer bitmask"""
+    mask = 0
+    for index in indices:
+        mask |= 1 << index
+    return mask
+
+
+def mask_indices(mask: int) -> List[int]:
+    """Unpack an answer bitmask into sorted 0-based indices"""
+    indices = []
+    index = 0
+    while mask:
+        if mask & 1:
+            indices.append(index)
+        mask >>= 1
+        index += 1
+    return indices
+
+
+def unshuffle_mask(mask: int, order: Sequence[int]) -> int:
+    """Map a mask over shuffled options back to the original option order.
+
+    order[j] is the original index of the option shown at position j.
+    """
+    return answer_mask(order[j] for j in mask_indices(mask))
+
+
+class QuizQuestion:
+    # Slots keep large banks from paying for a per-instance __dict__
+    __slots__ = ("question", "options", "answer_mask", "explanation", "difficulty", "topic")
+
+    def __init__(self, question: str, options: Sequence[str], correct_answers: Iterable[int],
+                 explanation: str = "", difficulty: str = "medium", topic: str = DEFAULT_TOPIC):
+        self.question = question
+        self.options = tuple(options)
+        self.answer_mask = answer_mask(correct_answers)  # Bit i set => option i is correct
+        self.explanation = explanation
+        self.difficulty = sys.intern(difficulty)
+        self.topic = sys.intern(topic)
+
+    @property
+    def correct_answers(self) -> List[int]:
+        """Correct option indices (0-based), in ascending order"""
+        return mask_indices(self.answer_mask)
+
+    @correct_answers.setter
+    def correct_answers(self, indices: Iterable[int]):
+        self.answer_mask = answer_mask(indices)
+
+    def shuffled(self, order: Sequence[int]) -> "QuizQuestion":
+        """Return a copy showing the options in the given order (order[j] is an original index)"""
+        question = QuizQuestion.__new__(QuizQuestion)
+        question.question = self.question
+        question.options = tuple(self.options[i] for i in order)
+        question.answer_mask = answer_mask(j for j, i in enumerate(order) if self.answer_mask >> i & 1)
+        question.explanation = self.explanation
+        question.difficulty = self.difficulty
+        question.topic = self.topic
+        return question
+
+    def to_record(self) -> Dict[str, Any]:
+        """Return the question as a plain dict suitable for JSON serialization"""
+        return {
+            "question": self.question,
+            "options": list(self.options),
+            "correct_answers": self.correct_answers,
+            "explanation": self.explanation,
+            "difficulty": self.difficulty,
+            "topic": self.topic,
+        }
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "QuizQuestion":
+        """Build a question from a dict produced by to_record"""
+        return cls(
+            record["question"],
+            record["options"],
+            record["correct_answers"],
+            record.get("explanation", ""),
+            record.get("difficulty", "medium"),
+            record.get("topic", DEFAULT_TOPIC),
+        )
+
+
+class QuestionColumns:
+    """Struct-of-arrays question bank: one column per field instead of one object per question.
+
+    Answer keys live in a single array of 64-bit masks and difficulties in a
+    bytearray of codes, so a bank costs a few bytes per question beyond its text.
+    Indexing builds a QuizQuestion on demand.
+    """
+
+    def __init__(self, questions: Iterable[QuizQuestion] = ()):
+        self.prompts: List[str] = []
+        self.options: List[tuple] = []
+        self.explanations: List[str] = []
+        self.answer_masks = array("Q")
+        self.difficulty_codes = bytearray()
+        self.topics: List[str] = []
+        for question in questions:
+            self.append(question)
+
+    def append(self, question: QuizQuestion):
+        """Add one question to the end of every column"""
+        self.prompts.append(question.question)
+        self.options.append(tuple(question.options))
+        self.explanations.append(question.explanation)
+        self.answer_masks.append(question.answer_mask)
+        self.difficulty_codes.append(DIFFICULTIES.index(question.difficulty))
+        self.topics.append(question.topic)
+
+    def __len__(self) -> int:
+        return len(self.prompts)
+
+    def __getitem__(self, index: int) -> QuizQuestion:
+        question = QuizQuestion.__new__(QuizQuestion)
+        question.question = self.prompts[index]
+        question.options = self.options[index]
+        question.answer_mask = self.answer_masks[index]
+        question.explanation = self.explanations[index]
+        question.difficulty = DIFFICULTIES[self.difficulty_codes[index]]
+        question.topic = self.topics[index]
+        return question
+
+    def difficulty_at(self, index: int) -> str:
+        """Return a question's difficulty without building the question"""
+        return DIFFICULTIES[self.difficulty_codes[index]]
+
+    def metadata_at(self, index: int) -> Tuple[str, str]:
+        """Return a question's (difficulty, topic) without building the question"""
+        return DIFFICULTIES[self.difficulty_codes[index]], self.topics[index]
@@ -0,0 +1,172 @@
+"""
+Screen rendering for the terminal quiz.
+
+Each function composes one whole screen as a single string so callers can
+write it with one write and one flush, rather than a dozen print() calls
+(each its own syscall on a line-buffered terminal). The text matches what
+the quiz has always shown.
+"""
+
+from typing import Any, Dict, Optional, Sequence
+
+from quiz_question import TOPICS, QuizQuestion
+from quiz_session import AnswerRecord, QuizResult
+
+RULE = "=" * 80
+
+
+def _numbers(indices) -> str:
+    """Format 0-based option indices as the 1-based list shown to users"""
+    return ", ".join(str(i + 1) for i in indices)
+
+
+def render_banner() -> str:
+    lines = [
+        RULE,
+        "🎯 COMPREHENSIVE 656.MBA EXAM PREPARATION QUIZ",
+        RULE,
+        "This quiz covers all topics from your desktop quizzes:",
+    ]
+    lines.extend(f"• {topic_name}" for topic_name in TOPICS.values())
+    lines.append(RULE)
+    return "\n".join(lines) + "\n"
+
+
+def render_menu() -> str:
+    return (
+        "MGT 656 - Exam 1 Practice Quiz\n"
+        f"{'=' * 40}\n"
+        "🎯 Welcome to the MGT656 Exam Preparation Quiz!\n"
+        "\n📚 Quiz Options:\n"
+        "1. Take full quiz (50 questions, all difficulties)\n"
+        "2. Take easy quiz (20 questions, easy difficulty)\n"
+        "3. Take medium quiz (30 questions, medium difficulty)\n"
+        "4. Take hard quiz (25 questions, hard difficulty)\n"
+        "5. Custom quiz\n"
+    )
+
+
+def render_no_questions(difficulty: Optional[str], topic: Optional[str]) -> str:
+    if topic:
+        return f"❌ No questions found for difficulty level: {difficulty or 'any'}, topic: {topic}\n"
+    return f"❌ No questions found for difficulty level: {difficulty}\n"
+
+
+def render_nothing_due(next_due: Optional[str]) -> str:
+    if next_due is None:
+        return "🎉 Nothing to review: every question has been reviewed and none is due.\n"
+    return f"🎉 Nothing due for review. Next review: {next_due}\n"
+
+
+def render_config(num_questions: int, difficulty: Optional[str], topic: Optional[str],
+                  blueprint: str = None, target_se: float = None) -> str:
+    total = num_questions
+    if target_se is not None:
+        total = f"up to {num_questions}"
+        filters = (f"   • Adaptive: stops once your ability is known to ±{target_se:g}\n"
+                   f"   • Topic filter: {TOPICS.get(topic, topic) if topic else 'All topics'}\n")
+    elif blueprint:
+        filters = f"   • Blueprint: {blueprint}\n"
+    else:
+        filters = (f"   • Difficulty filter: {difficulty or 'All levels'}\n"
+                   f"   • Topic filter: {TOPICS.get(topic, topic) if topic else 'All topics'}\n")
+    return (
+        f"\n📊 Quiz Configuration:\n"
+        f"   • Total questions: {total}\n"
+        f"{filters}"
+        f"   • Time limit: None (take your time!)\n"
+        f"\n{RULE}\n"
+    )
+
+
+def render_question(question: QuizQuestion, question_num: int, total: int) -> str:
+    parts = [
+        f"\n{RULE}\n",
+        f"Question {question_num} of {total} | Difficulty: {question.difficulty.upper()}\n",
+        f"{RULE}\n",
+        f"\n{question.question}\n",
+    ]
+    if question.answer_mask & (question.answer_mask - 1):
+        parts.append("\n(Select ALL correct answers - separate multiple choices with commas)\n")
+    parts.append("\nOptions:\n")
+    parts.extend(f"  {i}. {option}\n" for i, option in enumerate(question.options, 1))
+    return "".join(parts)
+
+
+def render_form(exam: str, student: str, form_id: str, questions: Sequence[QuizQuestion]) -> str:
+    """Render a printable exam form; the answer key is never part of it"""
+    parts = [f"{RULE}\nMGT 656 EXAM: {exam}\nStudent: {student}    Form: {form_id}\n{RULE}\n"]
+    for question_num, question in enumerate(questions, 1):
+        parts.append(f"\n{question_num}. {question.question}\n")
+        if question.answer_mask & (question.answer_mask - 1):
+            parts.append("   (Select ALL correct answers)\n")
+        parts.extend(f"   {i}. {option}\n" for i, option in enumerate(question.options, 1))
+    return "".join(parts)
+
+
+def render_answer_prompt(question: QuizQuestion) -> str:
+    return f"\nYour answer(s) (1-{len(question.options)}): "
+
+
+def render_feedback(record: AnswerRecord) -> str:
+    question = record.question
+    parts = ["\n✅ CORRECT!\n" if record.correct else "\n❌ INCORRECT!\n"]
+    if question.explanation:
+        parts.append(f"\n💡 Explanation: {question.explanation}\n")
+    parts.append(f"\n📝 Correct answer(s): {_numbers(question.correct_answers)}\n")
+    return "".join(parts)
+
+
+def render_timing(timing: Dict[str, Any]) -> str:
+    """Summarize a session's response times from timing_stats.session_timing"""
+    think = timing["think"]
+    parts = [f"\n⏱️  Time: {think['total']:.1f}s answering, "
+             f"{think['mean']:.1f}s average per question (median {think['median']:.1f}s)\n"]
+    slowest = timing["slowest_question"]
+    if slowest is not None:
+        parts.append(f"   Slowest: question {slowest['question_num']} "
+                     f"({slowest['think_seconds']:.1f}s)\n")
+    return "".join(parts)
+
+
+def render_ability(ability: Dict[str, float]) -> str:
+    """Summarize an adaptive test's ability estimate from AdaptiveTest.summary"""
+    return (f"\n🎯 Ability estimate: {ability['theta']:+.2f} ± {ability['se']:.2f} "
+            f"after {ability['items']} questions (0 is a typical student)\n")
+
+
+def render_results(result: QuizResult, timing: Dict[str, Any] = None,
+                   ability: Dict[str, float] = None) -> str:
+    percentage = result.percentage
+    if percentage >= 80:
+        message = "Great job! Keep up the good work!"
+    elif percentage >= 60:
+        message = "Good effort! Review the incorrect answers to improve."
+    else:
+        message = "Keep studying! Review the material and try again."
+
+    parts = [
+        f"\n{RULE}\n🏁 QUIZ COMPLETE!\n{RULE}\n",
+        f"\n📊 FINAL SCORE: {result.score}/{result.total_questions} ({percentage:.1f}%)\n",
+        f"\n💬 {message}\n",
+    ]
+    if ability is not None:
+        parts.insert(2, render_ability(ability))
+
+    incorrect = result.incorrect_answers
+    if incorrect:
+        parts.append(f"\n📝 INCORRECT ANSWERS TO REVIEW:\n{'=' * 50}\n")
+        for record in incorrect:
+            question = record.question
+            parts.append(f"\nQuestion {record.question_num}: {question.question}\n")
+            parts.append(f"Your answer(s): {_numbers(record.user_answers)}\n")
+            parts.append(f"Correct answer(s): {_numbers(question.correct_answers)}\n")
+            if question.explanation:
+                parts.append(f"Explanation: {question.explanation}\n")
+            parts.append("-" * 50 + "\n")
+
+    if timing is not None and result.answers:
+        parts.append(render_timing(timing))
+
+    parts.append(f"\n🔄 Want to retake the quiz? Run the script again!\n{RULE}\n")
+    return "".join(parts)
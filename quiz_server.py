@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Asyncio HTTP/JSON quiz server for many concurrent test-takers.
+
+One process loads the question bank once and serves any number of quiz
+sessions from it; each session is a QuizSession, so selection and grading are
+exactly those of the terminal quiz. The HTTP handling is a small HTTP/1.1
+implementation on asyncio streams (keep-alive, Content-Length bodies), which
+keeps the server stdlib-only.
+
+Endpoints (all bodies are JSON):
+
+    POST /quizzes                  {"num_questions", "difficulty", "topic", "student",
+                                    "exam", "shuffle_options"}
+                                   -> session id, form id and the first question
+    GET  /quizzes/<id>/question    -> the current question, or finished
+    POST /quizzes/<id>/answer      {"answer": "1, 3"} typed as in the terminal
+                                   -> whether it was correct, with the explanation
+    GET  /quizzes/<id>/results     -> score, every answer and response times
+
+Given both a student and an exam, the form is reproducible (see
+ComprehensiveQuiz.build_form). Think time is measured from when a question is
+served to when its answer arrives. Sessions idle for longer than the session TTL are dropped.
+Finished sessions and logged answers are flushed to disk every few seconds, and
+on SIGTERM, so a quiet or stopped server doesn't sit on unwritten results.
+
+Run the server:  python3 quiz_server.py --port 8656 [--bank questions.qstore]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import signal
+import sys
+import time
+import traceback
+from http import HTTPStatus
+from typing import Any, Dict, Optional, Tuple
+
+from comprehensive_quiz import ComprehensiveQuiz, load_quiz
+from event_log import EventLog
+from quiz_question import DIFFICULTIES, TOPICS, QuizQuestion
+from quiz_session import AnswerError, QuizSession, session_seed
+from results_store import ResultsStore
+from timing_stats import session_timing
+
+MAX_BODY_BYTES = 64 * 1024
+MAX_QUESTIONS = 100
+KEEPALIVE_TIMEOUT = 60.0
+FLUSH_INTERVAL = 5.0  # Seconds between flushes of queued results and log events
+
+Response = Tuple[int, Dict[str, Any]]
+
+
+class HTTPError(Exception):
+    """Raised by request handlers to answer with an error status"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def question_payload(session: QuizSession) -> Dict[str, Any]:
+    """Describe the session's current question without revealing its answer"""
+    question: Optional[QuizQuestion] = session.current_question
+    if question is None:
+        return {"finished": True, "score": session.result.score,
+                "total_questions": session.result.total_questions}
+    return {
+        "finished": False,
+        "question_num": session.position + 1,
+        "total_questions": len(session.questions),
+        "question_id": session.question_ids[session.position],
+        "question": question.question,
+        "options": list(question.options),
+        "multiple": bool(question.answer_mask & (question.answer_mask - 1)),
+        "difficulty": question.difficulty,
+        "topic": question.topic,
+    }
+
+
+class _ServerSession:
+    __slots__ = ("session", "difficulty", "topic", "asked_at", "last_active")
+
+    def __init__(self, session: QuizSession, difficulty: Optional[str], topic: Optional[str]):
+        self.session = session
+        self.difficulty = difficulty
+        self.topic = topic
+        self.asked_at = self.last_active = time.monotonic()
+
+
+class QuizServer:
+    def __init__(self, quiz: ComprehensiveQuiz, session_ttl: float = 3600.0,
+                 event_log: EventLog = None, results_store: ResultsStore = None):
+        self.quiz = quiz
+        self.session_ttl = session_ttl
+        self.event_log = event_log
+        self.results_store = results_store
+        self.sessions: Dict[str, _ServerSession] = {}
+
+    # Request handling
+
+    def handle_request(self, method: str, path: str, body: bytes) -> Response:
+        """Route one request, returning (status, JSON payload)"""
+        parts = [part for part in path.split("?", 1)[0].split("/") if part]
+        try:
+            if parts == ["quizzes"]:
+                if method != "POST":
+                    raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, "use POST to start a quiz")
+                return self.start(_json_body(body))
+            if len(parts) == 3 and parts[0] == "quizzes":
+                entry = self._session(parts[1])
+                action = parts[2]
+                if action == "question" and method == "GET":
+                    entry.asked_at = time.monotonic()
+                    return HTTPStatus.OK, question_payload(entry.session)
+                if action == "answer" and method == "POST":
+                    return self.answer(entry, _json_body(body))
+                if action == "results" and method == "GET":
+                    result = entry.session.result
+                    payload = result.to_dict()
+                    payload["session_id"] = entry.session.session_id
+                    payload["finished"] = entry.session.finished
+                    payload["timing"] = session_timing(result)
+                    return HTTPStatus.OK, payload
+                if action in ("question", "answer", "results"):
+                    raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"wrong method for {action}")
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"no such endpoint: {path}")
+        except HTTPError as e:
+            return e.status, {"error": e.message}
+        except Exception:
+            # A bug must not drop the connection without an answer
+            traceback.print_exc(file=sys.stderr)
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "internal server error"}
+
+    def start(self, params: Dict[str, Any]) -> Response:
+        num_questions = params.get("num_questions", 50)
+        difficulty = params.get("difficulty") or None
+        topic = params.get("topic") or None
+        student = params.get("student")
+        exam = params.get("exam")
+        shuffle_options = params.get("shuffle_options", False)
+        if (not isinstance(num_questions, int) or isinstance(num_questions, bool)
+                or not 1 <= num_questions <= MAX_QUESTIONS):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"num_questions must be 1-{MAX_QUESTIONS}")
+        for name, value in (("difficulty", difficulty), ("topic", topic), ("student", student),
+                            ("exam", exam)):
+            if value is not None and not isinstance(value, str):
+                raise HTTPError(HTTPStatus.BAD_REQUEST, f"{name} must be a string")
+        if not isinstance(shuffle_options, bool):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "shuffle_options must be true or false")
+        if difficulty is not None and difficulty not in DIFFICULTIES:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"difficulty must be one of {', '.join(DIFFICULTIES)}")
+        if topic is not None and topic not in TOPICS:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"topic must be one of {', '.join(TOPICS)}")
+
+        seed = session_seed(exam, student) if exam and student else random.getrandbits(64)
+        question_ids, questions, option_orders = self.quiz.build_form(
+            seed, num_questions, difficulty, topic, shuffle_options)
+        if not questions:
+            raise HTTPError(HTTPStatus.NOT_FOUND, "no questions match those filters")
+        session = QuizSession(questions, question_ids, student=student, seed=seed,
+                              option_orders=option_orders)
+        if self.event_log is not None:
+            session.listeners.append(self.event_log.record_answer)
+        self.sessions[session.session_id] = _ServerSession(session, difficulty, topic)
+
+        payload = question_payload(session)
+        payload["session_id"] = session.session_id
+        payload["form"] = f"{seed:016x}"
+        return HTTPStatus.CREATED, payload
+
+    def answer(self, entry: _ServerSession, params: Dict[str, Any]) -> Response:
+        session = entry.session
+        if session.finished:
+            raise HTTPError(HTTPStatus.CONFLICT, "quiz is already finished")
+        text = params.get("answer")
+        if not isinstance(text, str):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, 'expected {"answer": "1, 3"}')
+        try:
+            record = session.submit_text(text, think_seconds=time.monotonic() - entry.asked_at)
+        except AnswerError as e:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, str(e)) from None
+        entry.asked_at = time.monotonic()
+
+        if session.finished and self.results_store is not None:
+            self.results_store.record_session(session.result, session.student, entry.difficulty,
+                                              entry.topic, session.session_id)
+        payload = record.to_dict()
+        payload["explanation"] = record.question.explanation
+        payload["score"] = session.result.score
+        payload["finished"] = session.finished
+        return HTTPStatus.OK, payload
+
+    def _session(self, session_id: str) -> _ServerSession:
+        entry = self.sessions.get(session_id)
+        if entry is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, "no such quiz session (it may have expired)")
+        entry.last_active = time.monotonic()
+        return entry
+
+    def expire_sessions(self) -> int:
+        """Drop sessions idle for longer than the TTL, returning how many were dropped"""
+        cutoff = time.monotonic() - self.session_ttl
+        expired = [session_id for session_id, entry in self.sessions.items()
+                   if entry.last_active < cutoff]
+        for session_id in expired:
+            del self.sessions[session_id]
+        return len(expired)
+
+    def flush(self):
+        """Write queued finished sessions and answer events to disk"""
+        if self.results_store is not None:
+            self.results_store.flush()
+        if self.event_log is not None:
+            self.event_log.flush()
+
+    # Connection handling
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve requests on one keep-alive connection until the client closes it"""
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(_read_request(reader), KEEPALIVE_TIMEOUT)
+                except HTTPError as e:
+                    await _write_response(writer, e.status, {"error": e.message}, keep_alive=False)
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                status, payload = self.handle_request(method, path, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await _write_response(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _expire_periodically(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            self.expire_sessions()
+
+    async def _flush_periodically(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            self.flush()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8656):
+        server = await asyncio.start_server(self.handle_connection, host, port, backlog=1024)
+        tasks = [asyncio.create_task(self._expire_periodically(min(60.0, self.session_ttl))),
+                 asyncio.create_task(self._flush_periodically(FLUSH_INTERVAL))]
+        serving = asyncio.ensure_future(server.serve_forever())
+        try:
+            # Stop cleanly on SIGTERM so the caller's cleanup still flushes and closes
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, serving.cancel)
+        except (NotImplementedError, AttributeError):
+            pass  # No signal handlers on this platform's event loop
+        print(f"✅ Serving {len(self.quiz.questions)} questions on http://{host}:{port}")
+        try:
+            async with server:
+                await serving
+        except asyncio.CancelledError:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            self.flush()
+
+
+def _json_body(body: bytes) -> Dict[str, Any]:
+    if not body:
+        return {}
+    try:
+        params = json.loads(body)
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "request body is not valid JSON") from None
+    if not isinstance(params, dict):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "request body must be a JSON object")
+    return params
+
+
+async def _read_request(reader: asyncio.StreamReader
+                        ) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+    """Read one request, returning None when the client has closed the connection"""
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    try:
+        method, path, _version = request_line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "malformed request line") from None
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length") or 0)
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "invalid Content-Length") from None
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "request body is too large")
+    body = await reader.readexactly(length) if length else b""
+    return method, path, headers, body
+
+
+async def _write_response(writer: asyncio.StreamWriter, status: int, payload: Dict[str, Any],
+                          keep_alive: bool = True):
+    body = json.dumps(payload).encode()
+    status = HTTPStatus(status)
+    head = (f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    writer.write(head.encode() + body)
+    await writer.drain()
+
+
+def main():
+    """Command-line entry point for the quiz server"""
+    parser = argparse.ArgumentParser(description="Serve the MGT 656 quiz over HTTP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8656)
+    parser.add_argument("--bank", metavar="PATH",
+                        help="serve questions from a .jsonl or .qstore bank instead of the built-in set")
+    parser.add_argument("--session-ttl", type=float, default=3600.0, metavar="SECONDS",
+                        help="drop quiz sessions idle for this long")
+    parser.add_argument("--results-db", metavar="PATH",
+                        help="record every finished session in a SQLite results database")
+    parser.add_argument("--event-log", metavar="PATH",
+                        help="append every answer to a JSONL event log")
+    args = parser.parse_args()
+
+    event_log = EventLog(args.event_log) if args.event_log else None
+    results_store = ResultsStore(args.results_db) if args.results_db else None
+    server = QuizServer(load_quiz(args.bank), args.session_ttl, event_log, results_store)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+    finally:
+        if event_log is not None:
+            event_log.close()
+        if results_store is not None:
+            results_store.close()
+
+
+if __name__ == "__main__":
+    main()
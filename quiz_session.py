@@ -0,0 +1,159 @@
+"""
+Quiz session state, independent of how questions are shown or answered.
+
+A QuizSession walks through a selected list of questions, grading each
+submitted response. The interactive terminal quiz, the headless runner and
+any other front end drive the same session, so selection and grading
+behave identically everywhere.
+"""
+
+import hashlib
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from grading import grade, response_mask
+from quiz_question import QuizQuestion, mask_indices, unshuffle_mask
+
+
+class AnswerError(ValueError):
+    """Raised when a typed answer cannot be parsed; the message is shown to the user"""
+
+
+def parse_answer(text: str, option_count: int) -> List[int]:
+    """Parse typed answers like "2" or "1, 3" into sorted 0-based option indices"""
+    text = text.strip()
+    if not text:
+        raise AnswerError("Please enter an answer.")
+    try:
+        answers = [int(part.strip()) - 1 for part in text.split(",")]
+    except ValueError:
+        raise AnswerError("Please enter valid numbers.") from None
+    if any(answer < 0 or answer >= option_count for answer in answers):
+        raise AnswerError(f"Please enter numbers between 1 and {option_count}")
+    return sorted(answers)
+
+
+@dataclass
+class AnswerRecord:
+    question_num: int  # 1-based position in the quiz
+    question_id: Optional[int]  # position in the bank, if known
+    question: QuizQuestion
+    response_mask: int
+    correct: bool
+    # perf_counter durations; render and think time are filled in by the front end
+    render_seconds: float = 0.0
+    think_seconds: float = 0.0
+    grade_seconds: float = 0.0
+    # Original index of each option as shown, if the options were shuffled
+    option_order: Optional[Tuple[int, ...]] = None
+
+    @property
+    def user_answers(self) -> List[int]:
+        return mask_indices(self.response_mask)
+
+    @property
+    def bank_mask(self) -> int:
+        """The response as a mask over the options in bank order"""
+        if self.option_order is None:
+            return self.response_mask
+        return unshuffle_mask(self.response_mask, self.option_order)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "question_num": self.question_num,
+            "question_id": self.question_id,
+            "user_answers": self.user_answers,
+            "correct_answers": self.question.correct_answers,
+            "correct": self.correct,
+            "render_seconds": self.render_seconds,
+            "think_seconds": self.think_seconds,
+            "grade_seconds": self.grade_seconds,
+        }
+
+
+@dataclass
+class QuizResult:
+    total_questions: int
+    score: int = 0
+    answers: List[AnswerRecord] = field(default_factory=list)
+
+    @property
+    def percentage(self) -> float:
+        return (self.score / self.total_questions) * 100 if self.total_questions else 0.0
+
+    @property
+    def incorrect_answers(self) -> List[AnswerRecord]:
+        return [answer for answer in self.answers if not answer.correct]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_questions": self.total_questions,
+            "answered": len(self.answers),
+            "score": self.score,
+            "percentage": self.percentage,
+            "answers": [answer.to_dict() for answer in self.answers],
+        }
+
+
+def session_seed(exam: str, student: str) -> int:
+    """Deterministic 64-bit seed for a student's form of an exam"""
+    digest = hashlib.sha256(f"{exam}\0{student}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+class QuizSession:
+    def __init__(self, questions: Sequence[QuizQuestion], question_ids: Sequence[Optional[int]] = None,
+                 session_id: str = None, student: str = None, seed: int = None,
+                 option_orders: Sequence[Tuple[int, ...]] = None):
+        """Start a session; seed and option_orders record how its form was generated, if known"""
+        self.questions = list(questions)
+        self.question_ids = list(question_ids) if question_ids is not None else [None] * len(self.questions)
+        self.session_id = session_id or uuid.uuid4().hex
+        self.student = student
+        self.seed = seed
+        self.option_orders = list(option_orders) if option_orders is not None else None
+        self.result = QuizResult(total_questions=len(self.questions))
+        # Called as listener(session, record) after every graded answer
+        self.listeners: List[Callable[["QuizSession", AnswerRecord], None]] = []
+
+    @property
+    def position(self) -> int:
+        """0-based index of the next question to answer"""
+        return len(self.result.answers)
+
+    @property
+    def finished(self) -> bool:
+        return self.position >= len(self.questions)
+
+    @property
+    def current_question(self) -> Optional[QuizQuestion]:
+        return None if self.finished else self.questions[self.position]
+
+    def submit(self, response, render_seconds: float = 0.0, think_seconds: float = 0.0) -> AnswerRecord:
+        """Grade a response (bitmask or 0-based indices) to the current question"""
+        if self.finished:
+            raise IndexError("quiz is already finished")
+        started = time.perf_counter()
+        question = self.questions[self.position]
+        mask = response_mask(response)
+        correct = grade(question, mask)
+        order = self.option_orders[self.position] if self.option_orders is not None else None
+        record = AnswerRecord(self.position + 1, self.question_ids[self.position], question, mask,
+                              correct, render_seconds, think_seconds, time.perf_counter() - started,
+                              order)
+        if record.correct:
+            self.result.score += 1
+        self.result.answers.append(record)
+        for listener in self.listeners:
+            listener(self, record)
+        return record
+
+    def submit_text(self, text: str, render_seconds: float = 0.0,
+                    think_seconds: float = 0.0) -> AnswerRecord:
+        """Parse and grade a typed answer; raises AnswerError if it is malformed"""
+        if self.finished:
+            raise IndexError("quiz is already finished")
+        return self.submit(parse_answer(text, len(self.current_question.options)),
+                           render_seconds, think_seconds)
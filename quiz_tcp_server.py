@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Multi-user terminal quiz over TCP.
+
+Students on a shared lab machine can connect with `nc` or `telnet` instead of
+each starting their own interpreter with its own copy of the bank. One asyncio
+process loads the bank once and serves the same menu, questions and feedback
+screens as comprehensive_quiz.py to every connection. Each connection has its
+own QuizSession; only the bank and its indexes are shared.
+
+Each student is asked for an id when they connect, which is recorded with
+their results. With --exam, a student's form is fixed by (exam, student)
+exactly as in the HTTP server (see ComprehensiveQuiz.build_form).
+
+Screens are written whole and then drained, so a slow client holds only
+its own coroutine. If a client stops reading for longer than the idle
+timeout, or stops typing, it is disconnected instead of buffering output
+without bound. Finished sessions and logged answers are flushed to disk every
+few seconds, and on SIGTERM.
+
+Run the server:  python3 quiz_tcp_server.py --port 8657 [--bank questions.qstore]
+Connect:         nc localhost 8657
+"""
+
+import argparse
+import asyncio
+import random
+import signal
+import time
+from typing import Optional
+
+from comprehensive_quiz import QUIZ_PRESETS, ComprehensiveQuiz, load_quiz
+from event_log import EventLog
+from quiz_question import TOPICS, QuizQuestion
+from quiz_render import (render_answer_prompt, render_banner, render_config, render_feedback,
+                         render_menu, render_no_questions, render_question, render_results)
+from quiz_session import AnswerError, QuizSession, parse_answer, session_seed
+from results_store import ResultsStore
+from timing_stats import session_timing
+
+MAX_LINE_BYTES = 1024
+# Output a client may leave unread before writes wait for it to catch up
+WRITE_BUFFER_HIGH_WATER = 64 * 1024
+FLUSH_INTERVAL = 5.0  # Seconds between flushes of queued results and log events
+
+
+class ClientDisconnected(Exception):
+    """Raised when a client closes its connection, times out or sends garbage"""
+
+
+class TerminalConnection:
+    def __init__(self, server: "QuizTCPServer", reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter):
+        self.server = server
+        self.quiz = server.quiz
+        self.reader = reader
+        self.writer = writer
+        self.session: Optional[QuizSession] = None
+        self.student: Optional[str] = None
+        self.difficulty: Optional[str] = None
+        self.topic: Optional[str] = None
+        writer.transport.set_write_buffer_limits(high=WRITE_BUFFER_HIGH_WATER)
+
+    async def write(self, text: str):
+        """Write one screen, waiting while the client is behind on reading it"""
+        self.writer.write(text.encode("utf-8"))
+        try:
+            await asyncio.wait_for(self.writer.drain(), self.server.idle_timeout)
+        except (asyncio.TimeoutError, ConnectionError):
+            raise ClientDisconnected() from None
+
+    async def readline(self) -> str:
+        try:
+            line = await asyncio.wait_for(self.reader.readline(), self.server.idle_timeout)
+        except (asyncio.TimeoutError, ValueError, ConnectionError):
+            raise ClientDisconnected() from None  # ValueError: line over the stream limit
+        if not line:
+            raise ClientDisconnected()
+        return line.decode("utf-8", "replace").rstrip("\r\n")
+
+    async def ask(self, prompt: str) -> str:
+        await self.write(prompt)
+        return await self.readline()
+
+    async def run(self):
+        """Ask who is taking the quiz, then serve the menu and one quiz, mirroring the terminal quiz"""
+        self.student = (await self.ask("Student ID (or press Enter to skip): ")).strip() or None
+        await self.write(render_menu())
+        while True:
+            choice = (await self.ask("\nEnter your choice (1-5): ")).strip()
+            if choice in QUIZ_PRESETS:
+                num_questions, difficulty = QUIZ_PRESETS[choice]
+                await self.start_quiz(num_questions, difficulty)
+                return
+            elif choice == "5":
+                await self.custom_quiz()
+                return
+            else:
+                await self.write("Please enter a number between 1 and 5.\n")
+
+    async def custom_quiz(self):
+        try:
+            num_questions = int(await self.ask("Number of questions (1-100): "))
+            if num_questions < 1:
+                raise ValueError(num_questions)
+        except ValueError:
+            await self.write("Invalid number. Using default settings.\n")
+            await self.start_quiz()
+            return
+        difficulty = (await self.ask("Difficulty (easy/medium/hard or press Enter for all): ")).strip()
+        if difficulty and difficulty not in ["easy", "medium", "hard"]:
+            await self.write("Invalid difficulty. Using all difficulties.\n")
+            difficulty = None
+        topic = (await self.ask(f"Topic ({'/'.join(TOPICS)} or press Enter for all): ")).strip()
+        if topic and topic not in TOPICS:
+            await self.write("Invalid topic. Using all topics.\n")
+            topic = None
+        await self.start_quiz(num_questions, difficulty or None, topic or None)
+
+    async def start_quiz(self, num_questions: int = 50, difficulty: str = None, topic: str = None):
+        exam = self.server.exam
+        seed = session_seed(exam, self.student) if exam and self.student else random.getrandbits(64)
+        question_ids, questions, option_orders = self.quiz.build_form(
+            seed, num_questions, difficulty, topic, self.server.shuffle_options)
+        if not questions:
+            await self.write(render_banner() + render_no_questions(difficulty, topic))
+            return
+        await self.ask(render_banner() + render_config(len(questions), difficulty, topic)
+                       + "Press Enter to start the quiz...")
+
+        self.session = QuizSession(questions, question_ids, student=self.student, seed=seed,
+                                   option_orders=option_orders)
+        self.difficulty = difficulty
+        self.topic = topic
+        if self.server.event_log is not None:
+            self.session.listeners.append(self.server.event_log.record_answer)
+        for question_num, question in enumerate(questions, 1):
+            await self.ask_question(question, question_num, len(questions))
+
+        result = self.session.result
+        await self.write(render_results(result, session_timing(result)))
+        if self.server.results_store is not None:
+            self.server.results_store.record_session(result, self.student, difficulty, topic,
+                                                     self.session.session_id)
+
+    async def ask_question(self, question: QuizQuestion, question_num: int, total: int):
+        render_started = time.perf_counter()
+        prompt = render_answer_prompt(question)
+        await self.write(render_question(question, question_num, total) + prompt)
+        render_seconds = time.perf_counter() - render_started
+
+        think_started = time.perf_counter()
+        while True:
+            try:
+                user_answers = parse_answer(await self.readline(), len(question.options))
+                break
+            except AnswerError as e:
+                await self.write(f"{e}\n{prompt}")
+        think_seconds = time.perf_counter() - think_started
+
+        record = self.session.submit(user_answers, render_seconds, think_seconds)
+        await self.ask(render_feedback(record) + "\nPress Enter to continue...")
+
+
+class QuizTCPServer:
+    def __init__(self, quiz: ComprehensiveQuiz, max_clients: int = 500, idle_timeout: float = 1800.0,
+                 event_log: EventLog = None, results_store: ResultsStore = None, exam: str = None,
+                 shuffle_options: bool = False):
+        self.quiz = quiz
+        self.max_clients = max_clients
+        self.idle_timeout = idle_timeout
+        self.event_log = event_log
+        self.results_store = results_store
+        self.exam = exam  # With a student id, fixes each student's form
+        self.shuffle_options = shuffle_options
+        self.clients = 0
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        if self.clients >= self.max_clients:
+            writer.write(b"Server is full, please try again shortly.\n")
+            writer.close()
+            return
+        self.clients += 1
+        try:
+            await TerminalConnection(self, reader, writer).run()
+        except ClientDisconnected:
+            pass
+        finally:
+            self.clients -= 1
+            writer.close()
+
+    def flush(self):
+        """Write queued finished sessions and answer events to disk"""
+        if self.results_store is not None:
+            self.results_store.flush()
+        if self.event_log is not None:
+            self.event_log.flush()
+
+    async def _flush_periodically(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            self.flush()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8657):
+        server = await asyncio.start_server(self.handle_connection, host, port,
+                                            limit=MAX_LINE_BYTES, backlog=1024)
+        flushing = asyncio.create_task(self._flush_periodically(FLUSH_INTERVAL))
+        serving = asyncio.ensure_future(server.serve_forever())
+        try:
+            # Stop cleanly on SIGTERM so queued results are still flushed and closed
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, serving.cancel)
+        except (NotImplementedError, AttributeError):
+            pass  # No signal handlers on this platform's event loop
+        print(f"✅ Serving {len(self.quiz.questions)} questions on {host}:{port} "
+              f"(connect with: nc {host} {port})")
+        try:
+            async with server:
+                await serving
+        except asyncio.CancelledError:
+            pass
+        finally:
+            flushing.cancel()
+            self.flush()
+
+
+def main():
+    """Command-line entry point for the TCP quiz server"""
+    parser = argparse.ArgumentParser(description="Serve the MGT 656 terminal quiz over TCP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8657)
+    parser.add_argument("--bank", metavar="PATH",
+                        help="serve questions from a .jsonl or .qstore bank instead of the built-in set")
+    parser.add_argument("--max-clients", type=int, default=500,
+                        help="refuse connections beyond this many simultaneous students")
+    parser.add_argument("--idle-timeout", type=float, default=1800.0, metavar="SECONDS",
+                        help="disconnect clients that neither type nor read for this long")
+    parser.add_argument("--results-db", metavar="PATH",
+                        help="record every finished session in a SQLite results database")
+    parser.add_argument("--event-log", metavar="PATH",
+                        help="append every answer to a JSONL event log")
+    parser.add_argument("--exam", metavar="ID",
+                        help="exam identifier; each student id then always gets the same form")
+    parser.add_argument("--shuffle-options", action="store_true",
+                        help="show each question's options in a (seeded) random order")
+    args = parser.parse_args()
+
+    event_log = EventLog(args.event_log) if args.event_log else None
+    results_store = ResultsStore(args.results_db) if args.results_db else None
+    server = QuizTCPServer(load_quiz(args.bank), args.max_clients, args.idle_timeout,
+                           event_log, results_store, args.exam, args.shuffle_options)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+    finally:
+        if event_log is not None:
+            event_log.close()
+        if results_store is not None:
+            results_store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Persistent quiz results in SQLite.
+
+Every finished session and every answer in it is stored in a single database
+file, so results outlive the quiz process. The store is designed for many quiz
+processes writing at once:
+
+- WAL journaling lets readers run alongside the single active writer
+- sessions are queued in memory and committed in batches, one short
+  BEGIN IMMEDIATE transaction per batch, so writers take the lock rarely
+  and briefly
+- session ids are generated client-side, so a batch's answers go in with one
+  executemany over a cached prepared statement
+- a busy timeout makes contending writers wait instead of failing
+"""
+
+import sqlite3
+import time
+import uuid
+from typing import Iterator, List, Optional, Tuple
+
+from quiz_session import QuizResult
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    student TEXT,
+    finished_at REAL NOT NULL,
+    total_questions INTEGER NOT NULL,
+    answered INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    difficulty TEXT,
+    topic TEXT
+);
+CREATE TABLE IF NOT EXISTS answers (
+    session_id TEXT NOT NULL REFERENCES sessions(id),
+    question_num INTEGER NOT NULL,
+    question_id INTEGER,
+    response_mask INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    render_seconds REAL,
+    think_seconds REAL,
+    grade_seconds REAL,
+    PRIMARY KEY (session_id, question_num)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS answers_by_question ON answers(question_id);
+CREATE INDEX IF NOT EXISTS sessions_by_student ON sessions(student);
+"""
+
+INSERT_SESSION = "INSERT INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+INSERT_ANSWER = "INSERT INTO answers VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+
+
+class ResultsStore:
+    def __init__(self, path: str, batch_size: int = 50, busy_timeout: float = 30.0):
+        """Open (creating if needed) the results database at path.
+
+        Sessions are committed once batch_size of them are queued, and always on
+        flush() or close().
+        """
+        self.path = path
+        self.batch_size = batch_size
+        # Autocommit mode: transactions are opened explicitly in flush()
+        self._conn = sqlite3.connect(path, timeout=busy_timeout, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # In WAL mode NORMAL only risks the last commits on power loss, never corruption
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._pending_sessions: List[tuple] = []
+        self._pending_answers: List[tuple] = []
+
+    def __enter__(self) -> "ResultsStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def record_session(self, result: QuizResult, student: str = None, difficulty: str = None,
+                       topic: str = None, session_id: str = None) -> str:
+        """Queue a finished session for writing, returning its session id"""
+        session_id = session_id or uuid.uuid4().hex
+        self._pending_sessions.append((session_id, student, time.time(), result.total_questions,
+                                       len(result.answers), result.score, difficulty, topic))
+        # Masks are stored in bank option order so shuffled forms aggregate correctly
+        self._pending_answers.extend(
+            (session_id, answer.question_num, answer.question_id, answer.bank_mask,
+             int(answer.correct), answer.render_seconds, answer.think_seconds, answer.grade_seconds)
+            for answer in result.answers)
+        if len(self._pending_sessions) >= self.batch_size:
+            self.flush()
+        return session_id
+
+    def flush(self):
+        """Commit every queued session in a single transaction"""
+        if not self._pending_sessions:
+            return
+        # IMMEDIATE takes the write lock up front, so a busy writer waits here
+        # rather than failing when it tries to upgrade a read transaction
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.executemany(INSERT_SESSION, self._pending_sessions)
+            self._conn.executemany(INSERT_ANSWER, self._pending_answers)
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._pending_sessions.clear()
+        self._pending_answers.clear()
+
+    def close(self):
+        """Flush queued sessions and close the database"""
+        try:
+            self.flush()
+        finally:
+            self._conn.close()
+
+    def session_count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    def iter_answers(self, question_id: Optional[int] = None, student: Optional[str] = None
+                     ) -> Iterator[Tuple[str, Optional[str], int, Optional[int], int, bool]]:
+        """Yield (session_id, student, question_num, question_id, response_mask, correct).
+
+        Filtered by student, answers come oldest session first.
+        """
+        query = ("SELECT a.session_id, s.student, a.question_num, a.question_id, a.response_mask, a.correct "
+                 "FROM answers a JOIN sessions s ON s.id = a.session_id")
+        conditions = []
+        params: tuple = ()
+        if question_id is not None:
+            conditions.append("a.question_id = ?")
+            params += (question_id,)
+        if student is not None:
+            conditions.append("s.student = ?")
+            params += (student,)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        if student is not None:
+            query += " ORDER BY s.finished_at, a.session_id, a.question_num"
+        else:
+            query += " ORDER BY a.session_id, a.question_num"
+        for session_id, student, question_num, qid, mask, correct in self._conn.execute(query, params):
+            yield session_id, student, question_num, qid, mask, bool(correct)
+
+    def iter_response_chunks(self, chunk_size: int = 100_000
+                             ) -> Iterator[List[Tuple[str, int, int]]]:
+        """Yield every answered bank question as lists of (person, question_id, correct).
+
+        The person is the student, or the session for anonymous sessions. Rows are
+        fetched chunk_size at a time, so callers can stream arbitrarily many answers.
+        """
+        cursor = self._conn.execute(
+            "SELECT COALESCE(s.student, 's:' || a.session_id), a.question_id, a.correct "
+            "FROM answers a JOIN sessions s ON s.id = a.session_id WHERE a.question_id IS NOT NULL")
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return
+            yield rows
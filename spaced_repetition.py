@@ -0,0 +1,196 @@
+"""
+Spaced-repetition review (SM-2) with a heap-based due queue.
+
+Every question a student has answered in review mode becomes a card with an
+SM-2 repetition count, interval and ease factor. A correct answer pushes the
+card's next review further out, and a miss brings it back tomorrow. Cards
+are persisted per student in a small SQLite database.
+
+When a schedule is opened, the student's cards are loaded once into a
+min-heap keyed by due time. Picking the next due card is then a heap pop,
+O(log n), however long the student's history. Updated cards are pushed
+again rather than re-heapified; stale heap entries are skipped when they
+surface. Card updates are written back in a single transaction on close.
+"""
+
+import heapq
+import random
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from question_index import QuestionIndex
+from quiz_session import AnswerRecord, QuizSession
+
+DAY = 24 * 60 * 60.0
+INITIAL_EASE = 2.5
+MIN_EASE = 1.3
+# Answers slower than this count as hard recalls
+SLOW_ANSWER_SECONDS = 30.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cards (
+    student TEXT NOT NULL,
+    question_id INTEGER NOT NULL,
+    repetitions INTEGER NOT NULL,
+    interval_days REAL NOT NULL,
+    ease REAL NOT NULL,
+    due REAL NOT NULL,
+    lapses INTEGER NOT NULL,
+    PRIMARY KEY (student, question_id)
+) WITHOUT ROWID;
+"""
+
+
+@dataclass
+class Card:
+    question_id: int
+    repetitions: int = 0
+    interval_days: float = 0.0
+    ease: float = INITIAL_EASE
+    due: float = 0.0  # time.time() when the card is next due
+    lapses: int = 0
+
+
+def answer_quality(correct: bool, think_seconds: float) -> int:
+    """Map a graded answer onto SM-2's 0-5 recall quality"""
+    if not correct:
+        return 1
+    return 3 if think_seconds > SLOW_ANSWER_SECONDS else 4
+
+
+def sm2_review(card: Card, quality: int, now: float):
+    """Update a card in place after a review of the given quality (SM-2)"""
+    if quality >= 3:
+        if card.repetitions == 0:
+            card.interval_days = 1.0
+        elif card.repetitions == 1:
+            card.interval_days = 6.0
+        else:
+            card.interval_days = round(card.interval_days * card.ease)
+        card.repetitions += 1
+    else:
+        card.repetitions = 0
+        card.interval_days = 1.0
+        card.lapses += 1
+    card.ease = max(MIN_EASE, card.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    card.due = now + card.interval_days * DAY
+
+
+class ReviewSchedule:
+    def __init__(self, path: str, student: str):
+        """Open (creating if needed) the review schedule at path and load one student's cards"""
+        self.path = path
+        self.student = student
+        self._conn = sqlite3.connect(path, timeout=30.0, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self.cards: Dict[int, Card] = {}
+        for row in self._conn.execute(
+                "SELECT question_id, repetitions, interval_days, ease, due, lapses FROM cards "
+                "WHERE student = ?", (student,)):
+            self.cards[row[0]] = Card(*row)
+        self._queue: List[Tuple[float, int]] = [(card.due, question_id)
+                                                for question_id, card in self.cards.items()]
+        heapq.heapify(self._queue)
+        self._dirty: Dict[int, Card] = {}
+
+    def __enter__(self) -> "ReviewSchedule":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _pop_due(self, now: float) -> Optional[int]:
+        """Pop the card due soonest if it is due by now, skipping stale heap entries"""
+        while self._queue:
+            due, question_id = self._queue[0]
+            if self.cards[question_id].due != due:
+                heapq.heappop(self._queue)  # Superseded by a later review
+                continue
+            if due > now:
+                return None
+            heapq.heappop(self._queue)
+            return question_id
+        return None
+
+    def next_due(self) -> Optional[float]:
+        """When the next card falls due, or None if the student has no cards"""
+        while self._queue and self.cards[self._queue[0][1]].due != self._queue[0][0]:
+            heapq.heappop(self._queue)
+        return self._queue[0][0] if self._queue else None
+
+    def due_questions(self, limit: int, now: float = None, allowed=None) -> List[int]:
+        """Up to limit due question ids, most overdue first; allowed optionally filters ids"""
+        now = time.time() if now is None else now
+        picked: List[int] = []
+        skipped: List[int] = []
+        while len(picked) < limit:
+            question_id = self._pop_due(now)
+            if question_id is None:
+                break
+            (picked if allowed is None or question_id in allowed else skipped).append(question_id)
+        # Cards stay queued until they are actually reviewed
+        for question_id in picked + skipped:
+            heapq.heappush(self._queue, (self.cards[question_id].due, question_id))
+        return picked
+
+    def new_questions(self, limit: int, candidates: Sequence[int], rng=None) -> List[int]:
+        """Up to limit never-reviewed question ids, picked at random from candidates"""
+        rng = rng or random
+        if limit <= 0:
+            return []
+        picked: List[int] = []
+        # Oversampling by the number of known cards guarantees enough unseen ones, if they exist
+        for question_id in rng.sample(candidates, min(len(candidates), limit + len(self.cards))):
+            if question_id not in self.cards:
+                picked.append(question_id)
+                if len(picked) == limit:
+                    break
+        return picked
+
+    def pick(self, limit: int, new_limit: int, index: QuestionIndex, difficulty: str = None,
+             topic: str = None, rng=None) -> List[int]:
+        """Due cards first, then new questions, up to limit in total"""
+        candidates = index.select(difficulty, topic)
+        allowed = None if difficulty is None and topic is None else set(candidates)
+        due = self.due_questions(limit, allowed=allowed)
+        return due + self.new_questions(min(new_limit, limit - len(due)), candidates, rng)
+
+    def review(self, question_id: int, quality: int, now: float = None):
+        """Record one review of a question, creating its card on first sight"""
+        now = time.time() if now is None else now
+        card = self.cards.get(question_id)
+        if card is None:
+            card = self.cards[question_id] = Card(question_id)
+        sm2_review(card, quality, now)
+        self._dirty[question_id] = card
+        heapq.heappush(self._queue, (card.due, question_id))
+
+    def record_answer(self, session: QuizSession, record: AnswerRecord):
+        """QuizSession listener: schedule the question's next review"""
+        if record.question_id is not None:
+            self.review(record.question_id, answer_quality(record.correct, record.think_seconds))
+
+    def flush(self):
+        """Write every updated card in one transaction"""
+        if not self._dirty:
+            return
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO cards VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(self.student, card.question_id, card.repetitions, card.interval_days, card.ease,
+                  card.due, card.lapses) for card in self._dirty.values()])
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._dirty.clear()
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            self._conn.close()
@@ -0,0 +1,16 @@
+"""Shared fixtures; the quiz modules live at the top of the repository."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from comprehensive_quiz import ComprehensiveQuiz  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def bank():
+    """The built-in questions, built once for the whole run"""
+    return ComprehensiveQuiz().questions
@@ -0,0 +1,26 @@
+"""Grading a whole cohort at once agrees with grading answer by answer."""
+
+import random
+
+import pytest
+
+import batch_grading
+from grading import grade
+
+
+def test_grade_batch_matches_grade(bank):
+    rng = random.Random(7)
+    form = rng.sample(list(bank), 20)
+    keys = batch_grading.answer_keys(form)
+    responses = [[key if rng.random() < 0.6 else 1 << rng.randrange(4) for key in keys]
+                 for _ in range(50)]
+    expected = [[grade(question, mask) for question, mask in zip(form, row)] for row in responses]
+
+    result = batch_grading.grade_batch(responses, keys, use_numpy=False)
+    assert result.correct == expected
+    assert result.student_totals == [sum(row) for row in expected]
+    assert result.question_totals == [sum(column) for column in zip(*expected)]
+    if batch_grading.np is not None:
+        vectorized = batch_grading.grade_batch(responses, keys, use_numpy=True)
+        assert vectorized.correct.tolist() == expected
+        assert vectorized.scores.tolist() == pytest.approx(result.scores)
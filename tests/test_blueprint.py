@@ -0,0 +1,63 @@
+"""Blueprint-driven sampling draws the requested count from every stratum."""
+
+import io
+import random
+from collections import Counter
+
+import pytest
+
+from blueprint import (BlueprintError, balanced_blueprint, parse_blueprint, resolve_blueprint,
+                       sample_blueprint)
+from comprehensive_quiz import ComprehensiveQuiz
+from question_index import QuestionIndex
+
+
+@pytest.fixture(scope="module")
+def index(bank):
+    return QuestionIndex.build(bank)
+
+
+def test_each_stratum_gets_its_count(bank, index):
+    blueprint = parse_blueprint("easy/agile=2, hard/*=4, medium/git=3")
+    picked = sample_blueprint(index, blueprint, random.Random(1))
+    assert len(picked) == len(set(picked)) == 9
+    questions = [bank[i] for i in picked]
+    assert sum(q.difficulty == "easy" and q.topic == "agile" for q in questions) == 2
+    assert sum(q.difficulty == "hard" for q in questions) == 4
+    assert sum(q.difficulty == "medium" and q.topic == "git" for q in questions) == 3
+
+
+def test_overlapping_strata_never_repeat_a_question(index):
+    blueprint = parse_blueprint("hard/*=5, */git=5")
+    for seed in range(20):
+        picked = sample_blueprint(index, blueprint, random.Random(seed))
+        assert len(picked) == len(set(picked)) == 10
+
+
+def test_sampling_is_reproducible_from_the_seed(index):
+    blueprint = parse_blueprint("easy/*=5, hard/*=5")
+    assert (sample_blueprint(index, blueprint, random.Random(42))
+            == sample_blueprint(index, blueprint, random.Random(42)))
+
+
+def test_too_small_strata_are_rejected(index):
+    with pytest.raises(BlueprintError, match="not enough questions"):
+        resolve_blueprint("hard/git=1000", index, 50)
+    with pytest.raises(BlueprintError):
+        parse_blueprint("impossible/git=1")
+
+
+def test_balanced_blueprint_spreads_evenly(index):
+    blueprint = balanced_blueprint(index, 30)
+    assert sum(stratum.count for stratum in blueprint) == 30
+    # Cells smaller than their share are used up; the rest differ by at most one
+    uncapped = [stratum.count for stratum in blueprint
+                if stratum.count < len(index.by_cell[(stratum.difficulty, stratum.topic)])]
+    assert max(uncapped) - min(uncapped) <= 1
+
+
+def test_headless_quiz_follows_the_blueprint():
+    quiz = ComprehensiveQuiz(output=io.StringIO())
+    blueprint = parse_blueprint("easy/*=3, hard/*=2")
+    result = quiz.run_headless(["1"] * 5, blueprint=blueprint)
+    assert Counter(answer.question.difficulty for answer in result.answers) == {"easy": 3, "hard": 2}
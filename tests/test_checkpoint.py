@@ -0,0 +1,58 @@
+"""Checkpointed headless sessions resume where they stopped."""
+
+import question_bank
+from checkpoint import load_checkpoint
+from comprehensive_quiz import ComprehensiveQuiz
+
+
+def _answer(checkpoint_path, answers, resume, bank_path=None):
+    """Answer through the headless runner, resuming from the checkpoint if asked"""
+    quiz = ComprehensiveQuiz(bank_path=bank_path, checkpoint_path=checkpoint_path, student="s1",
+                             exam="e1")
+    try:
+        session = quiz.load_session(checkpoint_path) if resume else None
+        return quiz.run_headless(answers, num_questions=5, session=session)
+    finally:
+        if quiz.checkpoint is not None:
+            quiz.checkpoint.close()
+
+
+def test_resume_continues_at_first_unanswered_question(tmp_path):
+    path = str(tmp_path / "quiz.ckpt")
+    first = _answer(path, ["1", "2"], resume=False)
+    assert len(first.answers) == 2
+
+    resumed = _answer(path, ["1"], resume=True)
+    assert len(resumed.answers) == 3
+    assert [a.response_mask for a in resumed.answers[:2]] == [a.response_mask for a in first.answers]
+    assert resumed.score == sum(a.correct for a in resumed.answers)
+
+
+def test_resume_repairs_torn_final_line(tmp_path):
+    path = str(tmp_path / "quiz.ckpt")
+    _answer(path, ["1", "1"], resume=False)
+    with open(path, "ab") as f:
+        f.write(b"[1, 0, 0.00")  # A crash partway through the third answer
+
+    assert len(_answer(path, ["1"], resume=True).answers) == 3
+    # The answer given after resuming must itself survive the next resume
+    _, answers = load_checkpoint(path)
+    assert len(answers) == 3
+    assert len(_answer(path, ["1"], resume=True).answers) == 4
+
+
+def test_finished_session_removes_checkpoint(tmp_path):
+    path = tmp_path / "quiz.ckpt"
+    result = _answer(str(path), ["1"] * 5, resume=False)
+    assert len(result.answers) == 5
+    assert not path.exists()
+
+
+def test_resume_accepts_the_same_bank_by_another_path(tmp_path, monkeypatch, bank):
+    question_bank.write_bank(bank, str(tmp_path / "bank.jsonl"))
+    path = str(tmp_path / "quiz.ckpt")
+    monkeypatch.chdir(tmp_path)
+    _answer(path, ["1"], resume=False, bank_path="bank.jsonl")
+
+    resumed = _answer(path, ["1"], resume=True, bank_path=str(tmp_path / "bank.jsonl"))
+    assert len(resumed.answers) == 2
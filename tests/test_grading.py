@@ -0,0 +1,24 @@
+"""Bitmask grading of single answers."""
+
+import pytest
+
+from grading import grade, response_mask
+from quiz_question import QuizQuestion
+
+
+@pytest.fixture
+def multi_select():
+    return QuizQuestion("Pick the primes (Select all that apply)", ["2", "4", "5", "9"], [0, 2])
+
+
+def test_grade_accepts_indices_or_mask(multi_select):
+    assert grade(multi_select, [0, 2])
+    assert grade(multi_select, [2, 0])
+    assert grade(multi_select, 0b0101)
+    assert response_mask([0, 2]) == 0b0101
+
+
+def test_grade_needs_exactly_the_correct_options(multi_select):
+    assert not grade(multi_select, [0])
+    assert not grade(multi_select, [0, 1, 2])
+    assert not grade(multi_select, [])
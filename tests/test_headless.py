@@ -0,0 +1,103 @@
+"""The headless runner: grading, malformed input and seeded, reproducible forms."""
+
+import io
+import json
+import os
+import subprocess
+import sys
+
+from comprehensive_quiz import ComprehensiveQuiz
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _key(question) -> str:
+    return ",".join(str(i + 1) for i in question.correct_answers)
+
+
+def _answer_correctly(quiz):
+    """Typed answers that are always right, looked up as each question comes up"""
+    while True:
+        yield _key(quiz.session.current_question)
+
+
+def test_all_correct_answers_score_full_marks():
+    quiz = ComprehensiveQuiz(output=io.StringIO())
+    result = quiz.run_headless(_answer_correctly(quiz), num_questions=10)
+    assert len(result.answers) == 10
+    assert result.score == 10
+    assert result.percentage == 100.0
+
+
+def test_malformed_answers_are_skipped_and_short_input_stops_early():
+    quiz = ComprehensiveQuiz(output=io.StringIO())
+    result = quiz.run_headless(["", "abc", "99", "1", "1"], num_questions=5)
+    assert len(result.answers) == 2
+    assert result.total_questions == 5
+    assert result.score == sum(answer.correct for answer in result.answers)
+
+
+def test_filters_are_honoured():
+    quiz = ComprehensiveQuiz(output=io.StringIO())
+    result = quiz.run_headless(["1"] * 5, num_questions=5, difficulty="hard", topic="git")
+    assert all(answer.question.difficulty == "hard" and answer.question.topic == "git"
+               for answer in result.answers)
+
+
+def _form(student, exam="midterm", shuffle_options=True):
+    quiz = ComprehensiveQuiz(output=io.StringIO(), student=student, exam=exam,
+                             shuffle_options=shuffle_options)
+    result = quiz.run_headless(_answer_correctly(quiz), num_questions=15)
+    return quiz.session, result
+
+
+def test_same_exam_and_student_get_the_same_form():
+    first, first_result = _form("alice")
+    second, second_result = _form("alice")
+    assert first.seed == second.seed
+    assert first.question_ids == second.question_ids
+    assert first.option_orders == second.option_orders
+    assert [a.bank_mask for a in first_result.answers] == [a.bank_mask for a in second_result.answers]
+
+
+def test_different_students_get_different_forms():
+    alice, _ = _form("alice")
+    bob, _ = _form("bob")
+    assert alice.question_ids != bob.question_ids
+
+
+def test_shuffled_options_are_graded_and_recorded_in_bank_order(bank):
+    session, result = _form("carol")
+    assert result.score == len(result.answers) == 15
+    for answer in result.answers:
+        assert answer.bank_mask == bank[answer.question_id].answer_mask
+
+
+def test_command_line_headless_prints_json_results():
+    process = subprocess.run(
+        [sys.executable, "comprehensive_quiz.py", "--headless", "--num-questions", "3",
+         "--exam", "e1", "--student", "dave"],
+        input="1\n1\n1\n", capture_output=True, text=True, cwd=REPO, check=True)
+    payload = json.loads(process.stdout)
+    assert payload["total_questions"] == payload["answered"] == 3
+    assert len(payload["answers"]) == 3
+
+
+def test_command_line_rejects_fewer_than_one_question():
+    for count in ("0", "-1"):
+        process = subprocess.run(
+            [sys.executable, "comprehensive_quiz.py", "--headless", "--num-questions", count],
+            input="", capture_output=True, text=True, cwd=REPO)
+        assert process.returncode == 2
+        assert "--num-questions must be at least 1" in process.stderr
+
+
+def test_command_line_reports_an_unreadable_bank(tmp_path):
+    bad_store = tmp_path / "bad.qstore"
+    bad_store.write_bytes(b"not a store")
+    for bank in (str(tmp_path / "missing.jsonl"), str(bad_store)):
+        process = subprocess.run(
+            [sys.executable, "comprehensive_quiz.py", "--headless", "--bank", bank],
+            input="", capture_output=True, text=True, cwd=REPO)
+        assert process.returncode == 1
+        assert f"Cannot load bank {bank}" in process.stdout
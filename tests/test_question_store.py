@@ -0,0 +1,24 @@
+"""A .qstore file reads back the bank it was built from."""
+
+from question_index import QuestionIndex
+from question_store import QuestionStore, build_store
+
+
+def test_store_round_trips_the_bank(tmp_path, bank):
+    path = str(tmp_path / "bank.qstore")
+    assert build_store(bank, path) == len(bank)
+
+    store = QuestionStore(path)
+    try:
+        assert len(store) == len(bank)
+        for i in range(len(bank)):
+            assert store[i].to_record() == bank[i].to_record()
+
+        # The store is indexed from its cell column rather than its records
+        from_store, from_bank = QuestionIndex.build(store), QuestionIndex.build(bank)
+        assert from_store.size == from_bank.size
+        assert from_store.by_cell == from_bank.by_cell
+        assert from_store.by_difficulty == from_bank.by_difficulty
+        assert from_store.by_topic == from_bank.by_topic
+    finally:
+        store.close()
@@ -0,0 +1,48 @@
+"""Request handling of the HTTP quiz server, without opening a socket."""
+
+import json
+
+import pytest
+
+from comprehensive_quiz import load_quiz
+from quiz_server import QuizServer
+
+
+@pytest.fixture(scope="module")
+def server():
+    return QuizServer(load_quiz())
+
+
+def _request(server, method, path, params=None):
+    body = json.dumps(params).encode() if params is not None else b""
+    return server.handle_request(method, path, body)
+
+
+def test_full_session(server):
+    status, payload = _request(server, "POST", "/quizzes", {"num_questions": 2, "student": "erin",
+                                                            "exam": "e1"})
+    assert status == 201
+    session_id = payload["session_id"]
+    for _ in range(2):
+        status, payload = _request(server, "POST", f"/quizzes/{session_id}/answer", {"answer": "1"})
+        assert status == 200
+    assert payload["finished"]
+    status, payload = _request(server, "GET", f"/quizzes/{session_id}/results")
+    assert status == 200 and payload["answered"] == 2
+
+
+@pytest.mark.parametrize("params", [{"topic": ["git"]}, {"difficulty": 3}, {"num_questions": True},
+                                    {"student": {"id": 1}}, {"shuffle_options": "yes"}])
+def test_wrongly_typed_fields_are_rejected(server, params):
+    status, payload = _request(server, "POST", "/quizzes", params)
+    assert status == 400
+    assert "error" in payload
+
+
+def test_unexpected_errors_become_500(server, monkeypatch):
+    def broken(*args):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(server.quiz, "build_form", broken)
+    status, payload = _request(server, "POST", "/quizzes", {"num_questions": 2})
+    assert status == 500
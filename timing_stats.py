@@ -0,0 +1,69 @@
+"""
+Response-time statistics for quiz sessions.
+
+Every AnswerRecord carries three perf_counter durations: render (composing
+and writing the question screen), think (waiting for the answer, including
+re-prompts) and grade (grading the parsed response). This module aggregates
+them per session and per question so slow questions and slow render paths
+stand out.
+"""
+
+import json
+import statistics
+from typing import Any, Dict, Iterable, List, Optional
+
+from quiz_session import QuizResult
+
+PHASES = ("render", "think", "grade")
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """Return count, total, mean, median, 90th percentile and max of durations"""
+    if not values:
+        return {"count": 0, "total": 0.0, "mean": 0.0, "median": 0.0, "p90": 0.0, "max": 0.0}
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "total": sum(ordered),
+        "mean": statistics.fmean(ordered),
+        "median": statistics.median(ordered),
+        "p90": ordered[min(len(ordered) - 1, int(0.9 * len(ordered)))],
+        "max": ordered[-1],
+    }
+
+
+def session_timing(result: QuizResult) -> Dict[str, Any]:
+    """Per-phase statistics for one session, plus its slowest question"""
+    stats = {phase: summarize([getattr(answer, f"{phase}_seconds") for answer in result.answers])
+             for phase in PHASES}
+    slowest = max(result.answers, key=lambda answer: answer.think_seconds, default=None)
+    stats["slowest_question"] = None if slowest is None else {
+        "question_num": slowest.question_num,
+        "question_id": slowest.question_id,
+        "think_seconds": slowest.think_seconds,
+    }
+    return stats
+
+
+def question_timing(results: Iterable[QuizResult]) -> Dict[Optional[int], Dict[str, Any]]:
+    """Per-phase statistics for each question id across any number of sessions"""
+    samples: Dict[Optional[int], Dict[str, List[float]]] = {}
+    for result in results:
+        for answer in result.answers:
+            phases = samples.setdefault(answer.question_id, {phase: [] for phase in PHASES})
+            for phase in PHASES:
+                phases[phase].append(getattr(answer, f"{phase}_seconds"))
+    return {question_id: {phase: summarize(values) for phase, values in phases.items()}
+            for question_id, phases in samples.items()}
+
+
+def export_timings(results: List[QuizResult], path: str):
+    """Write per-session and per-question timing statistics to a JSON file"""
+    report = {
+        "sessions": [session_timing(result) for result in results],
+        # JSON object keys must be strings; unknown ids are exported as "null"
+        "questions": {str(question_id) if question_id is not None else "null": stats
+                      for question_id, stats in question_timing(results).items()},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
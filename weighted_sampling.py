@@ -0,0 +1,151 @@
+"""
+Weighted question selection for targeted practice.
+
+Questions a student keeps missing get heavier weights and come up more
+often. Practice weights change after every answer, so the sampler must
+update cheaply as well as draw quickly. A Walker/Vose alias table draws
+in O(1), but any weight change means an O(n) rebuild. On a 100k-item bank
+that rebuild costs more than the whole quiz.
+
+Instead, questions are grouped into buckets by weight, one bucket per
+power-of-two range [2^(e-1), 2^e). A draw:
+
+- picks a bucket in proportion to (bucket size x 2^e), from a few buckets
+- picks a member of that bucket uniformly
+- accepts it with probability weight / 2^e (always at least 1/2),
+  otherwise starts again
+
+This samples exactly in proportion to the weights with O(1) expected work
+per draw. Changing a weight just moves one question between two bucket
+lists, so it is O(1) too, and nothing is ever rebuilt.
+"""
+
+import math
+import random
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from question_index import QuestionIndex
+from quiz_session import AnswerRecord, QuizSession
+
+# Practice weight of a question: starts at 1, multiplied on a miss and divided on a hit
+MISS_FACTOR = 3.0
+HIT_FACTOR = 2.0
+MIN_WEIGHT = 1.0
+MAX_WEIGHT = 81.0
+
+
+def next_weight(weight: float, correct: bool) -> float:
+    """A question's practice weight after one more answer"""
+    if correct:
+        return max(MIN_WEIGHT, weight / HIT_FACTOR)
+    return min(MAX_WEIGHT, weight * MISS_FACTOR)
+
+
+class WeightedSampler:
+    def __init__(self, weights: Iterable[float]):
+        """Sample positions 0..n-1 in proportion to positive weights that change over time"""
+        self.weights = array("d", weights)
+        self._buckets: Dict[int, List[int]] = {}  # exponent e -> positions with weight < 2^e
+        self._slots = array("l", [0]) * len(self.weights)  # each position's index in its bucket
+        for position, weight in enumerate(self.weights):
+            self._add(position, weight)
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+    def _add(self, position: int, weight: float):
+        if not weight > 0:
+            raise ValueError(f"weights must be positive, got {weight}")
+        bucket = self._buckets.setdefault(math.frexp(weight)[1], [])
+        self._slots[position] = len(bucket)
+        bucket.append(position)
+
+    def _remove(self, position: int):
+        exponent = math.frexp(self.weights[position])[1]
+        bucket = self._buckets[exponent]
+        last = bucket.pop()
+        if last != position:
+            # Swap-remove: the last member takes the removed one's slot
+            bucket[self._slots[position]] = last
+            self._slots[last] = self._slots[position]
+        if not bucket:
+            del self._buckets[exponent]
+
+    def update(self, position: int, weight: float):
+        """Change one weight in O(1)"""
+        self._remove(position)
+        self.weights[position] = weight
+        self._add(position, weight)
+
+    def draw(self, rng=random) -> int:
+        masses = [(exponent, bucket, len(bucket) * math.ldexp(1.0, exponent))
+                  for exponent, bucket in self._buckets.items()]
+        total = sum(mass for _, _, mass in masses)
+        while True:
+            target = rng.random() * total
+            for exponent, bucket, mass in masses:
+                target -= mass
+                if target < 0:
+                    break
+            position = bucket[int(rng.random() * len(bucket))]
+            if rng.random() * math.ldexp(1.0, exponent) < self.weights[position]:
+                return position
+
+    def sample(self, k: int, rng=random) -> List[int]:
+        """Draw k distinct positions, each draw weighted among those not yet drawn"""
+        k = min(k, len(self.weights))
+        picked: List[int] = []
+        seen = set()
+        attempts = 0
+        while len(picked) < k and attempts < 50 * k:
+            attempts += 1
+            position = self.draw(rng)
+            if position not in seen:
+                seen.add(position)
+                picked.append(position)
+        if len(picked) < k:
+            # Nearly the whole pool was asked for; finish uniformly rather than spin
+            rest = [position for position in range(len(self.weights)) if position not in seen]
+            picked.extend(rng.sample(rest, k - len(picked)))
+        return picked
+
+
+class PracticeWeights:
+    def __init__(self, index: QuestionIndex, history: Iterable[Tuple[int, bool]] = ()):
+        """Per-question practice weights, replayed from (question_id, correct) history"""
+        self.index = index
+        self.weights = array("d", [MIN_WEIGHT]) * index.size
+        for question_id, correct in history:
+            if question_id is not None and 0 <= question_id < index.size:
+                self.weights[question_id] = next_weight(self.weights[question_id], correct)
+        # One sampler per filter, each over that filter's ids, built on first use
+        self._samplers: Dict[Tuple, Tuple[Sequence[int], Dict[int, int], WeightedSampler]] = {}
+
+    def sample(self, k: int, difficulty: str = None, topic: str = None, rng=None) -> List[int]:
+        """Pick k distinct question ids matching the filters, favoring heavy weights"""
+        key = (difficulty, topic)
+        entry = self._samplers.get(key)
+        if entry is None:
+            ids = self.index.select(difficulty, topic)
+            if not ids:
+                return []
+            positions = {question_id: position for position, question_id in enumerate(ids)}
+            entry = (ids, positions, WeightedSampler(self.weights[i] for i in ids))
+            self._samplers[key] = entry
+        ids, _, sampler = entry
+        return [ids[position] for position in sampler.sample(k, rng or random)]
+
+    def record(self, question_id: Optional[int], correct: bool):
+        """Update a question's weight after it was answered"""
+        if question_id is None:
+            return
+        weight = self.weights[question_id] = next_weight(self.weights[question_id], correct)
+        for _, positions, sampler in self._samplers.values():
+            position = positions.get(question_id)
+            if position is not None:
+                sampler.update(position, weight)
+
+    def record_answer(self, session: QuizSession, record: AnswerRecord):
+        """QuizSession listener: reweight each question as soon as it is graded"""
+        self.record(record.question_id, record.correct)